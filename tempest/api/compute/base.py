@@ -265,8 +265,8 @@ class BaseV2ComputeTest(api_version_utils.BaseMicroversionTest,
         # For each server schedule wait and delete, so we first delete all
         # and then wait for all
         for server in servers:
-            cls.addClassResourceCleanup(waiters.wait_for_server_termination,
-                                        clients.servers_client, server['id'])
+            cls.addClassResourceDeletionWait(clients.servers_client,
+                                             server['id'])
         for server in servers:
             cls.addClassResourceCleanup(
                 test_utils.call_and_ignore_notfound_exc,
@@ -542,8 +542,7 @@ class BaseV2ComputeTest(api_version_utils.BaseMicroversionTest,
             kwargs.setdefault('availability_zone',
                               CONF.compute.compute_volume_common_az)
         volume = cls.volumes_client.create_volume(**kwargs)['volume']
-        cls.addClassResourceCleanup(
-            cls.volumes_client.wait_for_resource_deletion, volume['id'])
+        cls.addClassResourceDeletionWait(cls.volumes_client, volume['id'])
         cls.addClassResourceCleanup(test_utils.call_and_ignore_notfound_exc,
                                     cls.volumes_client.delete_volume,
                                     volume['id'])
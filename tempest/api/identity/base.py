@@ -41,11 +41,10 @@ class BaseIdentityTest(tempest.test.BaseTestCase):
 
     @classmethod
     def get_user_by_name(cls, name, domain_id=None):
+        params = {'name': name}
         if domain_id:
-            params = {'domain_id': domain_id}
-            users = cls.users_client.list_users(**params)['users']
-        else:
-            users = cls.users_client.list_users()['users']
+            params['domain_id'] = domain_id
+        users = cls.users_client.list_users(**params)['users']
         user = [u for u in users if u['name'] == name]
         if user:
             return user[0]
@@ -55,14 +54,15 @@ class BaseIdentityTest(tempest.test.BaseTestCase):
         try:
             tenants = cls.tenants_client.list_tenants()['tenants']
         except AttributeError:
-            tenants = cls.projects_client.list_projects()['projects']
+            tenants = cls.projects_client.list_projects(
+                {'name': name})['projects']
         tenant = [t for t in tenants if t['name'] == name]
         if tenant:
             return tenant[0]
 
     @classmethod
     def get_role_by_name(cls, name):
-        roles = cls.roles_client.list_roles()['roles']
+        roles = cls.roles_client.list_roles(name=name)['roles']
         role = [r for r in roles if r['name'] == name]
         if role:
             return role[0]
@@ -59,8 +59,7 @@ class BaseImageTest(tempest.test.BaseTestCase):
 
         image = cls.client.create_image(**kwargs)
         cls.created_images.append(image['id'])
-        cls.addClassResourceCleanup(cls.client.wait_for_resource_deletion,
-                                    image['id'])
+        cls.addClassResourceDeletionWait(cls.client, image['id'])
         cls.addClassResourceCleanup(test_utils.call_and_ignore_notfound_exc,
                                     cls.client.delete_image, image['id'])
         return image
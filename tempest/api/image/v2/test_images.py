@@ -1042,7 +1042,7 @@ class HashCalculationRemoteDeletionTest(base.BaseV2ImageTest):
         self.addCleanup(server.stop)
 
         # Add a location to the image
-        location = 'http://localhost:%d' % server.port
+        location = server.url
         self.client.add_image_location(image['id'], location)
         waiters.wait_for_image_status(self.client, image['id'], 'active')
 
@@ -19,6 +19,7 @@ from oslo_log import log
 
 from tempest.common import custom_matchers
 from tempest.common import object_storage
+from tempest.common import utils
 from tempest.common import waiters
 from tempest import config
 from tempest.lib.common.utils import data_utils
@@ -118,8 +119,13 @@ class BaseObjectTest(tempest.test.BaseTestCase):
             container_client = cls.container_client
         if object_client is None:
             object_client = cls.object_client
+        bulk_client = None
+        if (container_client is cls.container_client and
+                utils.is_extension_enabled('bulk_delete', 'object')):
+            bulk_client = cls.bulk_client
         object_storage.delete_containers(cls.containers, container_client,
-                                         object_client)
+                                         object_client,
+                                         bulk_client=bulk_client)
 
     def assertHeaders(self, resp, target, method):
         """Check the existence and the format of response headers"""
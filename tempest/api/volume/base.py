@@ -27,6 +27,19 @@ import tempest.test
 CONF = config.CONF
 
 
+def _add_deletion_wait(caller, client, resource_id):
+    """Schedule the wait for the deletion of a resource
+
+    Resources created at class level are waited for together with the
+    other class resources being deleted, see
+    `tempest.test.BaseTestCase.addClassResourceDeletionWait`.
+    """
+    if isinstance(caller, type):
+        caller.addClassResourceDeletionWait(client, resource_id)
+    else:
+        caller.addCleanup(client.wait_for_resource_deletion, resource_id)
+
+
 class BaseVolumeTest(api_version_utils.BaseMicroversionTest,
                      tempest.test.BaseTestCase):
     """Base test case class for all Cinder API tests."""
@@ -137,6 +150,7 @@ class BaseVolumeTest(api_version_utils.BaseMicroversionTest,
                               CONF.compute.compute_volume_common_az)
 
         volume = self.volumes_client.create_volume(**kwargs)['volume']
+        _add_deletion_wait(self, self.volumes_client, volume['id'])
         self.cleanup(test_utils.call_and_ignore_notfound_exc,
                      self._delete_volume_for_cleanup,
                      self.volumes_client, volume['id'])
@@ -152,7 +166,8 @@ class BaseVolumeTest(api_version_utils.BaseMicroversionTest,
         If it is attached to a server, wait for it to become available,
         assuming we have already deleted the server and just need nova to
         complete the delete operation before it is available to be deleted.
-        Otherwise proceed to the regular delete_volume().
+        Otherwise proceed to the delete, the wait for the deletion is
+        scheduled separately.
         """
         try:
             vol = volumes_client.show_volume(volume_id)['volume']
@@ -162,7 +177,7 @@ class BaseVolumeTest(api_version_utils.BaseMicroversionTest,
                                                         'available')
         except lib_exc.NotFound:
             pass
-        BaseVolumeTest.delete_volume(volumes_client, volume_id)
+        volumes_client.delete_volume(volume_id)
 
     @cleanup_order
     def create_snapshot(self, volume_id=1, **kwargs):
@@ -175,8 +190,9 @@ class BaseVolumeTest(api_version_utils.BaseMicroversionTest,
 
         snapshot = self.snapshots_client.create_snapshot(
             volume_id=volume_id, **kwargs)['snapshot']
+        _add_deletion_wait(self, self.snapshots_client, snapshot['id'])
         self.cleanup(test_utils.call_and_ignore_notfound_exc,
-                     self.delete_snapshot, snapshot['id'])
+                     self.snapshots_client.delete_snapshot, snapshot['id'])
         waiters.wait_for_volume_resource_status(self.snapshots_client,
                                                 snapshot['id'], 'available')
         return snapshot
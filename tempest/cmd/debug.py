@@ -0,0 +1,146 @@
+# Copyright 2026 OpenStack Foundation
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Debugging utilities for Tempest
+
+Commands
+========
+
+import-profile
+--------------
+Imports the given modules in a fresh python interpreter started with
+``-X importtime`` and reports the modules with the highest import time.
+Modules already imported by the interpreter at startup are left out.
+
+**Usage:** ``tempest debug import-profile [module ...]``, the default module
+is ``tempest.cmd.main``.
+
+* ``--top``: Number of modules to report, the default is 25
+* ``--sort``: Sort the modules by ``cumulative`` (the default) or ``self``
+  import time
+* ``--max-total``: Exit with an error if the total import time in
+  milliseconds is higher than this value, useful to keep import time
+  regressions out in the gate
+"""
+
+import collections
+import subprocess
+import sys
+
+from cliff import command
+import prettytable
+
+ImportRecord = collections.namedtuple(
+    'ImportRecord', ['name', 'self_us', 'cumulative_us', 'depth'])
+
+
+def parse_importtime(output):
+    """Parse the ``-X importtime`` output of a python interpreter
+
+    :param output: the stderr of the interpreter
+    :return: list of ImportRecord in the order they were reported
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+        try:
+            self_us = int(fields[0])
+            cumulative_us = int(fields[1])
+        except ValueError:
+            # The header line
+            continue
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        records.append(ImportRecord(stripped, self_us, cumulative_us, depth))
+    return records
+
+
+def profile_imports(modules, python=None):
+    """Import modules in a new interpreter and return their import times
+
+    :param modules: names of the modules to import
+    :param python: the python interpreter to use, defaults to the current one
+    :return: list of ImportRecord, without the modules imported by the
+        interpreter at startup
+    :raise subprocess.CalledProcessError: if a module cannot be imported
+    """
+    python = python or sys.executable
+
+    def run(code):
+        proc = subprocess.run([python, '-X', 'importtime', '-c', code],
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              universal_newlines=True)
+        if proc.returncode:
+            raise subprocess.CalledProcessError(
+                proc.returncode, proc.args, proc.stdout, proc.stderr)
+        return parse_importtime(proc.stderr)
+
+    startup = set(record.name for record in run('pass'))
+    code = '\n'.join('import %s' % module for module in modules)
+    return [record for record in run(code) if record.name not in startup]
+
+
+class TempestDebugImportProfile(command.Command):
+    def get_parser(self, prog_name):
+        parser = super(TempestDebugImportProfile, self).get_parser(prog_name)
+        parser.add_argument('modules', nargs='*',
+                            default=['tempest.cmd.main'],
+                            help='Modules to import, the default is '
+                                 'tempest.cmd.main')
+        parser.add_argument('--top', type=int, default=25,
+                            help='Number of modules to report')
+        parser.add_argument('--sort', choices=['cumulative', 'self'],
+                            default='cumulative',
+                            help='Sort the modules by cumulative or self '
+                                 'import time')
+        parser.add_argument('--max-total', type=float, default=None,
+                            help='Exit with an error if the total import '
+                                 'time in milliseconds exceeds this value')
+        return parser
+
+    def get_description(self):
+        return 'Report the import time of tempest modules'
+
+    def take_action(self, parsed_args):
+        try:
+            records = profile_imports(parsed_args.modules)
+        except subprocess.CalledProcessError as e:
+            sys.exit('Failed to import %s:\n%s' % (
+                ' '.join(parsed_args.modules), e.stderr))
+        # The top level imports include the time of all the others
+        total_ms = sum(r.cumulative_us for r in records
+                       if r.depth == 0) / 1000.0
+        key = 'cumulative_us' if parsed_args.sort == 'cumulative' else (
+            'self_us')
+        records.sort(key=lambda r: getattr(r, key), reverse=True)
+
+        output = prettytable.PrettyTable(
+            ['Module', 'Self (ms)', 'Cumulative (ms)'])
+        output.align['Module'] = 'l'
+        for record in records[:parsed_args.top]:
+            output.add_row([record.name, '%.1f' % (record.self_us / 1000.0),
+                            '%.1f' % (record.cumulative_us / 1000.0)])
+        print(output)
+        print('Total import time: %.1f ms for %d modules' % (
+            total_ms, len(records)))
+        if (parsed_args.max_total is not None and
+                total_ms > parsed_args.max_total):
+            sys.exit('Total import time %.1f ms exceeds the maximum of '
+                     '%.1f ms' % (total_ms, parsed_args.max_total))
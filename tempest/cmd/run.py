@@ -41,6 +41,14 @@ http://stestr.readthedocs.io/en/latest/MANUAL.html#test-selection
 You can also use the ``--list-tests`` option in conjunction with selection
 arguments to list which tests will be run.
 
+Listing the tests through stestr imports every test module of tempest and of
+the installed plugins. Adding the ``--discovery-index`` option to
+``--list-tests`` lists and filters the tests from a cached index built by
+statically parsing the test modules instead, which is only refreshed for the
+files which changed since the previous listing. The index can't evaluate
+attributes applied with a non constant ``condition`` nor tests generated by a
+module level ``load_tests`` function.
+
 You can also use the ``--load-list`` option that lets you pass a filepath to
 tempest run with the file format being in a non-regex format, similar to the
 tests generated by the ``--list-tests`` option. You can specify target tests
@@ -90,6 +98,13 @@ tempest will run in parallel with a worker for each CPU present on the machine.
 If you want to adjust the number of workers use the ``--concurrency`` option
 and if you want to run tests serially use ``--serial/-t``
 
+Each worker parses the configuration file. With the ``--freeze-config``
+option the configuration is parsed once by ``tempest run``, and the workers
+load a frozen snapshot of it instead, in which reading an option is a plain
+attribute lookup. The workers still register the options of Tempest and of
+the installed plugins with oslo.config, and set them to the values of the
+snapshot.
+
 Running with Workspaces
 -----------------------
 Tempest run enables you to run your tempest tests from any setup tempest
@@ -124,8 +139,10 @@ as a single run you can leverage the ``--combine`` option which will append
 the current run's results with the previous runs.
 """
 
+import atexit
 import os
 import sys
+import tempfile
 
 from cliff import command
 from oslo_log import log
@@ -138,6 +155,7 @@ from tempest.cmd import init
 from tempest.cmd import workspace
 from tempest.common import credentials_factory as credentials
 from tempest import config
+from tempest.test_discover import index as discovery_index
 
 CONF = config.CONF
 SAVED_STATE_JSON = "saved_state.json"
@@ -236,7 +254,10 @@ class TempestRun(command.Command):
                             '--include-list', parsed_args.include_list)
 
         return_code = 0
-        if parsed_args.list_tests:
+        if parsed_args.list_tests and parsed_args.discovery_index:
+            return_code = self._list_tests_from_index(
+                regex, in_list, ex_list, ex_regex)
+        elif parsed_args.list_tests:
             try:
                 return_code = commands.list_command(
                     filters=regex, include_list=in_list,
@@ -250,6 +271,8 @@ class TempestRun(command.Command):
                     blacklist_file=ex_list, black_regex=ex_regex)
 
         else:
+            if parsed_args.freeze_config:
+                self._freeze_config()
             serial = not parsed_args.parallel
             params = {
                 'filters': regex, 'subunit_out': parsed_args.subunit,
@@ -278,6 +301,28 @@ class TempestRun(command.Command):
     def get_description(self):
         return 'Run tempest'
 
+    def _list_tests_from_index(self, regex, include_list, exclude_list,
+                               exclude_regex):
+        index = discovery_index.load_index()
+        dynamic_modules = index.dynamic_modules()
+        if dynamic_modules:
+            LOG.warning('The tests generated by load_tests in these modules '
+                        'are not part of the discovery index: %s',
+                        ', '.join(dynamic_modules))
+        for test_id in index.filter(regex, include_list, exclude_list,
+                                    exclude_regex):
+            print(test_id)
+        return 0
+
+    def _freeze_config(self):
+        fd, path = tempfile.mkstemp(prefix='tempest-config-',
+                                    suffix='.json')
+        os.close(fd)
+        CONF.freeze().save(path)
+        # The workers inherit the environment and load the snapshot
+        os.environ[config.CONFIG_SNAPSHOT_ENV] = path
+        atexit.register(os.remove, path)
+
     def _init_state(self):
         print("Initializing saved state.")
         data = {}
@@ -316,6 +361,12 @@ class TempestRun(command.Command):
         # Configuration flags
         parser.add_argument('--config-file', default=None, dest='config_file',
                             help='Configuration file to run tempest with')
+        parser.add_argument('--freeze-config', action='store_true',
+                            default=False,
+                            help='Parse the configuration file once and '
+                                 'share a frozen snapshot of it with the '
+                                 'workers, which load it instead of parsing '
+                                 'the file')
         # test selection args
         regex = parser.add_mutually_exclusive_group()
         regex.add_argument('--smoke', '-s', action='store_true',
@@ -370,6 +421,11 @@ class TempestRun(command.Command):
         parser.add_argument('--list-tests', '-l', action='store_true',
                             help='List tests',
                             default=False)
+        parser.add_argument('--discovery-index', action='store_true',
+                            default=False,
+                            help='Use the cached static test discovery '
+                                 'index with --list-tests instead of '
+                                 'importing the test modules')
         # execution args
         parser.add_argument('--concurrency', '-w',
                             type=int, default=0,
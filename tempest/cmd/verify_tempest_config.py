@@ -75,6 +75,7 @@ from tempest import clients
 from tempest.common import credentials_factory as credentials
 from tempest import config
 import tempest.lib.common.http
+from tempest.lib.common import response_cache
 from tempest.lib import exceptions as lib_exc
 
 
@@ -427,6 +428,12 @@ def main(opts=None):
     }
     icreds = credentials.get_credentials_provider(
         'verify_tempest_config', network_resources=net_resources)
+    if CONF.service_clients.response_cache_ttl:
+        response_cache.enable(
+            ttl=CONF.service_clients.response_cache_ttl,
+            max_size=CONF.service_clients.response_cache_size,
+            cached_collections=(
+                CONF.service_clients.response_cache_collections))
     try:
         os = clients.Manager(icreds.get_primary_creds().credentials)
         services = check_service_availability(os, update)
@@ -25,6 +25,7 @@ from oslo_log import log as logging
 from oslo_utils import excutils
 import testtools
 
+from tempest.common import concurrency
 from tempest.common.utils.linux import remote_client
 from tempest.common import waiters
 from tempest import config
@@ -156,7 +157,7 @@ def wait_for_ssh_or_ping(server, clients, tenant_network,
 def create_test_server(clients, validatable=False, validation_resources=None,
                        tenant_network=None, wait_until=None,
                        volume_backed=False, name=None, flavor=None,
-                       image_id=None, **kwargs):
+                       image_id=None, concurrent=False, **kwargs):
     """Common wrapper utility returning a test server.
 
     This method is a common wrapper returning a test server that can be
@@ -194,6 +195,10 @@ def create_test_server(clients, validatable=False, validation_resources=None,
         CONF.compute.flavor_ref will be used instead.
     :param image_id: ID of the image to be used to provision the server. If not
         defined, CONF.compute.image_ref will be used instead.
+    :param concurrent: When multiple servers are created with min_count or
+        max_count, wait for their status, check that they are pingable or
+        sshable and clean them up on failure concurrently rather than one
+        server at a time.
     :returns: a tuple
     """
 
@@ -318,51 +323,58 @@ def create_test_server(clients, validatable=False, validation_resources=None,
             wait_until_extra = wait_until
             wait_until = 'ACTIVE'
 
-        servers = []
+        def _wait_for_status(server):
+            return waiters.wait_for_server_status(
+                clients.servers_client, server['id'], wait_until,
+                request_id=request_id)
+
+        def _validate(server):
+            if CONF.validation.connect_method == 'floating':
+                _setup_validation_fip(
+                    server, clients, tenant_network, validation_resources)
+            if wait_until_extra:
+                wait_for_ssh_or_ping(
+                    server, clients, tenant_network, validatable,
+                    validation_resources, wait_until_extra, False)
+
+        def _delete(server):
+            try:
+                clients.servers_client.delete_server(server['id'])
+            except Exception:
+                LOG.exception('Deleting server %s failed', server['id'])
+
+        def _wait_for_termination(server):
+            # NOTE(artom) If the servers were booted with volumes and with
+            # delete_on_termination=False we need to wait for the servers to
+            # go away before proceeding with cleanup, otherwise we'll
+            # attempt to delete the volumes while they're still attached to
+            # servers that are in the process of being deleted.
+            try:
+                waiters.wait_for_server_termination(
+                    clients.servers_client, server['id'])
+            except Exception:
+                LOG.exception('Server %s failed to delete in time',
+                              server['id'])
+
+        if concurrent and len(created_servers) > 1:
+            run = concurrency.run_in_threads
+        else:
+            def run(target, items):
+                return [target(item) for item in items]
+
         try:
             # Wait for server to be in active state and populate servers list
             # with those full server response so that we will have addresses
             # field present in server which is needed to be used for wait for
             # ssh
-            for server in created_servers:
-                server = waiters.wait_for_server_status(
-                    clients.servers_client, server['id'], wait_until,
-                    request_id=request_id)
-                servers.append(server)
-
-            for server in servers:
-                if CONF.validation.run_validation and validatable:
-                    if CONF.validation.connect_method == 'floating':
-                        _setup_validation_fip(
-                            server, clients, tenant_network,
-                            validation_resources)
-                    if wait_until_extra:
-                        wait_for_ssh_or_ping(
-                            server, clients, tenant_network,
-                            validatable, validation_resources,
-                            wait_until_extra, False)
+            servers = run(_wait_for_status, created_servers)
+
+            if CONF.validation.run_validation and validatable:
+                run(_validate, servers)
         except Exception:
             with excutils.save_and_reraise_exception():
-                for server in created_servers:
-                    try:
-                        clients.servers_client.delete_server(
-                            server['id'])
-                    except Exception:
-                        LOG.exception('Deleting server %s failed',
-                                      server['id'])
-                for server in created_servers:
-                    # NOTE(artom) If the servers were booted with volumes
-                    # and with delete_on_termination=False we need to wait
-                    # for the servers to go away before proceeding with
-                    # cleanup, otherwise we'll attempt to delete the
-                    # volumes while they're still attached to servers that
-                    # are in the process of being deleted.
-                    try:
-                        waiters.wait_for_server_termination(
-                            clients.servers_client, server['id'])
-                    except Exception:
-                        LOG.exception('Server %s failed to delete in time',
-                                      server['id'])
+                run(_delete, created_servers)
+                run(_wait_for_termination, created_servers)
         if servers and not multiple_create_request:
             body = rest_client.ResponseBody(body.response, servers[0])
         return body, servers
@@ -370,6 +382,24 @@ def create_test_server(clients, validatable=False, validation_resources=None,
     return body, created_servers
 
 
+def create_test_servers(clients, count, **kwargs):
+    """Create several test servers with a single multiple create request.
+
+    The servers are booted with min_count and max_count set to count, then
+    their status is polled, and their validation done, concurrently. All
+    the servers are deleted if any of them fails to become ready.
+
+    :param clients: Client manager which provides OpenStack Tempest clients.
+    :param count: Number of servers to create.
+    :param kwargs: Parameters passed to create_test_server.
+    :returns: the list of created servers
+    """
+    _, servers = create_test_server(clients, min_count=count,
+                                    max_count=count, concurrent=True,
+                                    **kwargs)
+    return servers
+
+
 def shelve_server(servers_client, server_id, force_shelve_offload=False):
     """Common wrapper utility to shelve server.
 
@@ -13,6 +13,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+from concurrent import futures
 import multiprocessing
 
 
@@ -59,3 +60,27 @@ def run_concurrent_tasks(target, resource_count, **kwargs):
         )
 
     return list(resource_ids)
+
+
+def run_in_threads(target, items, max_workers=None):
+    """Call a target function on each item concurrently using threads.
+
+    Unlike run_concurrent_tasks the calls share the memory of the calling
+    process, so the target can use the test clients and return its result.
+
+    :param target: Function to execute, called with each item as only
+                   parameter.
+    :param items: Items to process.
+    :param max_workers: Maximum number of threads, defaults to one thread
+                        per item.
+    :return: List of the results in the same order as the items.
+    :raises: The exception of the first failed call, in the order of the
+             items, once all the calls completed.
+    """
+    items = list(items)
+    if not items:
+        return []
+    with futures.ThreadPoolExecutor(
+            max_workers=max_workers or len(items)) as executor:
+        pending = [executor.submit(target, item) for item in items]
+    return [future.result() for future in pending]
@@ -0,0 +1,152 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import threading
+
+from oslo_log import log as logging
+
+from tempest.common import concurrency
+from tempest.lib import exceptions as lib_exc
+
+LOG = logging.getLogger(__name__)
+
+
+def _find_anchor(lines, anchor):
+    """Return the index of the line following the last anchor in lines"""
+    if not anchor:
+        return 0
+    size = len(anchor)
+    for index in range(len(lines), size - 1, -1):
+        if lines[index - size:index] == anchor:
+            return index
+    return None
+
+
+def _complete(lines):
+    # The last line of the console may still be being written
+    if lines and not lines[-1].endswith('\n'):
+        return lines[:-1]
+    return lines
+
+
+class ConsoleLogCollector(object):
+    """Collect the console output of servers incrementally
+
+    The collector remembers the last lines it got from each server, and
+    only asks the compute API for the tail of the console using the
+    ``length`` parameter of ``get_console_output``. The tail is extended
+    until it includes the lines already collected, so only the new lines
+    are written. The first collection of a server gets its whole console.
+
+    The new lines of each server are appended to its own file in
+    ``output_dir``, or logged when no directory is given. A line which was
+    not complete yet when collected is collected again once complete.
+
+    :param output_dir: directory where the ``console-<server id>.log``
+        files are written, None to log the console output
+    :param tail_length: number of lines of the first tail requested
+    :param max_tail_length: longest tail requested before the whole console
+        is requested
+    :param anchor_lines: number of collected lines looked for in the tail
+    :param max_workers: maximum number of consoles fetched concurrently
+    """
+
+    def __init__(self, output_dir=None, tail_length=100,
+                 max_tail_length=25600, anchor_lines=5, max_workers=8):
+        self.output_dir = output_dir
+        self.tail_length = tail_length
+        self.max_tail_length = max_tail_length
+        self.anchor_lines = anchor_lines
+        self.max_workers = max_workers
+        self._anchors = {}
+        self._lock = threading.Lock()
+
+    def _get_lines(self, client, server_id, length=None, **kwargs):
+        if length is not None:
+            kwargs['length'] = length
+        output = client.get_console_output(server_id, **kwargs)['output']
+        return (output or '').splitlines(True)
+
+    def _new_lines(self, client, server_id, anchor, length=None, **kwargs):
+        if anchor:
+            tail = self.tail_length
+            while tail < min(length or self.max_tail_length,
+                             self.max_tail_length):
+                lines = self._get_lines(client, server_id, length=tail,
+                                        **kwargs)
+                index = _find_anchor(lines, anchor)
+                if index is not None:
+                    return lines[index:]
+                if len(lines) < tail:
+                    # This is the whole console, which was reset since the
+                    # last collection
+                    return lines
+                tail *= 4
+        lines = self._get_lines(client, server_id, length=length, **kwargs)
+        index = _find_anchor(lines, anchor)
+        return lines if index is None else lines[index:]
+
+    def _write(self, server_id, lines):
+        if self.output_dir is None:
+            LOG.debug('Console output for %s\nbody=\n%s', server_id,
+                      ''.join(lines))
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, 'console-%s.log' % server_id)
+        with open(path, 'a') as fd:
+            fd.writelines(lines)
+
+    def collect_server(self, client, server_id, **kwargs):
+        """Collect the new console output of a server
+
+        :param client: the servers client
+        :param server_id: the ID of the server
+        :param kwargs: other parameters of ``get_console_output``. The
+            ``length`` parameter limits the number of lines collected.
+        :return: the list of the new lines
+        """
+        with self._lock:
+            anchor = self._anchors.get(server_id)
+        try:
+            lines = self._new_lines(client, server_id, anchor, **kwargs)
+        except lib_exc.NotFound:
+            LOG.debug("Server %s disappeared(deleted) while looking "
+                      "for the console log", server_id)
+            return []
+        complete = _complete(lines)
+        if anchor and len(complete) < self.anchor_lines:
+            complete = list(anchor) + complete
+        with self._lock:
+            self._anchors[server_id] = complete[-self.anchor_lines:]
+        if lines:
+            self._write(server_id, lines)
+        return lines
+
+    def collect(self, client, servers, **kwargs):
+        """Collect the new console output of several servers concurrently
+
+        :param client: the servers client
+        :param servers: the servers, as returned by the compute API
+        :param kwargs: other parameters of ``get_console_output``
+        :return: a dict with the list of new lines of each server ID
+        """
+        server_ids = [server['id'] for server in servers]
+        results = concurrency.run_in_threads(
+            lambda server_id: self.collect_server(client, server_id,
+                                                  **kwargs),
+            server_ids, max_workers=min(self.max_workers,
+                                        len(server_ids) or 1))
+        return dict(zip(server_ids, results))
@@ -13,12 +13,75 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import threading
+import weakref
+
 from tempest import config
 from tempest.lib.common import cred_client
 from tempest.lib import exceptions as lib_exc
 
 CONF = config.CONF
 
+# The name indexes of each client, by kind of resource
+_indexes = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+class NameIndex(object):
+    """An index by name of a listing of identity resources
+
+    Some lookups can not be filtered by the identity API, so the whole
+    listing is fetched once and hashed by name. The listing is fetched
+    again when a name is not found, in case the resource was created since
+    the index was built, and when a resource found in the index fails its
+    verification, in case it was deleted or renamed since.
+
+    :param list_resources: a callable returning the list of resources
+    """
+
+    def __init__(self, list_resources):
+        self._list_resources = list_resources
+        self._lock = threading.Lock()
+        self._resources = None
+
+    def _build(self):
+        resources = {}
+        for resource in self._list_resources():
+            # The first resource with a name wins, like a linear search
+            resources.setdefault(resource['name'], resource)
+        self._resources = resources
+
+    def get(self, name, verify=None):
+        """Return the resource with the given name, or None
+
+        :param verify: a callable telling whether a resource found in an
+            index built by a previous lookup still exists with its name
+        """
+        with self._lock:
+            built = self._resources is None
+            if built:
+                self._build()
+            resource = self._resources.get(name)
+            if not built and (resource is None or
+                              (verify and not verify(resource))):
+                self._build()
+                resource = self._resources.get(name)
+            return resource
+
+
+def _get_index(client, kind, list_resources):
+    with _indexes_lock:
+        indexes = _indexes.setdefault(client, {})
+        if kind not in indexes:
+            indexes[kind] = NameIndex(list_resources)
+        return indexes[kind]
+
+
+def clear_indexes():
+    """Drop the name indexes built by the lookups of this module"""
+    with _indexes_lock:
+        _indexes.clear()
+
 
 def get_project_by_name(client, project_name):
     projects = client.list_projects({'name': project_name})['projects']
@@ -30,31 +93,61 @@ def get_project_by_name(client, project_name):
 
 
 def get_tenant_by_name(client, tenant_name):
-    tenants = client.list_tenants()['tenants']
-    for tenant in tenants:
-        if tenant['name'] == tenant_name:
-            return tenant
-    raise lib_exc.NotFound('No such tenant(%s) in %s' % (tenant_name, tenants))
+    """Return a tenant by name, using a name index of the tenants
+
+    The identity v2 API can not filter the tenants by name, the index is
+    built from the listing of the tenants once per client. A tenant found
+    in the index is checked to still exist with its name, which is cheaper
+    than listing the tenants again.
+    """
+    def verify(tenant):
+        try:
+            return (client.show_tenant(tenant['id'])['tenant']['name'] ==
+                    tenant['name'])
+        except lib_exc.NotFound:
+            return False
+
+    tenant = _get_index(
+        client, ('tenants',),
+        lambda: client.list_tenants()['tenants']).get(tenant_name, verify)
+    if tenant is None:
+        raise lib_exc.NotFound('No such tenant(%s)' % tenant_name)
+    return tenant
 
 
 def get_user_by_username(client, tenant_id, username):
+    """Return a user of a tenant by name
+
+    The users of the tenant are listed on each call: the listing is scoped
+    to the tenant, and there is no cheaper way to check that a user found
+    in an index is still a member of the tenant.
+    """
     users = client.list_tenant_users(tenant_id)['users']
     for user in users:
         if user['name'] == username:
             return user
-    raise lib_exc.NotFound('No such user(%s) in %s' % (username, users))
+    raise lib_exc.NotFound('No such user(%s) in tenant %s' % (
+        username, tenant_id))
 
 
 def get_user_by_project(users_client, roles_client, project_id, username):
+    """Return a user by name, if it has a role on the project
+
+    Both the users and their role assignments on the project are filtered
+    by the identity API, so only the assignments of the users with the
+    name are fetched.
+    """
     users = users_client.list_users(**{'name': username})['users']
-    users_in_project = roles_client.list_role_assignments(
-        **{'scope.project.id': project_id})['role_assignments']
     for user in users:
-        if user['name'] == username:
-            for u in users_in_project:
-                if u['user']['id'] == user['id']:
-                    return user
-    raise lib_exc.NotFound('No such user(%s) in %s' % (username, users))
+        if user['name'] != username:
+            continue
+        assignments = roles_client.list_role_assignments(
+            **{'scope.project.id': project_id,
+               'user.id': user['id']})['role_assignments']
+        if assignments:
+            return user
+    raise lib_exc.NotFound('No such user(%s) in project %s' % (username,
+                                                               project_id))
 
 
 def identity_utils(clients):
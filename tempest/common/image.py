@@ -14,49 +14,166 @@
 #    under the License.
 
 from http import server
-import random
+import os
+import re
 import threading
 import time
 
+CHUNK_SIZE = 64 * 1024  # 64 KiB per chunk
+# 19,660,800 bytes (about 18.75 MiB) sent in 60 seconds by default
+DEFAULT_SIZE = 300 * CHUNK_SIZE
+DEFAULT_RATE = CHUNK_SIZE * 5
+# Size of the random block repeated to make up the served data
+BUFFER_SIZE = 1024 * 1024
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
 
 class RandomDataHandler(server.BaseHTTPRequestHandler):
-    def do_GET(self):
-        self.send_response(200)
+    """Serve the data of a RandomDataServer
+
+    The data is made of a random block generated once per server, or read
+    from the file of the server. Single byte ranges are supported.
+    """
+
+    def _parse_range(self, size):
+        """Return the (first, last) bytes requested, or None for all"""
+        match = RANGE_RE.match(self.headers.get('Range', '').strip())
+        if not match or match.groups() == ('', ''):
+            # No range, or one which is not supported like several ranges:
+            # the whole data is sent
+            return None
+        first, last = match.groups()
+        if not first:
+            # Suffix range, i.e. the last bytes of the data
+            return max(size - int(last), 0), size - 1
+        last = min(int(last), size - 1) if last else size - 1
+        return int(first), last
+
+    def _send_headers(self):
+        size = self.server.size
+        data_range = self._parse_range(size)
+        if data_range is not None and data_range[0] > data_range[1]:
+            self.send_response(416)
+            self.send_header('Content-Range', 'bytes */%d' % size)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return None
+        if data_range is None:
+            self.send_response(200)
+            data_range = (0, size - 1)
+        else:
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes %d-%d/%d' % (
+                data_range + (size,)))
         self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length',
+                         str(data_range[1] - data_range[0] + 1))
         self.end_headers()
+        return data_range
+
+    def _throttle(self, start_time, sent):
+        # Sleep until the data already sent is back under the rate limit
+        if self.server.rate:
+            delay = start_time + sent / self.server.rate - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
 
-        start_time = time.time()
-        chunk_size = 64 * 1024  # 64 KiB per chunk
-        while time.time() - start_time < 60:
-            data = bytes(random.getrandbits(8) for _ in range(chunk_size))
-            try:
-                self.wfile.write(data)
-                self.wfile.flush()
-                # simulate slow transfer
-                time.sleep(0.2)
-            except BrokenPipeError:
-                # Client disconnected; stop sending data
-                break
+    def _send_random_data(self, offset, count):
+        data = self.server.data
+        block = len(data) // 2
+        start_time = time.monotonic()
+        sent = 0
+        while sent < count:
+            self._throttle(start_time, sent)
+            position = (offset + sent) % block
+            length = min(self.server.chunk_size, count - sent, block)
+            self.wfile.write(data[position:position + length])
+            sent += length
+
+    def _send_file(self, offset, count):
+        start_time = time.monotonic()
+        sent = 0
+        with open(self.server.path, 'rb') as fd:
+            while sent < count:
+                self._throttle(start_time, sent)
+                # Without rate limit the whole range is sent at once
+                length = count - sent
+                if self.server.rate:
+                    length = min(self.server.chunk_size, length)
+                sent += self.connection.sendfile(fd, offset + sent, length)
+
+    def do_GET(self):
+        data_range = self._send_headers()
+        if data_range is None:
+            return
+        first, last = data_range
+        try:
+            if self.server.path:
+                self._send_file(first, last - first + 1)
+            else:
+                self._send_random_data(first, last - first + 1)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client disconnected; stop sending data
+            pass
 
     def do_HEAD(self):
-        # same size as in do_GET (19,660,800 bytes (about 18.75 MiB)
-        size = 300 * 65536
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/octet-stream')
-        self.send_header('Content-Length', str(size))
-        self.end_headers()
+        self._send_headers()
+
+    def log_message(self, format, *args):
+        pass
 
 
 class RandomDataServer(object):
-    def __init__(self, handler_class=RandomDataHandler):
+    """A local HTTP server serving random data or a file
+
+    Each request is handled in its own thread. The server supports
+    ``HEAD`` requests and single byte ranges, and always sends the
+    ``Content-Length`` of the data.
+
+    :param handler_class: the request handler class
+    :param size: size of the served random data in bytes
+    :param rate: maximum transfer rate of each request in bytes per second,
+        None for no limit. The default rate sends the default size in about
+        60 seconds.
+    :param path: path of a file to serve instead of random data, e.g. a real
+        image. It is sent with ``sendfile`` and ``size`` is ignored.
+    :param chunk_size: size of the chunks written to the socket, the rate
+        limit is applied between chunks
+    :param host: the address to listen on
+    """
+
+    def __init__(self, handler_class=RandomDataHandler, size=DEFAULT_SIZE,
+                 rate=DEFAULT_RATE, path=None, chunk_size=CHUNK_SIZE,
+                 host='localhost'):
         self.handler_class = handler_class
+        self.size = os.path.getsize(path) if path else size
+        self.rate = rate
+        self.path = path
+        self.chunk_size = chunk_size
+        self.host = host
         self.server = None
         self.thread = None
         self.port = None
 
+    @property
+    def url(self):
+        return 'http://%s:%d' % (self.host, self.port)
+
     def start(self):
         # Bind to port 0 for an unused port
-        self.server = server.HTTPServer(('localhost', 0), self.handler_class)
+        self.server = server.ThreadingHTTPServer((self.host, 0),
+                                                 self.handler_class)
+        self.server.size = self.size
+        self.server.rate = self.rate
+        self.server.path = self.path
+        self.server.chunk_size = self.chunk_size
+        if not self.path:
+            # The block is doubled so that any chunk of it can be sliced
+            # without copy, even across the end of the block
+            block = os.urandom(min(BUFFER_SIZE, max(self.size, 1)))
+            self.server.data = memoryview(block + block)
         self.port = self.server.server_address[1]
 
         # Run server in background thread
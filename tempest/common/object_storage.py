@@ -19,7 +19,8 @@ CONF = config.CONF
 LOG = log.getLogger(__name__)
 
 
-def delete_containers(containers, container_client, object_client):
+def delete_containers(containers, container_client, object_client,
+                      bulk_client=None):
     """Remove containers and all objects in them.
 
     The containers should be visible from the container_client given.
@@ -29,10 +30,16 @@ def delete_containers(containers, container_client, object_client):
                        to be deleted
     :param container_client: Client to be used to delete containers
     :param object_client: Client to be used to delete objects
+    :param bulk_client: If given, client used to delete the objects with
+                        parallel bulk-delete requests before the remaining
+                        ones are removed one by one
     """
     if isinstance(containers, str):
         containers = [containers]
 
+    if bulk_client is not None:
+        bulk_delete_objects(containers, container_client, bulk_client)
+
     for cont in containers:
         try:
             delete_objects(cont, container_client, object_client)
@@ -53,12 +60,36 @@ def delete_objects(container, container_client, object_client):
                              the container
     :param object_client: Client to be used to delete objects
     """
-    params = {'limit': 9999, 'format': 'json'}
-    _, objlist = container_client.list_container_objects(container, params)
-
-    for obj in objlist:
+    # The listing is paged by object name, so objects can be deleted while
+    # the following pages are fetched.
+    for obj in container_client.iter_container_objects(container):
         try:
             object_client.delete_object(container, obj['name'])
             object_client.wait_for_resource_deletion(obj['name'], container)
         except lib_exc.NotFound:
             LOG.warning(f"Object {obj} wasn't deleted as it wasn't found.")
+
+
+def bulk_delete_objects(containers, container_client, bulk_client):
+    """Remove all objects from containers with bulk-delete requests.
+
+    Will not throw any error if the containers or objects do not exist.
+
+    :param containers: List of names of the containers to empty
+    :param container_client: Client to be used to list objects in
+                             the containers
+    :param bulk_client: Client to be used to delete the objects
+    """
+    def _paths():
+        for cont in containers:
+            try:
+                for obj in container_client.iter_container_objects(cont):
+                    yield '%s/%s' % (cont, obj['name'])
+            except lib_exc.NotFound:
+                LOG.warning(f"Container {cont} wasn't emptied as it wasn't "
+                            "found.")
+
+    result = bulk_client.bulk_delete(_paths())
+    if result['Errors']:
+        LOG.warning("Bulk deletion of objects failed for: %s",
+                    result['Errors'])
@@ -12,8 +12,17 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
+import abc
+import asyncio
+import collections
+import ipaddress
+import itertools
 import signal
+import socket
+import struct
 import subprocess
+import threading
+import time
 
 import fixtures
 
@@ -148,3 +157,333 @@ class MetadataDowntimeMeter(fixtures.Fixture):
             LOG.debug('killed metadata downtime script with PID %s', self.pid)
         else:
             LOG.debug('No metadata downtime script found')
+
+
+Sample = collections.namedtuple('Sample', ['sent', 'rtt'])
+
+
+class Probe(object, metaclass=abc.ABCMeta):
+    """Base class of the probes of a ProbeDowntimeMeter
+
+    A probe checks once that its target is reachable, from the event loop
+    of the meter. :py:meth:`probe` returns when the check passed and raises
+    any exception when it failed. The meter applies the timeout.
+
+    :param host: the address or name of the target
+    :param name: the name of the target in the results, the default is
+        derived from the host and probe type
+    """
+
+    def __init__(self, host, name=None):
+        self.host = host
+        self.name = name or '%s:%s' % (self.__class__.__name__, host)
+
+    async def start(self):
+        """Set up what the probes share, called once in the event loop"""
+
+    @abc.abstractmethod
+    async def probe(self):
+        """Check the target once, raise any exception if it failed"""
+
+    def close(self):
+        """Release what start() set up"""
+
+
+class TcpProbe(Probe):
+    """Check that a TCP connection to the target can be opened"""
+
+    def __init__(self, host, port, name=None):
+        super(TcpProbe, self).__init__(
+            host, name or 'tcp:%s:%s' % (host, port))
+        self.port = port
+
+    async def probe(self):
+        _, writer = await asyncio.open_connection(self.host, self.port)
+        writer.close()
+        await writer.wait_closed()
+
+
+class HttpProbe(Probe):
+    """Check that the target answers an HTTP GET with a 2xx or 3xx status
+
+    :param expected_text: if set, the body of the response must contain it,
+        e.g. the hostname of a server like the metadata meter script checks
+    """
+
+    def __init__(self, host, port=80, path='/', expected_text=None,
+                 name=None):
+        super(HttpProbe, self).__init__(
+            host, name or 'http://%s:%s%s' % (host, port, path))
+        self.port = port
+        self.path = path
+        self.expected_text = expected_text
+
+    async def probe(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(('GET %s HTTP/1.0\r\nHost: %s\r\n\r\n' %
+                          (self.path, self.host)).encode('ascii'))
+            await writer.drain()
+            status_line = await reader.readline()
+            status = int(status_line.split()[1])
+            if not 200 <= status < 400:
+                raise ValueError('Unexpected HTTP status %s' % status)
+            if self.expected_text is not None:
+                body = await reader.read()
+                if self.expected_text.encode('utf-8') not in body:
+                    raise ValueError('%r not found in the response' %
+                                     self.expected_text)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+
+class _IcmpProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self, reply_type, waiters):
+        self.reply_type = reply_type
+        self.waiters = waiters
+
+    def datagram_received(self, data, addr):
+        # Ping sockets receive the ICMP message without the IP header
+        if len(data) < 8 or data[0] != self.reply_type:
+            return
+        sequence = struct.unpack('!H', data[6:8])[0]
+        waiter = self.waiters.get(sequence)
+        if waiter and not waiter.done():
+            waiter.set_result(None)
+
+
+class IcmpProbe(Probe):
+    """Send ICMP echo requests to the target
+
+    Unprivileged ICMP sockets are used, so it doesn't require root
+    privileges, unlike ``ping`` with intervals lower than 0.2 s. They must
+    be allowed for the group of the user by the
+    ``net.ipv4.ping_group_range`` sysctl, which covers IPv6 as well.
+    """
+
+    def __init__(self, host, name=None):
+        super(IcmpProbe, self).__init__(host, name or 'icmp:%s' % host)
+        self._sequence = itertools.count()
+        self._waiters = {}
+        self._transport = None
+
+    async def start(self):
+        if ipaddress.ip_address(self.host).version == 6:
+            family, proto, self._request_type, reply_type = (
+                socket.AF_INET6, socket.IPPROTO_ICMPV6, 128, 129)
+        else:
+            family, proto, self._request_type, reply_type = (
+                socket.AF_INET, socket.IPPROTO_ICMP, 8, 0)
+        sock = socket.socket(family, socket.SOCK_DGRAM, proto)
+        sock.setblocking(False)
+        self._transport, _ = await (
+            asyncio.get_running_loop().create_datagram_endpoint(
+                lambda: _IcmpProtocol(reply_type, self._waiters),
+                sock=sock))
+
+    async def probe(self):
+        sequence = next(self._sequence) & 0xffff
+        # The kernel sets the identifier and the checksum of ping sockets
+        packet = struct.pack('!BBHHH', self._request_type, 0, 0, 0,
+                             sequence) + b'tempest'
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[sequence] = waiter
+        try:
+            self._transport.sendto(packet, (self.host, 0))
+            await waiter
+        finally:
+            self._waiters.pop(sequence, None)
+
+    def close(self):
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+
+
+def _percentile(sorted_values, percent):
+    # Nearest rank percentile
+    rank = max(int(round(percent / 100.0 * len(sorted_values))), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize_samples(samples):
+    """Compute the outages and round trip statistics of probe samples
+
+    An outage starts when a probe is sent which fails, and ends when the
+    next successful probe is sent, so the outage windows are precise to
+    the probing interval. An outage still going on at the last sample ends
+    at the sending time of that sample.
+
+    :param samples: list of Sample, with the sending time of the probe in
+        seconds and its round trip time, or None if it failed
+    :return: dict with the number of probes ``sent`` and ``lost``, the
+        ``outages`` as a list of (start, end) tuples, the total ``downtime``
+        and, if any probe succeeded, the ``rtt`` min, avg, max, p50, p90 and
+        p99 and the ``jitter``, which is the mean difference of consecutive
+        round trip times. All the times are in seconds.
+    """
+    samples = sorted(samples)
+    outages = []
+    outage_start = None
+    rtts = []
+    for sample in samples:
+        if sample.rtt is None:
+            if outage_start is None:
+                outage_start = sample.sent
+        else:
+            rtts.append(sample.rtt)
+            if outage_start is not None:
+                outages.append((outage_start, sample.sent))
+                outage_start = None
+    if outage_start is not None:
+        outages.append((outage_start, samples[-1].sent))
+    results = {
+        'sent': len(samples),
+        'lost': len(samples) - len(rtts),
+        'outages': outages,
+        'downtime': sum(end - start for start, end in outages),
+    }
+    if rtts:
+        jitters = [abs(b - a) for a, b in zip(rtts, rtts[1:])]
+        results['jitter'] = sum(jitters) / len(jitters) if jitters else 0.0
+        sorted_rtts = sorted(rtts)
+        results['rtt'] = {
+            'min': sorted_rtts[0],
+            'avg': sum(rtts) / len(rtts),
+            'max': sorted_rtts[-1],
+            'p50': _percentile(sorted_rtts, 50),
+            'p90': _percentile(sorted_rtts, 90),
+            'p99': _percentile(sorted_rtts, 99),
+        }
+    return results
+
+
+class ProbeDowntimeMeter(fixtures.Fixture):
+    """Measure the downtime of many targets with high rate probes
+
+    Unlike NetDowntimeMeter, which derives the downtime from the packet
+    loss reported by a ``ping`` process, the probes run in process, in an
+    asyncio event loop in a background thread, and every probe is timed
+    with the monotonic clock. Probes are sent at a fixed rate whatever the
+    time the previous ones take to answer, so the outage windows are
+    precise to the interval, and a single thread can probe many targets.
+
+    Example::
+
+        meter = self.useFixture(net_downtime.ProbeDowntimeMeter(
+            [net_downtime.IcmpProbe(fip), net_downtime.TcpProbe(fip, 22)],
+            interval=0.02))
+        # live migrate the server
+        results = meter.get_results()
+        self.assertLess(results['icmp:%s' % fip]['downtime'], 1.0)
+
+    :param probes: list of Probe to run
+    :param interval: time in seconds between two probes of a target
+    :param timeout: time in seconds after which a probe is failed
+    """
+
+    def __init__(self, probes, interval=0.05, timeout=1.0):
+        self.probes = probes
+        self.interval = float(interval)
+        self.timeout = float(timeout)
+        self.samples = dict((probe.name, []) for probe in probes)
+        self.start_time = None
+        self._loop = None
+        self._thread = None
+        self._stopped = None
+        self._started = None
+        self._start_error = None
+
+    def _setUp(self):
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._start_error = None
+        self._thread = threading.Thread(
+            target=self._loop.run_until_complete, args=(self._run(),),
+            daemon=True)
+        self.addCleanup(self.stop)
+        self._thread.start()
+        self._started.wait()
+        if self._start_error:
+            # e.g. ICMP sockets are not permitted
+            raise self._start_error
+
+    async def _run(self):
+        self._stopped = asyncio.Event()
+        try:
+            try:
+                for probe in self.probes:
+                    await probe.start()
+            except Exception as e:
+                self._start_error = e
+                return
+            finally:
+                self._started.set()
+            LOG.debug('Starting %d probes every %g s', len(self.probes),
+                      self.interval)
+            self.start_time = time.monotonic()
+            loops = [asyncio.ensure_future(self._probe_loop(probe))
+                     for probe in self.probes]
+            await self._stopped.wait()
+            for task in loops:
+                task.cancel()
+            await asyncio.gather(*loops, return_exceptions=True)
+        finally:
+            for probe in self.probes:
+                probe.close()
+
+    async def _probe_loop(self, probe):
+        pending = set()
+        try:
+            for tick in itertools.count():
+                # Sleep until the next tick, so the rate doesn't drift
+                delay = (self.start_time + tick * self.interval -
+                         time.monotonic())
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                task = asyncio.ensure_future(self._sample(probe))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        finally:
+            # Probes in flight at the end are not part of the results
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _sample(self, probe):
+        sent = time.monotonic()
+        try:
+            await asyncio.wait_for(probe.probe(), self.timeout)
+            rtt = time.monotonic() - sent
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            LOG.debug('Probe %s failed: %s', probe.name, e)
+            rtt = None
+        self.samples[probe.name].append(
+            Sample(sent - self.start_time, rtt))
+
+    def stop(self):
+        """Stop the probes, the results stay available"""
+        if self._thread is None:
+            return
+        if self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+        self._thread.join()
+        self._loop.close()
+        self._thread = None
+
+    def get_results(self):
+        """Return the results of each target, by probe name
+
+        The probes keep running, see :py:func:`summarize_samples` for the
+        content of the results of each target.
+        """
+        results = {}
+        for name, samples in self.samples.items():
+            # The samples are appended from the event loop thread
+            results[name] = summarize_samples(list(samples))
+            LOG.debug('Downtime of %s: %r', name, results[name])
+        return results
@@ -13,6 +13,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import copy
+import json
 import os
 import tempfile
 
@@ -25,6 +27,8 @@ from tempest.lib import exceptions
 from tempest.lib.services import clients
 from tempest.test_discover import plugins
 
+LOG = logging.getLogger(__name__)
+
 
 # TODO(marun) Replace use of oslo_config's global ConfigOpts
 # (cfg.CONF) instance with a local instance (cfg.ConfigOpts()) once
@@ -237,7 +241,28 @@ ServiceClientsGroup = [
                help='Timeout in seconds to wait for the http request to '
                     'return'),
     cfg.StrOpt('proxy_url',
-               help='Specify an http proxy to use.')
+               help='Specify an http proxy to use.'),
+    cfg.FloatOpt('response_cache_ttl',
+                 default=0.0,
+                 help="Number of seconds the responses of the GET requests "
+                      "on the collections of response_cache_collections are "
+                      "cached and shared by the service clients of a test "
+                      "process. The responses are cached per token, and "
+                      "dropped when a request changes their collection. "
+                      "The default of 0 disables the cache."),
+    cfg.IntOpt('response_cache_size',
+               default=1024,
+               help="Maximum number of responses in the response cache, "
+                    "the least recently used responses are evicted first."),
+    cfg.ListOpt('response_cache_collections',
+                default=['versions', 'extensions', 'flavors', 'images',
+                         'networks', 'subnets', 'projects', 'users',
+                         'domains', 'roles', 'role_assignments'],
+                help="Names of the API collections whose listings are "
+                     "cached when response_cache_ttl is set, 'versions' for "
+                     "the version documents of the services. The GET "
+                     "requests for a single resource of a collection, or "
+                     "for anything below it, are not cached."),
 ]
 
 identity_feature_group = cfg.OptGroup(name='identity-feature-enabled',
@@ -934,6 +959,11 @@ ValidationGroup = [
     cfg.BoolOpt('security_group_rules',
                 default=True,
                 help='Enable/disable security group rules.'),
+    cfg.BoolOpt('concurrent_provisioning',
+                default=False,
+                help='Provision and cleanup the validation resources in '
+                     'parallel, and create the security group rules with a '
+                     'single bulk request when neutron is used.'),
     cfg.StrOpt('connect_method',
                default='floating',
                choices=[('fixed',
@@ -1375,7 +1405,31 @@ Expected values for this field are:
 
 If nothing is specified, this feature is not enabled. To trace everything
 specify .* as the regex.
-""")
+"""),
+    cfg.StrOpt('cassette_mode',
+               choices=['record', 'replay'],
+               help="Record the HTTP requests and responses of each test "
+                    "class in a cassette, or replay them from the cassette "
+                    "instead of sending the requests to the cloud. The "
+                    "cassettes are stored in cassette_dir. Replaying allows "
+                    "to run test classes offline to profile Tempest itself. "
+                    "If nothing is specified, this feature is not enabled."),
+    cfg.StrOpt('cassette_dir',
+               default='cassettes',
+               help="Directory of the cassettes recorded or replayed when "
+                    "cassette_mode is set, with one cassette per test "
+                    "class."),
+    cfg.FloatOpt('cassette_latency',
+                 default=0.0,
+                 help="Fraction of the recorded latency of each request to "
+                      "reproduce when replaying a cassette: 1.0 to wait as "
+                      "long as the recorded request took, 0 to answer "
+                      "immediately."),
+    cfg.StrOpt('console_output_dir',
+               help="Directory where the scenario tests write the console "
+                    "output of their servers, in one console-<server id>.log "
+                    "file per server. If nothing is specified, the console "
+                    "output is written to the test log."),
 ]
 
 
@@ -1566,7 +1620,6 @@ class TempestConfigPrivate(object):
             _CONF.log_config_append = logging_cfg_path
 
         logging.setup(_CONF, 'tempest')
-        LOG = logging.getLogger('tempest')
         LOG.info("Using tempest config file %s", path)
         register_opts()
         self._set_attrs()
@@ -1574,6 +1627,184 @@ class TempestConfigPrivate(object):
             _CONF.log_opt_values(LOG, logging.DEBUG)
 
 
+CONFIG_SNAPSHOT_ENV = 'TEMPEST_CONFIG_SNAPSHOT'
+
+
+class FrozenConfigGroup(object):
+    """Read only copy of the option values of a configuration group
+
+    The options are plain instance attributes, reading them does not go
+    through oslo.config. Like ``cfg.ConfigOpts.GroupAttr`` the values can
+    also be read as items, and an unknown option raises ``NoSuchOptError``.
+    """
+
+    def __init__(self, name, values):
+        object.__setattr__(self, '_name', name)
+        self.__dict__.update(copy.deepcopy(values))
+
+    def __getattr__(self, attr):
+        # Only called for the attributes which are not options
+        if attr.startswith('__') or attr == '_name':
+            raise AttributeError(attr)
+        raise cfg.NoSuchOptError(attr, cfg.OptGroup(self._name))
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("Can't set option %s of group %s, the "
+                             "configuration is frozen" % (attr, self._name))
+
+    def __delattr__(self, attr):
+        raise AttributeError("Can't delete option %s of group %s, the "
+                             "configuration is frozen" % (attr, self._name))
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.to_dict()
+
+    def __iter__(self):
+        return iter(self.to_dict())
+
+    def __reduce__(self):
+        return self.__class__, (self._name, self.to_dict())
+
+    def to_dict(self):
+        return dict((key, value) for key, value in self.__dict__.items()
+                    if key != '_name')
+
+
+class TempestConfigSnapshot(FrozenConfigGroup):
+    """Frozen copy of a parsed Tempest configuration
+
+    The options of the default group are attributes of the snapshot, and
+    each option group is a :py:class:`FrozenConfigGroup` attribute, set both
+    under its name and under the aliases ``TempestConfigPrivate`` defines,
+    e.g. ``compute_feature_enabled`` for ``compute-feature-enabled``.
+
+    A snapshot can be saved to a file and loaded by other processes, which
+    then don't need to parse ``tempest.conf`` again, see
+    :py:meth:`TempestConfigProxy.freeze`. They still register the options,
+    including those of the plugins, see :py:meth:`register`.
+    """
+
+    VERSION = 1
+
+    def __init__(self, groups, aliases):
+        """Initialize the snapshot
+
+        :param groups: dict of the option values of each group, by group
+            name, the default group is ``DEFAULT``
+        :param aliases: dict of the group names by attribute name
+        """
+        attrs = dict(groups.get('DEFAULT', {}))
+        for name, values in groups.items():
+            if name != 'DEFAULT':
+                attrs[name] = FrozenConfigGroup(name, values)
+        for alias, name in aliases.items():
+            attrs[alias] = attrs[name]
+        super(TempestConfigSnapshot, self).__init__('DEFAULT', attrs)
+        object.__setattr__(self, '_groups', groups)
+        object.__setattr__(self, '_aliases', aliases)
+
+    def __reduce__(self):
+        return self.__class__, (self._groups, self._aliases)
+
+    def to_dict(self):
+        return dict((key, value) for key, value in self.__dict__.items()
+                    if not key.startswith('_'))
+
+    @classmethod
+    def from_config(cls, config):
+        """Take a snapshot of the parsed configuration
+
+        :param config: the ``TempestConfigPrivate`` which parsed the
+            configuration, its option group attributes become aliases
+        """
+        groups = {'DEFAULT': cls._group_values(_CONF)}
+        for key in set(_CONF):
+            if key not in groups['DEFAULT']:
+                value = _CONF[key]
+                if isinstance(value, cfg.ConfigOpts.GroupAttr):
+                    groups[key] = cls._group_values(value)
+        aliases = {}
+        for attr, value in vars(config).items():
+            if (isinstance(value, cfg.ConfigOpts.GroupAttr) and
+                    attr != value._group.name):
+                aliases[attr] = value._group.name
+        return cls(groups, aliases)
+
+    @staticmethod
+    def _group_values(group):
+        values = {}
+        for key in set(group):
+            try:
+                value = group[key]
+            except cfg.Error as e:
+                # e.g. a required option which is not set, it is left out
+                # of the snapshot and reading it raises NoSuchOptError
+                LOG.warning('Option %s is not part of the configuration '
+                            'snapshot: %s', key, e)
+                continue
+            if not isinstance(value, cfg.ConfigOpts.GroupAttr):
+                values[key] = value
+        return values
+
+    def save(self, path):
+        """Save the snapshot to a file, as JSON
+
+        Values which are not JSON types are saved as strings.
+        """
+        data = {'version': self.VERSION, 'groups': self._groups,
+                'aliases': self._aliases}
+        with open(path, 'w') as f:
+            f.write(json.dumps(data, default=str, sort_keys=True))
+
+    @classmethod
+    def load(cls, path):
+        """Load a snapshot saved with :py:meth:`save`
+
+        :raises InvalidConfiguration: if the file was saved by a different
+            version of the snapshot format
+        """
+        with open(path) as f:
+            data = json.loads(f.read())
+        if data.get('version') != cls.VERSION:
+            raise exceptions.InvalidConfiguration(
+                'Unsupported version %s of the configuration snapshot %s' %
+                (data.get('version'), path))
+        return cls(data['groups'], data['aliases'])
+
+    def register(self):
+        """Set up oslo.config and logging from the snapshot
+
+        This is what ``TempestConfigPrivate`` does after parsing the
+        configuration file: the options of Tempest and of the installed
+        plugins are registered and set to the values of the snapshot, so
+        code using oslo.config directly sees the same configuration, and
+        logging is set up.
+        """
+        logging.register_options(_CONF)
+        # The values all come from the snapshot, no configuration file is
+        # looked up in the default locations
+        _CONF([], project='tempest', default_config_files=[],
+              default_config_dirs=[])
+        register_opts()
+        for name, values in self._groups.items():
+            group = None if name == 'DEFAULT' else name
+            for key, value in values.items():
+                try:
+                    _CONF.set_override(key, value, group=group)
+                except (cfg.NoSuchOptError, cfg.NoSuchGroupError,
+                        ValueError):
+                    # Options which are not registered in this process,
+                    # e.g. of a plugin which failed to register them, or
+                    # values saved as strings which are not valid for the
+                    # type of their option. They are only in the snapshot.
+                    pass
+        logging.setup(_CONF, 'tempest')
+        logging.tempest_set_log_file('tempest.log')
+
+
 class TempestConfigProxy(object):
     _config = None
     _path = None
@@ -1590,27 +1821,68 @@ class TempestConfigProxy(object):
 
     def __getattr__(self, attr):
         if not self._config:
-            self._fix_log_levels()
-            lock_dir = os.path.join(tempfile.gettempdir(), 'tempest-lock')
-            lockutils.set_defaults(lock_dir)
-            self._config = TempestConfigPrivate(config_path=self._path)
+            self._load()
+        return getattr(self._config, attr)
 
-            # Pushing tempest internal service client configuration to the
-            # service clients register. Doing this in the config module ensures
-            # that the configuration is available by the time we register the
-            # service clients.
-            # NOTE(andreaf) This has to be done at the time the first
-            # attribute is accessed, to ensure all plugins have been already
-            # loaded, options registered, and _config is set.
-            _register_tempest_service_clients()
-
-            # Registering service clients and pushing their configuration to
-            # the service clients register. Doing this in the config module
-            # ensures that the configuration is available by the time we
-            # discover tests from plugins.
-            plugins.TempestTestPluginManager()._register_service_clients()
+    def _load(self):
+        self._fix_log_levels()
+        lock_dir = os.path.join(tempfile.gettempdir(), 'tempest-lock')
+        lockutils.set_defaults(lock_dir)
+        snapshot_path = os.environ.get(CONFIG_SNAPSHOT_ENV)
+        if snapshot_path:
+            snapshot = TempestConfigSnapshot.load(snapshot_path)
+            snapshot.register()
+            LOG.info("Using tempest configuration snapshot %s",
+                     snapshot_path)
+            self._set_snapshot(snapshot)
+        else:
+            self._config = TempestConfigPrivate(config_path=self._path)
 
-        return getattr(self._config, attr)
+        # Pushing tempest internal service client configuration to the
+        # service clients register. Doing this in the config module ensures
+        # that the configuration is available by the time we register the
+        # service clients.
+        # NOTE(andreaf) This has to be done at the time the first
+        # attribute is accessed, to ensure all plugins have been already
+        # loaded, options registered, and _config is set.
+        _register_tempest_service_clients()
+
+        # Registering service clients and pushing their configuration to
+        # the service clients register. Doing this in the config module
+        # ensures that the configuration is available by the time we
+        # discover tests from plugins.
+        plugins.TempestTestPluginManager()._register_service_clients()
+
+    def _set_snapshot(self, snapshot):
+        self._config = snapshot
+        # Setting the groups and options as instance attributes makes the
+        # lookups plain attribute reads which skip __getattr__
+        for attr, value in snapshot.to_dict().items():
+            if not hasattr(type(self), attr):
+                self.__dict__[attr] = value
+
+    def freeze(self):
+        """Replace the configuration with a frozen snapshot of it
+
+        The configuration is parsed if it was not yet, then all of its
+        groups and options are copied to a :py:class:`TempestConfigSnapshot`
+        and reading them becomes a plain attribute lookup. Changes made to
+        oslo.config afterwards, e.g. with ``set_override``, are not seen by
+        ``CONF`` anymore.
+
+        The snapshot can be saved and shared with other processes by
+        setting the ``TEMPEST_CONFIG_SNAPSHOT`` environment variable to the
+        path of the file, ``CONF`` then loads it instead of parsing the
+        configuration file.
+
+        :return: the TempestConfigSnapshot
+        """
+        if not self._config:
+            self._load()
+        if not isinstance(self._config, TempestConfigSnapshot):
+            self._set_snapshot(
+                TempestConfigSnapshot.from_config(self._config))
+        return self._config
 
     def set_config_path(self, path):
         self._path = path
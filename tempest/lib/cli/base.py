@@ -13,9 +13,12 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
 import os
 import shlex
 import subprocess
+import sys
+import threading
 
 from oslo_log import log as logging
 
@@ -374,6 +377,11 @@ class CLIClient(object):
         :param merge_stderr:  if True the stderr buffer is merged into stdout
         :type merge_stderr: boolean
         """
+        flags = self._auth_flags(cmd) + ' ' + flags
+        return execute(cmd, action, flags, params, fail_ok, merge_stderr,
+                       self.cli_dir, prefix=self.prefix)
+
+    def _auth_flags(self, cmd):
         creds = ('--os-username %s --os-password %s '
                  '--os-auth-url %s' %
                  (self.username,
@@ -394,11 +402,144 @@ class CLIClient(object):
         if self.project_domain_id is not None:
             creds += ' --os-project-domain-id %s' % self.project_domain_id
         if self.insecure:
-            flags = creds + ' --insecure ' + flags
-        else:
-            flags = creds + ' ' + flags
-        return execute(cmd, action, flags, params, fail_ok, merge_stderr,
-                       self.cli_dir, prefix=self.prefix)
+            creds += ' --insecure'
+        return creds
+
+    def batch(self):
+        """Return a CLIBatch running openstack commands in a single process
+
+        See :py:class:`CLIBatch`.
+        """
+        return CLIBatch(self)
+
+
+# Runs in the interpreter of the openstack client, which may not have tempest
+# installed. It reads the arguments of a command per line as a JSON list and
+# replies with a JSON line holding the return code and output of the command.
+_BATCH_DRIVER = """
+import contextlib
+import io
+import json
+import logging
+import sys
+
+from openstackclient import shell
+
+reply = sys.stdout
+for line in sys.stdin:
+    argv = json.loads(line)
+    stdout = io.StringIO()
+    stderr = stdout if argv.pop(0) else io.StringIO()
+    # The shell adds logging handlers on every run
+    logging.getLogger().handlers[:] = []
+    with contextlib.redirect_stdout(stdout), \\
+            contextlib.redirect_stderr(stderr):
+        try:
+            returncode = shell.main(argv)
+        except SystemExit as e:
+            returncode = (e.code if isinstance(e.code, int)
+                          else int(bool(e.code)))
+    reply.write(json.dumps({'returncode': returncode or 0,
+                            'stdout': stdout.getvalue(),
+                            'stderr': stderr.getvalue()}) + '\\n')
+    reply.flush()
+"""
+
+
+class CLIBatch(object):
+    """Run many openstack commands through a single long-lived process
+
+    Every ``CLIClient.openstack`` call starts a new process, which pays for
+    the fork/exec and the python startup and imports of the client. A batch
+    starts one process running the openstack client shell, with the python
+    interpreter of the ``openstack`` script, and sends it the commands one
+    after the other. The process is started on the first command and
+    stopped by :py:meth:`close` or at the end of a ``with`` block.
+
+    Example::
+
+        with cli_client.batch() as batch:
+            for name in names:
+                batch.openstack('server show', params=name)
+
+    :param cli_client: the CLIClient whose credentials and cli_dir are used
+    :type cli_client: CLIClient
+    """
+
+    def __init__(self, cli_client):
+        self.cli_client = cli_client
+        self._proc = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _interpreter(self):
+        """Return the command of the interpreter of the openstack script"""
+        path = os.path.join(self.cli_client.cli_dir, 'openstack')
+        try:
+            with open(path, 'rb') as f:
+                first_line = f.readline()
+        except (IOError, OSError):
+            first_line = b''
+        if first_line.startswith(b'#!'):
+            return shlex.split(os.fsdecode(first_line[2:]))
+        return [sys.executable]
+
+    def _start(self):
+        cmd = (shlex.split(self.cli_client.prefix) + self._interpreter() +
+               ['-c', _BATCH_DRIVER])
+        LOG.info("starting openstack batch process: '%s'", ' '.join(cmd[:-1]))
+        self._proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            universal_newlines=True)
+
+    def openstack(self, action, flags='', params='', fail_ok=False,
+                  merge_stderr=False):
+        """Executes openstack command for the given action.
+
+        The arguments and the result are the ones of
+        :py:meth:`CLIClient.openstack`.
+
+        :raises CommandFailed: if the command fails and fail_ok is False, or
+                               if the batch process died
+        """
+        flags = self.cli_client._auth_flags('openstack') + ' ' + flags
+        argv = shlex.split(' '.join([flags, action, params]))
+        cmd = ['openstack'] + argv
+        LOG.info("running in batch: '%s'", ' '.join(cmd))
+        with self._lock:
+            if self._proc is None:
+                self._start()
+            try:
+                self._proc.stdin.write(
+                    json.dumps([merge_stderr] + argv) + '\n')
+                self._proc.stdin.flush()
+                reply = self._proc.stdout.readline()
+            except (IOError, OSError):
+                reply = ''
+            if not reply:
+                returncode = self._proc.wait()
+                self._proc = None
+                raise exceptions.CommandFailed(
+                    returncode, cmd, '', 'The openstack batch process died')
+        result = json.loads(reply)
+        if not fail_ok and result['returncode'] != 0:
+            raise exceptions.CommandFailed(result['returncode'], cmd,
+                                           result['stdout'], result['stderr'])
+        return result['stdout']
+
+    def close(self):
+        """Stop the batch process"""
+        with self._lock:
+            if self._proc is not None:
+                self._proc.stdin.close()
+                self._proc.wait()
+                self._proc.stdout.close()
+                self._proc = None
 
 
 class ClientTestBase(base.BaseTestCase):
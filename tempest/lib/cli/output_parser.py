@@ -58,14 +58,8 @@ def details(output_lines, with_label=False):
 def listing(output_lines):
     """Return list of dicts with basic item info parsed from cli output."""
 
-    items = []
-    table_ = table(output_lines)
-    for row in table_['values']:
-        item = {}
-        for col_idx, col_key in enumerate(table_['headers']):
-            item[col_key] = row[col_idx]
-        items.append(item)
-    return items
+    headers, rows = _table_rows(output_lines)
+    return [dict(zip(headers, row)) for row in rows]
 
 
 def tables(output_lines):
@@ -89,7 +83,7 @@ def tables(output_lines):
         output_lines = output_lines.split('\n')
 
     for line in output_lines:
-        if delimiter_line.match(line):
+        if line.startswith('+-') and delimiter_line.match(line):
             if not start:
                 start = True
             elif not header:
@@ -126,8 +120,29 @@ def table(output_lines):
     Return dict with list of column names in 'headers' key and
     rows in 'values' key.
     """
-    table_ = {'headers': [], 'values': []}
-    columns = None
+    headers, rows = _table_rows(output_lines)
+    return {'headers': headers, 'values': rows}
+
+
+def columns(output_lines):
+    """Parse single table from cli output, by column.
+
+    Return dict with the list of values of each column, in the order of
+    the rows, by column name. The table is parsed in a single pass, which
+    is faster than listing() for large listings that are only looked up by
+    column, e.g. to check whether an id is listed.
+    """
+    headers, rows = _table_rows(output_lines)
+    if not rows:
+        return dict((header, []) for header in headers)
+    return dict(zip(headers, map(list, zip(*rows))))
+
+
+def _table_rows(output_lines):
+    """Return the column names and the rows of a single table."""
+    headers = []
+    rows = []
+    slices = None
 
     if not isinstance(output_lines, list):
         output_lines = output_lines.split('\n')
@@ -137,21 +152,20 @@ def table(output_lines):
         output_lines = output_lines[:-1]
 
     for line in output_lines:
-        if delimiter_line.match(line):
-            columns = _table_columns(line)
+        if line.startswith('+-') and delimiter_line.match(line):
+            slices = [slice(start, end)
+                      for start, end in _table_columns(line)]
             continue
         if '|' not in line:
             LOG.warning('skipping invalid table line: %s', line)
             continue
-        row = []
-        for col in columns:
-            row.append(line[col[0]:col[1]].strip())
-        if table_['headers']:
-            table_['values'].append(row)
+        row = [line[column].strip() for column in slices]
+        if headers:
+            rows.append(row)
         else:
-            table_['headers'] = row
+            headers = row
 
-    return table_
+    return headers, rows
 
 
 def _table_columns(first_table_row):
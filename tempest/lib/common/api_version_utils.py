@@ -12,6 +12,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import importlib
+
 import testtools
 
 from tempest.lib.common import api_version_request
@@ -20,6 +22,38 @@ from tempest.lib import exceptions
 
 LATEST_MICROVERSION = 'latest'
 
+# Schemas already selected by select_schema, keyed by the id of the
+# schema_versions_info list and the microversion. The list itself is kept
+# in the value so that its id cannot be reused by another list.
+_SELECTED_SCHEMAS = {}
+
+
+class LazySchemaModule(object):
+    """A schema module which is only imported when it is first used
+
+    It can be given as the ``schema`` of a ``schema_versions_info`` entry,
+    its attributes are those of the module, and ``select_schema`` returns
+    the module itself.
+
+    :param name: the dotted path of the module
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._module = None
+
+    def load(self):
+        """Import the module if needed and return it"""
+        if self._module is None:
+            self._module = importlib.import_module(self.name)
+        return self._module
+
+    def __getattr__(self, attr):
+        # Only called for the attributes which are not set in __init__
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
 
 class BaseMicroversionTest(object):
     """Mixin class for API microversion test class."""
@@ -182,3 +216,57 @@ def compare_version_header_to_response(api_microversion_header_name,
         return False
 
     return True
+
+
+def select_schema(schema_versions_info, microversion):
+    """Return the response schema matching a microversion
+
+    The selection is cached per schema_versions_info list and microversion,
+    so the version ranges are only parsed on the first call. The lists must
+    not be modified once they have been used.
+
+    :param schema_versions_info: List of dict which provides schema
+                                 information with range of valid versions.
+                                 The 'schema' of a dict can be a
+                                 LazySchemaModule, which is only imported
+                                 when it is first selected.
+    :param microversion: The requested microversion, None when requests are
+                         sent without microversion.
+
+    Example::
+
+     schema_versions_info = [
+         {'min': None, 'max': '2.1', 'schema': schemav21},
+         {'min': '2.2', 'max': '2.9', 'schema': schemav22},
+         {'min': '2.10', 'max': None,
+          'schema': LazySchemaModule('tempest.lib.api_schema.response.'
+                                     'compute.v2_10.servers')}]
+    """
+    key = (id(schema_versions_info), microversion)
+    cached = _SELECTED_SCHEMAS.get(key)
+    if cached is not None and cached[0] is schema_versions_info:
+        return cached[1]
+
+    selected = None
+    version = api_version_request.APIVersionRequest(microversion)
+    for items in schema_versions_info:
+        min_version = api_version_request.APIVersionRequest(items['min'])
+        max_version = api_version_request.APIVersionRequest(items['max'])
+        # This is case where microversion is None, which means request
+        # without microversion So select base schema.
+        if version.is_null() and items['min'] is None:
+            selected = items
+            break
+        # else select appropriate schema as per microversion
+        elif version.matches(min_version, max_version):
+            selected = items
+            break
+    if selected is None:
+        raise exceptions.JSONSchemaNotFound(
+            version=version.get_string(),
+            schema_versions_info=schema_versions_info)
+    schema = selected['schema']
+    if isinstance(schema, LazySchemaModule):
+        schema = schema.load()
+    _SELECTED_SCHEMAS[key] = (schema_versions_info, schema)
+    return schema
@@ -0,0 +1,305 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Record and replay the HTTP traffic of the REST clients
+
+While a cassette is enabled, every request sent through
+``RestClient.raw_request`` goes through it. In ``record`` mode the request
+is sent with the client ``http_obj`` and the response is stored with its
+timing. In ``replay`` mode the recorded responses are served instead, and
+no request reaches the network.
+
+A cassette is a directory holding:
+
+* ``interactions.jsonl``: one JSON line per request, with its method, URL,
+  response status and headers, elapsed time and the digests of the request
+  and response bodies
+* ``bodies/<sha256>.gz``: the gzip compressed bodies, stored once per
+  content
+
+The tokens found in the ``X-Auth-Token``, ``X-Subject-Token`` and
+``X-Service-Token`` headers and the token ids of the Keystone v2 token
+responses are redacted, as well as their occurrences in bodies, and the
+passwords are masked in the request bodies.
+
+Responses are replayed in the recorded order of the requests with the same
+method and URL. A request with a URL which was not recorded, e.g. because it
+includes a random resource name, is matched on its path only. The last
+response recorded for a request is served again if the request is sent more
+times than recorded, so that token renewals and polling loops keep working.
+"""
+
+import collections
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from urllib import parse as urlparse
+
+from oslo_log import log as logging
+from oslo_utils import strutils
+import urllib3
+
+from tempest.lib.common import http
+from tempest.lib import exceptions
+
+LOG = logging.getLogger(__name__)
+
+RECORD = 'record'
+REPLAY = 'replay'
+REDACTED = '<redacted>'
+SENSITIVE_HEADERS = ('x-auth-token', 'x-subject-token', 'x-service-token')
+
+_cassette = {}
+
+
+def enable(path, mode, latency=0.0):
+    """Enable a global cassette
+
+    :param path: the directory of the cassette
+    :param mode: ``record`` or ``replay``
+    :param latency: in replay mode, the fraction of the recorded latency to
+        reproduce: 1.0 to wait as long as the recorded request took, 0 to
+        answer immediately
+    """
+    disable()
+    _cassette['cassette'] = Cassette(path, mode, latency=latency)
+
+
+def disable():
+    """Disable the global cassette"""
+    cassette = _cassette.pop('cassette', None)
+    if cassette is not None:
+        cassette.close()
+
+
+def wrap(http_obj):
+    """Return the object to send requests with instead of http_obj
+
+    :return: the http_obj wrapped by the enabled cassette, or http_obj
+        itself if no cassette is enabled
+    """
+    cassette = _cassette.get('cassette')
+    if cassette is None:
+        return http_obj
+    return _CassetteHttp(cassette, http_obj)
+
+
+class Cassette(object):
+    """A recorded sequence of HTTP requests and responses
+
+    :param path: the directory of the cassette, created when recording
+    :param mode: ``record`` or ``replay``
+    :param latency: the fraction of the recorded latency reproduced when
+        replaying
+    """
+
+    def __init__(self, path, mode, latency=0.0):
+        if mode not in (RECORD, REPLAY):
+            raise exceptions.InvalidParam(invalid_param='mode=%s' % mode)
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._secrets = set()
+        self._queues = collections.defaultdict(collections.deque)
+        self._served = set()
+        self.interactions = []
+        if mode == REPLAY:
+            self._load()
+
+    def _body_path(self, digest):
+        return os.path.join(self.path, 'bodies', digest + '.gz')
+
+    def _store_body(self, data):
+        if not data:
+            return None
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        for secret in self._secrets:
+            data = data.replace(secret.encode('utf-8'), REDACTED.encode())
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._body_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(path, 'wb') as fd:
+                fd.write(data)
+        return digest
+
+    def _load_body(self, digest):
+        if digest is None:
+            return b''
+        with gzip.open(self._body_path(digest), 'rb') as fd:
+            return fd.read()
+
+    def _redact_headers(self, headers):
+        redacted = {}
+        for key, value in (headers or {}).items():
+            if key.lower() in SENSITIVE_HEADERS and value:
+                self._secrets.add(value)
+                value = REDACTED
+            redacted[key] = value
+        return redacted
+
+    def _redact_body_tokens(self, data):
+        """Add the token ids found in a Keystone v2 token response
+
+        The v2 API returns the token id in the ``access`` of the body,
+        there is no header to take it from.
+        """
+        if isinstance(data, bytes):
+            try:
+                data = data.decode('utf-8')
+            except UnicodeDecodeError:
+                return
+        if not isinstance(data, str) or '"access"' not in data:
+            return
+        try:
+            token = json.loads(data)['access']['token']['id']
+        except (ValueError, TypeError, KeyError):
+            return
+        if isinstance(token, str) and token:
+            self._secrets.add(token)
+
+    def record(self, method, url, headers, body, resp, data, elapsed,
+               stream=False):
+        """Store a request and its response"""
+        if isinstance(body, bytes):
+            try:
+                body = body.decode('utf-8')
+            except UnicodeDecodeError:
+                pass
+        if isinstance(body, str):
+            body = strutils.mask_password(body)
+        elif body is not None and not isinstance(body, bytes):
+            # File-like and generator bodies are streamed, not recorded
+            body = None
+        resp_headers = dict(resp.headers if stream else resp)
+        with self._lock:
+            # The request headers are not stored, but their tokens must be
+            # redacted from the bodies
+            self._redact_headers(headers)
+            self._redact_body_tokens(data)
+            interaction = {
+                'method': method,
+                'url': url,
+                'request': self._store_body(body),
+                'status': resp.status,
+                'reason': resp.reason,
+                'headers': self._redact_headers(resp_headers),
+                'body': self._store_body(data),
+                'elapsed': elapsed,
+                'stream': stream,
+            }
+            self.interactions.append(interaction)
+            os.makedirs(self.path, exist_ok=True)
+            with open(os.path.join(self.path, 'interactions.jsonl'),
+                      'a') as fd:
+                fd.write(json.dumps(interaction, sort_keys=True) + '\n')
+
+    def _load(self):
+        with open(os.path.join(self.path, 'interactions.jsonl')) as fd:
+            self.interactions = [json.loads(line) for line in fd if line]
+        for index, interaction in enumerate(self.interactions):
+            method, url = interaction['method'], interaction['url']
+            self._queues[(method, url)].append(index)
+            self._queues[(method, _path(url))].append(index)
+
+    def _next(self, queue):
+        # Skip the interactions already served through the other key of
+        # the same request, but always keep the last one to serve it again
+        while len(queue) > 1 and queue[0] in self._served:
+            queue.popleft()
+        index = queue.popleft() if len(queue) > 1 else queue[0]
+        self._served.add(index)
+        return self.interactions[index]
+
+    def replay(self, method, url):
+        """Return the recorded interaction for a request"""
+        with self._lock:
+            if (method, url) in self._queues:
+                return self._next(self._queues[(method, url)])
+            if (method, _path(url)) in self._queues:
+                LOG.debug('Replaying %s %s from a request to the same path',
+                          method, url)
+                return self._next(self._queues[(method, _path(url))])
+        raise exceptions.InteractionNotRecorded(path=self.path, method=method,
+                                                url=url)
+
+    def response(self, interaction):
+        """Build the response and body of a recorded interaction
+
+        :return: a ``(response, body)`` tuple like the ones returned by
+            ``http.ClosingHttp.request``
+        """
+        data = self._load_body(interaction['body'])
+        if interaction['stream']:
+            resp = urllib3.HTTPResponse(
+                body=io.BytesIO(data), headers=interaction['headers'],
+                status=interaction['status'], reason=interaction['reason'],
+                preload_content=False)
+            return resp, b''
+        return http.Response(interaction['headers'],
+                             status=interaction['status'],
+                             reason=interaction['reason']), data
+
+    def close(self):
+        with self._lock:
+            self._queues.clear()
+            self._served.clear()
+
+
+def _path(url):
+    return urlparse.urlsplit(url).path
+
+
+class _CassetteHttp(object):
+
+    def __init__(self, cassette, http_obj):
+        self.cassette = cassette
+        self.http_obj = http_obj
+
+    def request(self, url, method, headers=None, body=None,
+                preload_content=True, **kwargs):
+        if self.cassette.mode == REPLAY:
+            interaction = self.cassette.replay(method, url)
+            if self.cassette.latency:
+                time.sleep(interaction['elapsed'] * self.cassette.latency)
+            return self.cassette.response(interaction)
+
+        start = time.monotonic()
+        resp, data = self.http_obj.request(
+            url, method, headers=headers, body=body,
+            preload_content=preload_content, **kwargs)
+        stream = not preload_content
+        recorded_data = data
+        if stream:
+            # Read the whole streamed response to record it, and hand a copy
+            # of it to the caller
+            try:
+                recorded_data = resp.read()
+            finally:
+                resp.release_conn()
+            resp = urllib3.HTTPResponse(
+                body=io.BytesIO(recorded_data), headers=dict(resp.headers),
+                status=resp.status, reason=resp.reason,
+                preload_content=False)
+        elapsed = time.monotonic() - start
+        self.cassette.record(method, url, headers, body, resp,
+                             recorded_data, elapsed, stream=stream)
+        return resp, data
@@ -0,0 +1,168 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import sys
+import threading
+import time
+
+from oslo_log import log as logging
+import testtools
+
+from tempest.lib.common.utils import misc
+from tempest.lib.common.utils import test_utils
+from tempest.lib import exceptions
+
+LOG = logging.getLogger(__name__)
+
+_Deletion = collections.namedtuple(
+    '_Deletion', ['args', 'kwargs', 'start_time'])
+
+
+@misc.singleton
+class DeletionTracker(object):
+    """Wait for the deletion of many resources at once
+
+    ``RestClient.wait_for_resource_deletion`` blocks until a single resource
+    is gone, so waiting for several resources one after the other takes the
+    sum of their deletion times. The tracker instead records the resources
+    with :py:meth:`track`, which returns immediately, and :py:meth:`drain`
+    polls all of them until they are deleted, which takes as long as the
+    slowest deletion.
+
+    The resources of each client are checked together with
+    ``RestClient.deleted_resources``, which clients with a list API
+    override to check all of them with a single request. Resources tracked
+    with extra arguments for ``is_resource_deleted`` are checked one by one.
+
+    There is a single tracker per process, ``DeletionTracker()`` always
+    returns the same instance.
+
+    Example::
+
+        tracker = deletion_tracker.DeletionTracker()
+        for volume in volumes:
+            volumes_client.delete_volume(volume['id'])
+            tracker.track(volumes_client, volume['id'])
+        tracker.drain()
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = collections.OrderedDict()
+
+    def track(self, client, id, *args, **kwargs):
+        """Track the deletion of a resource without waiting for it
+
+        :param client: The ``RestClient`` of the resource, which implements
+            ``is_resource_deleted``
+        :param str id: The id of the resource
+        :param args: Extra positional arguments for ``is_resource_deleted``
+        :param kwargs: Extra keyword arguments for ``is_resource_deleted``
+        """
+        with self._lock:
+            self._pending[(client, id)] = _Deletion(
+                args, kwargs, int(time.time()))
+
+    def pending(self):
+        """Return the ``(client, id)`` pairs which are not deleted yet"""
+        with self._lock:
+            return list(self._pending)
+
+    def _check(self, client, deletions):
+        """Return the ids of deletions which are over, and the errors"""
+        done = set()
+        errors = []
+        batch = set(id for id, deletion in deletions.items()
+                    if not (deletion.args or deletion.kwargs))
+        if batch:
+            try:
+                done.update(client.deleted_resources(batch))
+            except exceptions.DeleteErrorException:
+                # Check the resources one by one to find the failed ones
+                LOG.debug('Failed deletion of a %s, checking the resources '
+                          'separately', client.resource_type)
+                batch = set()
+        for id, deletion in deletions.items():
+            if id in batch:
+                continue
+            try:
+                if client.is_resource_deleted(id, *deletion.args,
+                                              **deletion.kwargs):
+                    done.add(id)
+            except exceptions.DeleteErrorException:
+                done.add(id)
+                errors.append(sys.exc_info())
+        return done, errors
+
+    def _timeout(self, client, id, start_time):
+        end_time = int(time.time())
+        message = ('Failed to delete %(resource_type)s %(id)s within the '
+                   'required time (%(timeout)s s). Timer started at '
+                   '%(start_time)s. Timer ended at %(end_time)s. Waited for '
+                   '%(wait_time)s s.' %
+                   {'resource_type': client.resource_type, 'id': id,
+                    'timeout': client.build_timeout,
+                    'start_time': start_time, 'end_time': end_time,
+                    'wait_time': end_time - start_time})
+        caller = test_utils.find_test_caller()
+        if caller:
+            message = '(%s) %s' % (caller, message)
+        error = exceptions.TimeoutException(message)
+        return type(error), error, None
+
+    def drain(self):
+        """Wait until all the tracked resources are deleted
+
+        Every pass checks all the pending resources, grouped by client, and
+        then sleeps for the shortest ``build_interval`` of their clients.
+        A resource is given up when the ``build_timeout`` of its client has
+        elapsed since it was tracked. All the resources are waited for
+        whatever the outcome of the others.
+
+        :raises TimeoutException: If a resource was not deleted in time
+        :raises DeleteErrorException: If the deletion of a resource failed
+        :raises MultipleExceptions: If there was more than one error
+        """
+        errors = []
+        while True:
+            with self._lock:
+                pending = list(self._pending.items())
+            if not pending:
+                break
+            by_client = collections.OrderedDict()
+            for (client, id), deletion in pending:
+                by_client.setdefault(client, {})[id] = deletion
+            now = int(time.time())
+            for client, deletions in by_client.items():
+                done, client_errors = self._check(client, deletions)
+                errors.extend(client_errors)
+                for id, deletion in deletions.items():
+                    if id not in done:
+                        if now - deletion.start_time < client.build_timeout:
+                            continue
+                        errors.append(
+                            self._timeout(client, id, deletion.start_time))
+                    with self._lock:
+                        self._pending.pop((client, id), None)
+            with self._lock:
+                intervals = [client.build_interval
+                             for client, _ in self._pending]
+            if intervals:
+                time.sleep(min(intervals))
+        if len(errors) == 1:
+            raise errors[0][1].with_traceback(errors[0][2])
+        if errors:
+            raise testtools.MultipleExceptions(*errors)
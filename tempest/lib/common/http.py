@@ -16,10 +16,50 @@
 import urllib3
 
 
+class Response(dict):
+    """The status and headers of a response of the HTTP clients
+
+    The header names are lowercased. Besides the headers, the ``status``
+    key holds the status code as a string and the ``content-location`` key
+    the URL of the request. The class defines ``__slots__``, so its
+    instances do not carry an attribute dict.
+
+    :param headers: a mapping of the response headers
+    :param status: the status code of the response
+    :param reason: the reason phrase of the response
+    :param version: the HTTP version of the response, e.g. 11 for HTTP/1.1
+    :param url: the URL of the request, if known
+    """
+
+    __slots__ = ('status', 'reason', 'version')
+
+    def __init__(self, headers=None, status=None, reason=None, version=11,
+                 url=None):
+        super(Response, self).__init__()
+        for key, value in (headers or {}).items():
+            # We assume HTTP header name to be string, not random
+            # bytes, thus ensure we have string keys.
+            self[str(key).lower()] = value
+        self.status = status
+        self['status'] = str(status)
+        self.reason = reason
+        self.version = version
+        if url is not None:
+            self['content-location'] = url
+
+    @classmethod
+    def from_urllib3(cls, response, url):
+        """Return the Response of a urllib3 response to a request on url"""
+        return cls(response.headers, status=response.status,
+                   reason=response.reason, version=response.version, url=url)
+
+
 class ClosingProxyHttp(urllib3.ProxyManager):
     def __init__(self, proxy_url, disable_ssl_certificate_validation=False,
-                 ca_certs=None, timeout=None, follow_redirects=True):
+                 ca_certs=None, timeout=None, follow_redirects=True,
+                 keep_alive=False, maxsize=None):
         self.follow_redirects = follow_redirects
+        self.keep_alive = keep_alive
         kwargs = {}
 
         if disable_ssl_certificate_validation:
@@ -32,23 +72,20 @@ class ClosingProxyHttp(urllib3.ProxyManager):
         if timeout:
             kwargs['timeout'] = timeout
 
+        if maxsize:
+            # Block instead of opening extra connections, so the pool size
+            # also bounds the number of connections open to the server.
+            kwargs['maxsize'] = maxsize
+            kwargs['block'] = True
+
         super(ClosingProxyHttp, self).__init__(proxy_url, **kwargs)
 
     def request(self, url, method, *args, **kwargs):
-
-        class Response(dict):
-            def __init__(self, info):
-                for key, value in info.getheaders().items():
-                    self[key.lower()] = value
-                self.status = info.status
-                self['status'] = str(self.status)
-                self.reason = info.reason
-                self.version = info.version
-                self['content-location'] = url
-
-        original_headers = kwargs.get('headers', {})
-        new_headers = dict(original_headers, connection='close')
-        new_kwargs = dict(kwargs, headers=new_headers)
+        new_kwargs = kwargs
+        if not self.keep_alive:
+            original_headers = kwargs.get('headers', {})
+            new_headers = dict(original_headers, connection='close')
+            new_kwargs = dict(kwargs, headers=new_headers)
 
         if self.follow_redirects:
             # Follow up to 5 redirections. Don't raise an exception if
@@ -65,21 +102,25 @@ class ClosingProxyHttp(urllib3.ProxyManager):
         # loaded by the HTTPConnection class in urllib3. This line can be
         # removed once we require a newer version of urllib3 (e.g., 2.2.3) that
         # does not retain certificates in memory for each HTTPConnection
-        # managed by the PoolManager.
-        self.clear()
+        # managed by the PoolManager. Keep-alive pools are shared between
+        # threads, so they are only cleared by their owner once it is done.
+        if not self.keep_alive:
+            self.clear()
 
         if not kwargs.get('preload_content', True):
             # This means we asked urllib3 for streaming content, so we
             # need to return the raw response and not read any data yet
             return r, b''
         else:
-            return Response(r), r.data
+            return Response.from_urllib3(r, url), r.data
 
 
 class ClosingHttp(urllib3.poolmanager.PoolManager):
     def __init__(self, disable_ssl_certificate_validation=False,
-                 ca_certs=None, timeout=None, follow_redirects=True):
+                 ca_certs=None, timeout=None, follow_redirects=True,
+                 keep_alive=False, maxsize=None):
         self.follow_redirects = follow_redirects
+        self.keep_alive = keep_alive
         kwargs = {}
 
         if disable_ssl_certificate_validation:
@@ -92,25 +133,20 @@ class ClosingHttp(urllib3.poolmanager.PoolManager):
         if timeout:
             kwargs['timeout'] = timeout
 
+        if maxsize:
+            # Block instead of opening extra connections, so the pool size
+            # also bounds the number of connections open to the server.
+            kwargs['maxsize'] = maxsize
+            kwargs['block'] = True
+
         super(ClosingHttp, self).__init__(**kwargs)
 
     def request(self, url, method, *args, **kwargs):
-
-        class Response(dict):
-            def __init__(self, info):
-                for key, value in info.getheaders().items():
-                    # We assume HTTP header name to be string, not random
-                    # bytes, thus ensure we have string keys.
-                    self[str(key).lower()] = value
-                self.status = info.status
-                self['status'] = str(self.status)
-                self.reason = info.reason
-                self.version = info.version
-                self['content-location'] = url
-
-        original_headers = kwargs.get('headers', {})
-        new_headers = dict(original_headers, connection='close')
-        new_kwargs = dict(kwargs, headers=new_headers)
+        new_kwargs = kwargs
+        if not self.keep_alive:
+            original_headers = kwargs.get('headers', {})
+            new_headers = dict(original_headers, connection='close')
+            new_kwargs = dict(kwargs, headers=new_headers)
 
         if self.follow_redirects:
             # Follow up to 5 redirections. Don't raise an exception if
@@ -127,12 +163,14 @@ class ClosingHttp(urllib3.poolmanager.PoolManager):
         # loaded by the HTTPConnection class in urllib3. This line can be
         # removed once we require a newer version of urllib3 (e.g., 2.2.3) that
         # does not retain certificates in memory for each HTTPConnection
-        # managed by the PoolManager.
-        self.clear()
+        # managed by the PoolManager. Keep-alive pools are shared between
+        # threads, so they are only cleared by their owner once it is done.
+        if not self.keep_alive:
+            self.clear()
 
         if not kwargs.get('preload_content', True):
             # This means we asked urllib3 for streaming content, so we
             # need to return the raw response and not read any data yet
             return r, b''
         else:
-            return Response(r), r.data
+            return Response.from_urllib3(r, url), r.data
@@ -12,6 +12,8 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
+import threading
+
 import jsonschema
 from oslo_serialization import base64
 from oslo_utils import timeutils
@@ -20,6 +22,15 @@ from oslo_utils import timeutils
 JSONSCHEMA_VALIDATOR = jsonschema.Draft4Validator
 FORMAT_CHECKER = JSONSCHEMA_VALIDATOR.FORMAT_CHECKER
 
+# Maximum number of validators kept by get_validator
+VALIDATOR_CACHE_SIZE = 1024
+
+# Validators created by get_validator, keyed by the id of their schema. The
+# schema itself is kept in the value so that its id cannot be reused by
+# another object while it is cached.
+_VALIDATORS = {}
+_VALIDATORS_LOCK = threading.Lock()
+
 
 # NOTE(gmann): Add customized format checker for 'date-time' format because:
 # 1. jsonschema needs strict_rfc3339 or isodate module to be installed
@@ -51,3 +62,42 @@ def _validate_base64_format(instance):
         return False
 
     return True
+
+
+def get_validator(schema):
+    """Return a validator for a JSON schema
+
+    Validators are cached and shared by all the clients validating against
+    the same schema object, so the schema itself is only checked once
+    instead of on every validation. Schemas must not be modified once they
+    have been used for validation.
+
+    :param dict schema: JSON schema to validate against
+    :raises jsonschema.SchemaError: if the schema is invalid
+    """
+    cached = _VALIDATORS.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    JSONSCHEMA_VALIDATOR.check_schema(schema)
+    validator = JSONSCHEMA_VALIDATOR(schema, format_checker=FORMAT_CHECKER)
+    with _VALIDATORS_LOCK:
+        if len(_VALIDATORS) >= VALIDATOR_CACHE_SIZE:
+            # Evict the oldest validator
+            del _VALIDATORS[next(iter(_VALIDATORS))]
+        _VALIDATORS[id(schema)] = (schema, validator)
+    return validator
+
+
+def validate(instance, schema):
+    """Validate an instance against a JSON schema
+
+    This behaves like jsonschema.validate using the tempest validator and
+    format checker, but with a cached validator.
+
+    :raises jsonschema.ValidationError: if the instance is invalid
+    :raises jsonschema.SchemaError: if the schema is invalid
+    """
+    error = jsonschema.exceptions.best_match(
+        get_validator(schema).iter_errors(instance))
+    if error is not None:
+        raise error
@@ -0,0 +1,263 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Cache the responses of discovery-style GET requests
+
+While the cache is enabled, the ``GET`` requests sent through
+``RestClient.raw_request`` to list a whitelisted collection, like the
+extensions or the flavors of a service, are answered from the cache for
+``ttl`` seconds. The requests for a single resource of a collection, or for
+anything below it, are never cached. The responses are cached per token,
+so that they are never shared between credentials or scopes, and per
+request headers, so that e.g. the responses of different microversions are
+kept apart.
+
+A ``POST``, ``PUT``, ``PATCH`` or ``DELETE`` request on a collection drops
+the cached responses of this collection on the same host, e.g. creating a
+project invalidates the cached project listings and lookups.
+"""
+
+import collections
+import copy
+import re
+import threading
+import time
+from urllib import parse as urlparse
+
+from oslo_log import log as logging
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_TTL = 30.0
+DEFAULT_MAX_SIZE = 1024
+# Name of the collection of the version documents of the services
+VERSIONS = 'versions'
+DEFAULT_COLLECTIONS = (VERSIONS, 'extensions', 'flavors', 'images',
+                       'networks', 'subnets', 'projects', 'users', 'domains',
+                       'roles', 'role_assignments')
+# Collections whose cached responses also depend on the resources of another
+# collection
+DEPENDENT_COLLECTIONS = {
+    'roles': ('role_assignments',),
+    'users': ('role_assignments',),
+    'projects': ('role_assignments',),
+    'domains': ('role_assignments',),
+}
+MUTATING_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+CACHED_STATUSES = (200, 203, 300)
+TOKEN_HEADER = 'x-auth-token'
+VERSION_RE = re.compile(r'^v\d+(\.\d+)?$')
+# Last segment of the detailed listings of a collection, e.g. flavors/detail
+DETAIL = 'detail'
+
+_cache = {}
+
+
+def enable(ttl=DEFAULT_TTL, max_size=DEFAULT_MAX_SIZE,
+           cached_collections=DEFAULT_COLLECTIONS):
+    """Enable the global response cache
+
+    :param ttl: the number of seconds a response is served from the cache
+    :param max_size: the maximum number of cached responses, the least
+        recently used ones are evicted first
+    :param cached_collections: the names of the collections whose
+        responses are cached, ``versions`` for the version documents of
+        the services
+    """
+    _cache['cache'] = ResponseCache(ttl=ttl, max_size=max_size,
+                                    cached_collections=cached_collections)
+
+
+def disable():
+    """Disable the global response cache"""
+    _cache.clear()
+
+
+def is_enabled():
+    return 'cache' in _cache
+
+
+def stats():
+    """Return the statistics of the global response cache
+
+    :return: a dict with the number of ``hits``, ``misses``, ``evictions``
+        and ``invalidations``, empty if the cache is not enabled
+    """
+    cache = _cache.get('cache')
+    if cache is None:
+        return {}
+    return cache.stats()
+
+
+def wrap(http_obj):
+    """Return the object to send requests with instead of http_obj
+
+    :return: the http_obj wrapped by the enabled cache, or http_obj itself
+        if the cache is not enabled
+    """
+    cache = _cache.get('cache')
+    if cache is None:
+        return http_obj
+    return _CachingHttp(cache, http_obj)
+
+
+class ResponseCache(object):
+    """A TTL and LRU bound cache of HTTP responses
+
+    :param ttl: the number of seconds a response is served from the cache
+    :param max_size: the maximum number of cached responses
+    :param cached_collections: the names of the collections whose
+        responses are cached
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, max_size=DEFAULT_MAX_SIZE,
+                 cached_collections=DEFAULT_COLLECTIONS):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.collections = frozenset(cached_collections)
+        self._lock = threading.Lock()
+        # Entries by key, from the least to the most recently used
+        self._entries = collections.OrderedDict()
+        self._stats = collections.Counter()
+
+    def collection(self, url):
+        """Return the (host, name) of the cached collection a URL lists
+
+        Only the listings of a collection are cached, i.e. the URLs whose
+        path ends with the collection, or with its ``detail`` listing, and
+        has no other cached collection before it. A resource of a
+        collection, like ``images/<id>``, and anything below it, like
+        ``users/<id>/projects``, are not cached.
+
+        :return: the host of the URL and the name of the collection it
+            lists, or None if the URL is not cached
+        """
+        parts = urlparse.urlsplit(url)
+        segments = [segment for segment in parts.path.split('/') if segment]
+        listing = segments[:-1] if segments[-1:] == [DETAIL] else segments
+        if (listing and listing[-1] in self.collections and
+                not self.collections.intersection(listing[:-1])):
+            return parts.netloc, listing[-1]
+        # The version documents are at the root of the endpoints, e.g.
+        # http://host/compute/, or at their versions, e.g. http://host/v3
+        if VERSIONS in self.collections and (
+                not segments or parts.path.endswith('/') or
+                VERSION_RE.match(segments[-1])):
+            return parts.netloc, VERSIONS
+        return None
+
+    def _invalidated(self, url):
+        parts = urlparse.urlsplit(url)
+        names = set()
+        for segment in parts.path.split('/'):
+            if segment in self.collections:
+                names.add(segment)
+                names.update(DEPENDENT_COLLECTIONS.get(segment, ()))
+        return set((parts.netloc, name) for name in names)
+
+    @staticmethod
+    def key(url, headers):
+        """Return the cache key of a request
+
+        The token of the request identifies its credentials and scope, and
+        the other headers are part of the key as they can change the
+        response, e.g. the microversion headers.
+        """
+        token = None
+        other_headers = []
+        for name, value in (headers or {}).items():
+            if name.lower() == TOKEN_HEADER:
+                token = value
+            else:
+                other_headers.append((name.lower(), value))
+        return token, url, tuple(sorted(other_headers))
+
+    def get(self, key):
+        """Return the cached (resp, body) of a key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+        return copy.copy(entry[2]), entry[3]
+
+    def put(self, key, collection, resp, body):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, collection,
+                                  copy.copy(resp), body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, url):
+        """Drop the cached responses of the collections of a URL"""
+        invalidated = self._invalidated(url)
+        if not invalidated:
+            return
+        with self._lock:
+            keys = [key for key, entry in self._entries.items()
+                    if entry[1] in invalidated]
+            for key in keys:
+                del self._entries[key]
+            self._stats['invalidations'] += len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return dict(hits=self._stats['hits'],
+                        misses=self._stats['misses'],
+                        evictions=self._stats['evictions'],
+                        invalidations=self._stats['invalidations'],
+                        size=len(self._entries))
+
+
+class _CachingHttp(object):
+
+    def __init__(self, cache, http_obj):
+        self.cache = cache
+        self.http_obj = http_obj
+
+    def request(self, url, method, headers=None, body=None,
+                preload_content=True, **kwargs):
+        collection = None
+        if method.upper() == 'GET' and preload_content:
+            collection = self.cache.collection(url)
+        elif method.upper() in MUTATING_METHODS:
+            self.cache.invalidate(url)
+        if collection is None:
+            return self.http_obj.request(
+                url, method, headers=headers, body=body,
+                preload_content=preload_content, **kwargs)
+
+        key = self.cache.key(url, headers)
+        cached = self.cache.get(key)
+        if cached is not None:
+            LOG.debug('Response of GET %s served from the cache', url)
+            return cached
+        resp, data = self.http_obj.request(
+            url, method, headers=headers, body=body,
+            preload_content=preload_content, **kwargs)
+        if resp.status in CACHED_STATUSES:
+            self.cache.put(key, collection, resp, data)
+        return resp, data
@@ -15,6 +15,7 @@
 #    under the License.
 
 from collections import abc
+import copy
 import email.utils
 import re
 import time
@@ -27,9 +28,11 @@ from oslo_log import log as logging
 from oslo_log import versionutils
 from oslo_serialization import jsonutils as json
 
+from tempest.lib.common import cassette
 from tempest.lib.common import http
 from tempest.lib.common import jsonschema_validator
 from tempest.lib.common import profiler
+from tempest.lib.common import response_cache
 from tempest.lib.common.utils import test_utils
 from tempest.lib import exceptions
 
@@ -120,18 +123,47 @@ class RestClient(object):
                                        'retry-after', 'server',
                                        'vary', 'www-authenticate'))
         self.dscv = disable_ssl_certificate_validation
+        self.ca_certs = ca_certs
+        self.http_timeout = http_timeout
+        self.proxy_url = proxy_url
+        self.follow_redirects = follow_redirects
 
-        if proxy_url:
-            self.http_obj = http.ClosingProxyHttp(
-                proxy_url,
-                disable_ssl_certificate_validation=self.dscv,
-                ca_certs=ca_certs,
-                timeout=http_timeout, follow_redirects=follow_redirects)
-        else:
-            self.http_obj = http.ClosingHttp(
+        self.http_obj = self._create_http_obj()
+
+    def _create_http_obj(self, keep_alive=False, maxsize=None):
+        """Create the http object used to send requests
+
+        :param bool keep_alive: Keep connections open and pooled between
+                                requests, so that the returned object can be
+                                shared by several threads.
+        :param int maxsize: Maximum number of connections kept per host
+        """
+        if self.proxy_url:
+            return http.ClosingProxyHttp(
+                self.proxy_url,
                 disable_ssl_certificate_validation=self.dscv,
-                ca_certs=ca_certs,
-                timeout=http_timeout, follow_redirects=follow_redirects)
+                ca_certs=self.ca_certs,
+                timeout=self.http_timeout,
+                follow_redirects=self.follow_redirects,
+                keep_alive=keep_alive, maxsize=maxsize)
+        return http.ClosingHttp(
+            disable_ssl_certificate_validation=self.dscv,
+            ca_certs=self.ca_certs,
+            timeout=self.http_timeout,
+            follow_redirects=self.follow_redirects,
+            keep_alive=keep_alive, maxsize=maxsize)
+
+    def pooled_client(self, concurrency):
+        """Return a copy of this client sharing a keep-alive connection pool
+
+        The copy can be used concurrently by up to ``concurrency`` threads.
+        The caller is responsible for calling ``http_obj.clear()`` on it once
+        done to close the pooled connections.
+        """
+        client = copy.copy(self)
+        client.http_obj = self._create_http_obj(keep_alive=True,
+                                                maxsize=concurrency)
+        return client
 
     def get_headers(self, accept_type=None, send_type=None):
         """Return the default headers which will be used with outgoing requests
@@ -663,7 +695,8 @@ class RestClient(object):
         # Do the actual request, and time it
         start = time.time()
         self._log_request_start(method, url)
-        resp, resp_body = self.http_obj.request(
+        http_obj = response_cache.wrap(cassette.wrap(self.http_obj))
+        resp, resp_body = http_obj.request(
             url, method, headers=headers,
             body=body, chunked=chunked, preload_content=preload)
         end = time.time()
@@ -993,6 +1026,19 @@ class RestClient(object):
                 raise exceptions.TimeoutException(message)
             time.sleep(self.build_interval)
 
+    def deleted_resources(self, ids):
+        """Return the ids of the resources which are deleted
+
+        The default implementation calls is_resource_deleted for each id.
+        Clients with a list API can override it to check all of the
+        resources with a single request, it's used by the
+        :py:class:`tempest.lib.common.deletion_tracker.DeletionTracker`.
+
+        :param ids: The ids of the resources to check
+        :return: set of the ids of the deleted resources
+        """
+        return set(id for id in ids if self.is_resource_deleted(id))
+
     def wait_for_resource_activation(self, id):
         """Waits for a resource to become active
 
@@ -1110,9 +1156,7 @@ class RestClient(object):
             body_schema = schema.get('response_body')
             if body_schema:
                 try:
-                    jsonschema.validate(body, body_schema,
-                                        cls=JSONSCHEMA_VALIDATOR,
-                                        format_checker=FORMAT_CHECKER)
+                    jsonschema_validator.validate(body, body_schema)
                 except jsonschema.ValidationError as ex:
                     msg = ("HTTP response body is invalid (%s)" % ex)
                     raise exceptions.InvalidHTTPResponseBody(msg)
@@ -1125,9 +1169,7 @@ class RestClient(object):
             header_schema = schema.get('response_header')
             if header_schema:
                 try:
-                    jsonschema.validate(resp, header_schema,
-                                        cls=JSONSCHEMA_VALIDATOR,
-                                        format_checker=FORMAT_CHECKER)
+                    jsonschema_validator.validate(resp, header_schema)
                 except jsonschema.ValidationError as ex:
                     msg = ("HTTP response header is invalid (%s)" % ex)
                     raise exceptions.InvalidHTTPResponseHeader(msg)
@@ -1150,6 +1192,8 @@ class ResponseBody(dict):
     can extract the response if needed.
     """
 
+    __slots__ = ('response',)
+
     def __init__(self, response, body=None):
         body_data = body or {}
         self.update(body_data)
@@ -1165,6 +1209,8 @@ class ResponseBodyData(object):
 
     """
 
+    __slots__ = ('response', 'data')
+
     def __init__(self, response, data):
         self.response = response
         self.data = data
@@ -1180,6 +1226,8 @@ class ResponseBodyList(list):
     can extract the response if needed.
     """
 
+    __slots__ = ('response',)
+
     def __init__(self, response, body=None):
         body_data = body or []
         self.extend(body_data)
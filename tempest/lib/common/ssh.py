@@ -17,21 +17,22 @@ import hashlib
 import io
 import select
 import socket
+import threading
 import time
 import warnings
 
 from oslo_log import log as logging
 
+from tempest.lib.common.utils import misc
 from tempest.lib import exceptions
 
-
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore")
-    import paramiko
-
+# paramiko is only loaded when the first SSH client is created
+paramiko = misc.lazy_import('paramiko')
 
 LOG = logging.getLogger(__name__)
 
+_PARAMIKO_LOCK = threading.Lock()
+
 
 def get_fingerprint(self):
     """Patch paramiko
@@ -45,7 +46,12 @@ def get_fingerprint(self):
     return hashlib.md5(self.asbytes(), usedforsecurity=False).digest()
 
 
-paramiko.pkey.PKey.get_fingerprint = get_fingerprint
+def _load_paramiko():
+    """Finish the deferred import of paramiko and apply the FIPS patch"""
+    with _PARAMIKO_LOCK, warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        if paramiko.pkey.PKey.get_fingerprint is not get_fingerprint:
+            paramiko.pkey.PKey.get_fingerprint = get_fingerprint
 
 
 class Client(object):
@@ -81,6 +87,7 @@ class Client(object):
             in some tests may need this set as False.
         :type proxy_client: ``tempest.lib.common.ssh.Client`` object
         """
+        _load_paramiko()
         self.host = host
         self.username = username
         self.port = port
@@ -13,7 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import itertools
+import hashlib
+import io
+import os
 import random
 import string
 import uuid
@@ -158,20 +160,123 @@ def arbitrary_string(size=4, base_text=None):
     """
     if not base_text:
         base_text = 'test'
-    return ''.join(itertools.islice(itertools.cycle(base_text), size))
+    return (base_text * (size // len(base_text) + 1))[:size]
 
 
 def random_bytes(size=1024):
     """Return size randomly selected bytes as a string
 
+    Use random_data or RandomDataStream for payloads larger than 1MiB.
+
     :param int size: a returning bytes size
     :return: size randomly bytes
     :rtype: string
     """
     if size > 1 << 20:
         raise RuntimeError('Size should be less than 1MiB')
-    return b''.join([bytes((random.randint(0, 255),))
-                     for i in range(size)])
+    return random.randbytes(size)
+
+
+def random_data(size, seed=None):
+    """Return size random bytes generated in bulk
+
+    :param int size: a returning bytes size
+    :param seed: if given, the bytes are generated from a pseudo-random
+                 generator initialized with it, so the same seed always
+                 returns the same bytes. They are the same as the ones read
+                 from a RandomDataStream with the same seed.
+    :return: size random bytes
+    :rtype: bytes
+    """
+    if seed is None:
+        return os.urandom(size)
+    return RandomDataStream(size, seed=seed).read()
+
+
+class RandomDataStream(io.RawIOBase):
+    """Read-only file-like object returning random bytes
+
+    The bytes are generated as they are read, so payloads of any size can be
+    passed to clients accepting file-like objects, like store_image_file or
+    create_object, without holding them in memory. The checksums of the data
+    are computed while it is read.
+
+    :param int size: Number of bytes returned before reaching the end
+    :param seed: if given, the bytes are generated from a pseudo-random
+                 generator initialized with it, so the content and its
+                 checksums are reproducible and known before reading it.
+                 Otherwise they are read from os.urandom.
+    :param tuple hash_algorithms: names of the hashlib algorithms computed
+                                  while the data is read
+    """
+
+    # Seeded streams are generated in blocks of this size, so the content
+    # does not depend on the size of the reads
+    BLOCK_SIZE = 64 * 1024
+
+    def __init__(self, size, seed=None, hash_algorithms=('md5',)):
+        super(RandomDataStream, self).__init__()
+        self.size = size
+        self.seed = seed
+        self.position = 0
+        self.hash_algorithms = hash_algorithms
+        self._hashes = dict(
+            (algorithm, hashlib.new(algorithm, usedforsecurity=False))
+            for algorithm in hash_algorithms)
+        self._random = random.Random(seed) if seed is not None else None
+        self._block = b''
+
+    def __len__(self):
+        return self.size
+
+    def readable(self):
+        return True
+
+    def _generate(self, size):
+        if self._random is None:
+            return os.urandom(size)
+        if len(self._block) < size:
+            # Generate the missing blocks at once, only the unread tail of
+            # the last block is kept for the next reads
+            count = -(-(size - len(self._block)) // self.BLOCK_SIZE)
+            self._block += self._random.randbytes(count * self.BLOCK_SIZE)
+        data, self._block = self._block[:size], self._block[size:]
+        return data
+
+    def readinto(self, buf):
+        size = min(len(buf), self.size - self.position)
+        if size <= 0:
+            return 0
+        data = self._generate(size)
+        buf[:size] = data
+        for checksum in self._hashes.values():
+            checksum.update(data)
+        self.position += size
+        return size
+
+    def hexdigest(self, algorithm='md5'):
+        """Return the checksum of the whole content of the stream
+
+        :param str algorithm: one of the hash_algorithms of the stream
+        :raises ValueError: if the algorithm is not one of the
+                            hash_algorithms of the stream, or if the stream
+                            is not seeded and was not fully read yet, so its
+                            checksum is not known
+        """
+        if algorithm not in self._hashes:
+            raise ValueError('The %s checksum of the stream is not computed, '
+                             'it computes %s' % (
+                                 algorithm, ', '.join(self.hash_algorithms)))
+        if self.position == self.size:
+            return self._hashes[algorithm].hexdigest()
+        if self.seed is None:
+            raise ValueError('The checksum of an unseeded stream is only '
+                             'known once it is fully read')
+        stream = RandomDataStream(self.size, seed=self.seed,
+                                  hash_algorithms=(algorithm,))
+        while stream.read(self.BLOCK_SIZE * 16):
+            pass
+        return stream.hexdigest(algorithm)
 
 
 # Courtesy of http://stackoverflow.com/a/312464
@@ -13,13 +13,44 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import importlib.util
+import sys
+import threading
+
 
 def singleton(cls):
     """Simple wrapper for classes that should only have a single instance."""
     instances = {}
+    lock = threading.RLock()
 
     def getinstance():
         if cls not in instances:
-            instances[cls] = cls()
+            with lock:
+                if cls not in instances:
+                    instances[cls] = cls()
         return instances[cls]
     return getinstance
+
+
+def lazy_import(name):
+    """Import a module, deferring its execution until it is first used
+
+    The returned module is registered in ``sys.modules`` like a regular
+    import, but its code only runs when one of its attributes is accessed.
+    This is meant for heavy dependencies which are not needed by every
+    tempest command.
+
+    :param name: the absolute name of the module
+    :raise ImportError: if the module cannot be found
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError('No module named %r' % name, name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
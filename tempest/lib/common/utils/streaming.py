@@ -0,0 +1,131 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import hashlib
+import time
+
+from tempest.lib import exceptions
+
+# Size of the buffer the response data is read into
+BUFFER_SIZE = 4 * 1024 * 1024
+DEFAULT_ALGORITHMS = ('md5', 'sha256')
+
+
+class StreamStats(object):
+    """Summary of a streamed download
+
+    :param int size: Number of bytes downloaded
+    :param float elapsed: Wall clock duration of the download in seconds
+    :param dict checksums: The hexadecimal digest of the downloaded data for
+                           each hash algorithm, e.g. ``{'md5': '...'}``
+    """
+
+    def __init__(self, size, elapsed, checksums):
+        self.size = size
+        self.elapsed = elapsed
+        self.checksums = checksums
+
+    @property
+    def throughput(self):
+        """Transfer rate in bytes per second"""
+        if not self.elapsed:
+            return float(self.size)
+        return self.size / self.elapsed
+
+    def __str__(self):
+        return "%d bytes, %.3f seconds, %.2f MiB/s" % (
+            self.size, self.elapsed, self.throughput / (1024 * 1024))
+
+
+def _dest_buffer(dest, size):
+    view = memoryview(dest).cast('B')
+    if view.readonly:
+        raise exceptions.InvalidParam(invalid_param='dest is read-only')
+    if size is not None and size > len(view):
+        raise exceptions.InvalidParam(
+            invalid_param='dest of %d bytes for %d bytes of data' % (
+                len(view), size))
+    return view
+
+
+def stream_response(resp, dest=None, algorithms=DEFAULT_ALGORITHMS,
+                    buffer_size=BUFFER_SIZE):
+    """Stream the data of a response to a file or a buffer
+
+    The data is read with ``readinto`` into a buffer which is reused for
+    the whole response, or directly into ``dest`` when it is a buffer, so
+    the response is never held in memory as a whole. The checksums of the
+    data are computed while it is read. The connection of the response is
+    released once done.
+
+    :param resp: a urllib3 response, as returned by the REST clients for a
+                 ``chunked`` GET request
+    :param dest: Path of the file to write, a file-like object with a
+                 ``write`` method, a writable buffer like a ``bytearray``
+                 large enough for the data, or None to only compute the
+                 checksums
+    :param algorithms: Names of the ``hashlib`` algorithms of the checksums,
+                       e.g. ``os_hash_algo`` of an image
+    :param int buffer_size: Size in bytes of the read buffer
+    :rtype: StreamStats
+    :return: the size, duration and checksums of the download
+    """
+    hashes = [(algorithm, hashlib.new(algorithm))
+              for algorithm in algorithms]
+    length = resp.headers.get('content-length')
+    dest_file = None
+    dest_view = None
+    write = None
+    buffer = None
+    size = 0
+    start = time.time()
+    try:
+        if isinstance(dest, str):
+            dest_file = open(dest, 'wb')
+            write = dest_file.write
+        elif hasattr(dest, 'write'):
+            write = dest.write
+        elif dest is not None:
+            dest_view = _dest_buffer(
+                dest, int(length) if length is not None else None)
+        if dest_view is None:
+            buffer = memoryview(bytearray(buffer_size))
+
+        while True:
+            if dest_view is not None:
+                # Read straight into the destination buffer
+                buffer = dest_view[size:size + buffer_size]
+                if not len(buffer):
+                    if resp.read(1):
+                        raise exceptions.InvalidParam(
+                            invalid_param='dest of %d bytes is too small' %
+                            len(dest_view))
+                    break
+            count = resp.readinto(buffer)
+            if not count:
+                break
+            chunk = buffer[:count]
+            for _, hash_ in hashes:
+                hash_.update(chunk)
+            if write is not None:
+                write(chunk)
+            size += count
+    finally:
+        resp.release_conn()
+        if dest_file is not None:
+            dest_file.close()
+    return StreamStats(size, time.time() - start,
+                       dict((algorithm, hash_.hexdigest())
+                            for algorithm, hash_ in hashes))
@@ -12,6 +12,8 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+from concurrent import futures
+
 import fixtures
 from oslo_log import log as logging
 from oslo_utils import excutils
@@ -31,7 +33,7 @@ def _network_service(clients, use_neutron):
 
 
 def create_ssh_security_group(clients, add_rule=False, ethertype='IPv4',
-                              use_neutron=True):
+                              use_neutron=True, bulk=False):
     """Create a security group for ping/ssh testing
 
     Create a security group to be attached to a VM using the nova or neutron
@@ -46,6 +48,8 @@ def create_ssh_security_group(clients, add_rule=False, ethertype='IPv4',
     :param ethertype: 'IPv4' or 'IPv6'. Honoured only in case neutron is used.
     :param use_neutron: When True resources are provisioned via neutron, when
         False resources are provisioned via nova.
+    :param bulk: When True and neutron is used, all the rules are created
+        with a single bulk request. Defaults to `False`.
     :returns: A dictionary with the security group as returned by the API.
 
     Examples::
@@ -77,18 +81,23 @@ def create_ssh_security_group(clients, add_rule=False, ethertype='IPv4',
     if add_rule:
         try:
             if use_neutron:
-                security_group_rules_client.create_security_group_rule(
-                    security_group_id=security_group['id'],
-                    protocol='tcp',
-                    ethertype=ethertype,
-                    port_range_min=22,
-                    port_range_max=22,
-                    direction='ingress')
-                security_group_rules_client.create_security_group_rule(
-                    security_group_id=security_group['id'],
-                    protocol='icmp',
-                    ethertype=ethertype,
-                    direction='ingress')
+                rules = [dict(security_group_id=security_group['id'],
+                              protocol='tcp',
+                              ethertype=ethertype,
+                              port_range_min=22,
+                              port_range_max=22,
+                              direction='ingress'),
+                         dict(security_group_id=security_group['id'],
+                              protocol='icmp',
+                              ethertype=ethertype,
+                              direction='ingress')]
+                if bulk:
+                    security_group_rules_client.create_security_group_rules(
+                        rules)
+                else:
+                    for rule in rules:
+                        security_group_rules_client.create_security_group_rule(
+                            **rule)
             else:
                 security_group_rules_client.create_security_group_rule(
                     parent_group_id=security_group['id'], ip_protocol='tcp',
@@ -122,12 +131,68 @@ def create_ssh_security_group(clients, add_rule=False, ethertype='IPv4',
     return security_group
 
 
+def _run_steps(steps, on_result, concurrent):
+    # Internal helper to run independent steps, one after the other or all
+    # at once in threads. The result of each successful step is passed to
+    # on_result in the order of the steps, then the first exception raised,
+    # if any, is re-raised. When steps run one after the other, no step runs
+    # after a failed one.
+    if not concurrent or len(steps) < 2:
+        for step in steps:
+            on_result(step())
+        return
+    with futures.ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        running = [executor.submit(step) for step in steps]
+    errors = []
+    for future in running:
+        if future.exception() is None:
+            on_result(future.result())
+        else:
+            errors.append(future.exception())
+    if errors:
+        raise errors[0]
+
+
+def _create_keypair(clients):
+    keypair_name = data_utils.rand_name('keypair')
+    keypair = clients.compute.KeyPairsClient().create_keypair(
+        name=keypair_name)
+    LOG.debug("Validation resource key %s created", keypair_name)
+    return keypair
+
+
+def _create_floating_ip(clients, use_neutron, floating_network_id,
+                        floating_network_name):
+    floating_ip_client = _network_service(
+        clients, use_neutron).FloatingIPsClient()
+    if use_neutron:
+        floatingip = floating_ip_client.create_floatingip(
+            floating_network_id=floating_network_id)
+        # validation_resources['floating_ip'] has historically looked
+        # like a compute API POST /os-floating-ips response, so we need
+        # to mangle it a bit for a Neutron response with different
+        # fields.
+        floating_ip = floatingip['floatingip']
+        floating_ip['ip'] = floatingip['floatingip']['floating_ip_address']
+        result = dict(floating_ip=floating_ip)
+    else:
+        # NOTE(mriedem): The os-floating-ips compute API was deprecated
+        # in the 2.36 microversion. Any tests for CRUD operations on
+        # floating IPs using the compute API should be capped at 2.35.
+        result = floating_ip_client.create_floating_ip(
+            pool=floating_network_name)
+    LOG.debug("Validation resource floating IP %s created",
+              result['floating_ip'])
+    return result
+
+
 def create_validation_resources(clients, keypair=False, floating_ip=False,
                                 security_group=False,
                                 security_group_rules=False,
                                 ethertype='IPv4', use_neutron=True,
                                 floating_network_id=None,
-                                floating_network_name=None):
+                                floating_network_name=None,
+                                concurrent=False):
     """Provision resources for VM ping/ssh testing
 
     Create resources required to be able to ping / ssh a virtual machine:
@@ -155,6 +220,10 @@ def create_validation_resources(clients, keypair=False, floating_ip=False,
     :param floating_network_name: The name of the floating IP pool used to
         provision the floating IP. Only used if a floating IP is requested and
         with nova-net.
+    :param concurrent: When True the keypair, the security group and the
+        floating IP are provisioned in parallel, and with neutron the
+        security group rules are created with a single bulk request.
+        Defaults to False.
     :returns: A dictionary with the resources in the format they are returned
         by the API. Valid keys are 'keypair', 'floating_ip' and
         'security_group'.
@@ -184,39 +253,20 @@ def create_validation_resources(clients, keypair=False, floating_ip=False,
     msg = ('Requested validation resources keypair %s, floating IP %s, '
            'security group %s')
     LOG.debug(msg, keypair, floating_ip, security_group)
+    steps = []
+    if keypair:
+        steps.append(lambda: _create_keypair(clients))
+    if security_group:
+        steps.append(lambda: dict(security_group=create_ssh_security_group(
+            clients, add_rule=security_group_rules, use_neutron=use_neutron,
+            ethertype=ethertype, bulk=concurrent)))
+    if floating_ip:
+        steps.append(lambda: _create_floating_ip(
+            clients, use_neutron, floating_network_id,
+            floating_network_name))
     validation_data = {}
     try:
-        if keypair:
-            keypair_name = data_utils.rand_name('keypair')
-            validation_data.update(
-                clients.compute.KeyPairsClient().create_keypair(
-                    name=keypair_name))
-            LOG.debug("Validation resource key %s created", keypair_name)
-        if security_group:
-            validation_data['security_group'] = create_ssh_security_group(
-                clients, add_rule=security_group_rules,
-                use_neutron=use_neutron, ethertype=ethertype)
-        if floating_ip:
-            floating_ip_client = _network_service(
-                clients, use_neutron).FloatingIPsClient()
-            if use_neutron:
-                floatingip = floating_ip_client.create_floatingip(
-                    floating_network_id=floating_network_id)
-                # validation_resources['floating_ip'] has historically looked
-                # like a compute API POST /os-floating-ips response, so we need
-                # to mangle it a bit for a Neutron response with different
-                # fields.
-                validation_data['floating_ip'] = floatingip['floatingip']
-                validation_data['floating_ip']['ip'] = (
-                    floatingip['floatingip']['floating_ip_address'])
-            else:
-                # NOTE(mriedem): The os-floating-ips compute API was deprecated
-                # in the 2.36 microversion. Any tests for CRUD operations on
-                # floating IPs using the compute API should be capped at 2.35.
-                validation_data.update(floating_ip_client.create_floating_ip(
-                    pool=floating_network_name))
-            LOG.debug("Validation resource floating IP %s created",
-                      validation_data['floating_ip'])
+        _run_steps(steps, validation_data.update, concurrent)
     except Exception as prov_exc:
         # If something goes wrong, cleanup as much as possible before we
         # re-raise the exception
@@ -235,7 +285,7 @@ def create_validation_resources(clients, keypair=False, floating_ip=False,
                         floating_ip=validation_data.get('floating_ip', None),
                         security_group=validation_data.get('security_group',
                                                            None),
-                        use_neutron=use_neutron)
+                        use_neutron=use_neutron, concurrent=concurrent)
                 except Exception as cleanup_exc:
                     msg = ('Error during cleanup of validation resources. '
                            'The cleanup was triggered by an exception during '
@@ -246,8 +296,60 @@ def create_validation_resources(clients, keypair=False, floating_ip=False,
     return validation_data
 
 
+def _delete_keypair(clients, keypair):
+    keypair_client = clients.compute.KeyPairsClient()
+    keypair_name = keypair['name']
+    try:
+        keypair_client.delete_keypair(keypair_name)
+    except lib_exc.NotFound:
+        LOG.warning(
+            "Keypair %s is not found when attempting to delete",
+            keypair_name
+        )
+    except Exception as exc:
+        LOG.exception('Exception raised while deleting key %s',
+                      keypair_name)
+        return exc
+
+
+def _delete_security_group(network_service, security_group):
+    security_group_client = network_service.SecurityGroupsClient()
+    sec_id = security_group['id']
+    try:
+        security_group_client.delete_security_group(sec_id)
+        security_group_client.wait_for_resource_deletion(sec_id)
+    except lib_exc.NotFound:
+        LOG.warning("Security group %s is not found when attempting "
+                    "to delete", sec_id)
+    except lib_exc.Conflict as exc:
+        LOG.exception('Conflict while deleting security '
+                      'group %s VM might not be deleted', sec_id)
+        return exc
+    except Exception as exc:
+        LOG.exception('Exception raised while deleting security '
+                      'group %s', sec_id)
+        return exc
+
+
+def _delete_floating_ip(network_service, floating_ip, use_neutron):
+    floating_ip_client = network_service.FloatingIPsClient()
+    fip_id = floating_ip['id']
+    try:
+        if use_neutron:
+            floating_ip_client.delete_floatingip(fip_id)
+        else:
+            floating_ip_client.delete_floating_ip(fip_id)
+    except lib_exc.NotFound:
+        LOG.warning('Floating ip %s not found while attempting to '
+                    'delete', fip_id)
+    except Exception as exc:
+        LOG.exception('Exception raised while deleting ip %s', fip_id)
+        return exc
+
+
 def clear_validation_resources(clients, keypair=None, floating_ip=None,
-                               security_group=None, use_neutron=True):
+                               security_group=None, use_neutron=True,
+                               concurrent=False):
     """Cleanup resources for VM ping/ssh testing
 
     Cleanup a set of resources provisioned via `create_validation_resources`.
@@ -266,6 +368,8 @@ def clear_validation_resources(clients, keypair=None, floating_ip=None,
         Defaults to None.
     :param use_neutron: When True resources are provisioned via neutron, when
         False resources are provisioned via nova.
+    :param concurrent: When True the resources are deleted in parallel.
+        Defaults to False.
 
     Examples::
 
@@ -291,57 +395,21 @@ def clear_validation_resources(clients, keypair=None, floating_ip=None,
         except Exception as e:
             LOG.exception('Something went wrong during cleanup, ignoring')
     """
-    has_exception = None
-    if keypair:
-        keypair_client = clients.compute.KeyPairsClient()
-        keypair_name = keypair['name']
-        try:
-            keypair_client.delete_keypair(keypair_name)
-        except lib_exc.NotFound:
-            LOG.warning(
-                "Keypair %s is not found when attempting to delete",
-                keypair_name
-            )
-        except Exception as exc:
-            LOG.exception('Exception raised while deleting key %s',
-                          keypair_name)
-            if not has_exception:
-                has_exception = exc
     network_service = _network_service(clients, use_neutron)
+    steps = []
+    if keypair:
+        steps.append(lambda: _delete_keypair(clients, keypair))
     if security_group:
-        security_group_client = network_service.SecurityGroupsClient()
-        sec_id = security_group['id']
-        try:
-            security_group_client.delete_security_group(sec_id)
-            security_group_client.wait_for_resource_deletion(sec_id)
-        except lib_exc.NotFound:
-            LOG.warning("Security group %s is not found when attempting "
-                        "to delete", sec_id)
-        except lib_exc.Conflict as exc:
-            LOG.exception('Conflict while deleting security '
-                          'group %s VM might not be deleted', sec_id)
-            if not has_exception:
-                has_exception = exc
-        except Exception as exc:
-            LOG.exception('Exception raised while deleting security '
-                          'group %s', sec_id)
-            if not has_exception:
-                has_exception = exc
+        steps.append(lambda: _delete_security_group(network_service,
+                                                    security_group))
     if floating_ip:
-        floating_ip_client = network_service.FloatingIPsClient()
-        fip_id = floating_ip['id']
-        try:
-            if use_neutron:
-                floating_ip_client.delete_floatingip(fip_id)
-            else:
-                floating_ip_client.delete_floating_ip(fip_id)
-        except lib_exc.NotFound:
-            LOG.warning('Floating ip %s not found while attempting to '
-                        'delete', fip_id)
-        except Exception as exc:
-            LOG.exception('Exception raised while deleting ip %s', fip_id)
-            if not has_exception:
-                has_exception = exc
+        steps.append(lambda: _delete_floating_ip(network_service,
+                                                 floating_ip, use_neutron))
+    # Each step logs and returns its exception, so that all the resources
+    # are cleaned up whatever happens to the others
+    errors = []
+    _run_steps(steps, errors.append, concurrent)
+    has_exception = next((exc for exc in errors if exc), None)
     if has_exception:
         raise has_exception
 
@@ -354,7 +422,7 @@ class ValidationResourcesFixture(fixtures.Fixture):
     def __init__(self, clients, keypair=False, floating_ip=False,
                  security_group=False, security_group_rules=False,
                  ethertype='IPv4', use_neutron=True, floating_network_id=None,
-                 floating_network_name=None):
+                 floating_network_name=None, concurrent=False):
         """Create a ValidationResourcesFixture
 
         Create a ValidationResourcesFixture fixtures, which provisions the
@@ -384,6 +452,8 @@ class ValidationResourcesFixture(fixtures.Fixture):
         :param floating_network_name: The name of the floating IP pool used to
             provision the floating IP. Only used if a floating IP is requested
             and with nova-net.
+        :param concurrent: When True resources are provisioned and cleared
+            in parallel. Defaults to False.
         :returns: A dictionary with the same keys as the input
             `validation_resources` and the resources for values in the format
              they are returned by the API.
@@ -429,6 +499,7 @@ class ValidationResourcesFixture(fixtures.Fixture):
         self._use_neutron = use_neutron
         self._floating_network_id = floating_network_id
         self._floating_network_name = floating_network_name
+        self._concurrent = concurrent
         self._validation_resources = None
 
     def _setUp(self):
@@ -442,7 +513,8 @@ class ValidationResourcesFixture(fixtures.Fixture):
             security_group_rules=self._security_group_rules,
             ethertype=self._ethertype, use_neutron=self._use_neutron,
             floating_network_id=self._floating_network_id,
-            floating_network_name=self._floating_network_name)
+            floating_network_name=self._floating_network_name,
+            concurrent=self._concurrent)
         # If provisioning raises an exception we won't have anything to
         # cleanup here, so we don't need a try-finally around provisioning
         vr = self._validation_resources
@@ -450,7 +522,8 @@ class ValidationResourcesFixture(fixtures.Fixture):
                         keypair=vr.get('keypair', None),
                         floating_ip=vr.get('floating_ip', None),
                         security_group=vr.get('security_group', None),
-                        use_neutron=self._use_neutron)
+                        use_neutron=self._use_neutron,
+                        concurrent=self._concurrent)
 
     @property
     def resources(self):
@@ -307,3 +307,8 @@ class ConsistencyGroupSnapshotException(TempestException):
 
 class InvalidScopeType(TempestException):
     message = "Invalid scope %(scope)s"
+
+
+class InteractionNotRecorded(TempestException):
+    message = ("No interaction recorded in cassette %(path)s matches "
+               "%(method)s %(url)s")
@@ -26,16 +26,24 @@ import testtools
 from tempest.lib import auth
 from tempest.lib.common.utils import misc
 from tempest.lib import exceptions
-from tempest.lib.services import compute
-from tempest.lib.services import identity
-from tempest.lib.services import image
-from tempest.lib.services import network
-from tempest.lib.services import object_storage
-from tempest.lib.services import placement
-from tempest.lib.services import volume
 
 LOG = logging.getLogger(__name__)
 
+# The service client packages import all of their clients, they are only
+# imported when tempest_modules() is called so that importing this module,
+# and tempest.config with it, stays cheap.
+TEMPEST_MODULE_PATHS = {
+    'compute': 'tempest.lib.services.compute',
+    'placement': 'tempest.lib.services.placement',
+    'identity.v2': 'tempest.lib.services.identity.v2',
+    'identity.v3': 'tempest.lib.services.identity.v3',
+    'image.v2': 'tempest.lib.services.image.v2',
+    'network': 'tempest.lib.services.network',
+    'object-storage': 'tempest.lib.services.object_storage',
+    'volume.v2': 'tempest.lib.services.volume.v2',
+    'volume.v3': 'tempest.lib.services.volume.v3'
+}
+
 
 def tempest_modules():
     """Dict of service client modules available in Tempest.
@@ -43,17 +51,8 @@ def tempest_modules():
     Provides a dict of stable service modules available in Tempest, with
     ``service_version`` as key, and the module object as value.
     """
-    return {
-        'compute': compute,
-        'placement': placement,
-        'identity.v2': identity.v2,
-        'identity.v3': identity.v3,
-        'image.v2': image.v2,
-        'network': network,
-        'object-storage': object_storage,
-        'volume.v2': volume.v2,
-        'volume.v3': volume.v3
-    }
+    return {service_version: importlib.import_module(module_path)
+            for service_version, module_path in TEMPEST_MODULE_PATHS.items()}
 
 
 def available_modules():
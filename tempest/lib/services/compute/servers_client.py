@@ -23,74 +23,52 @@ from oslo_serialization import jsonutils as json
 from tempest.lib.api_schema.response.compute.v2_1 import \
     security_groups as security_groups_schema
 from tempest.lib.api_schema.response.compute.v2_1 import servers as schema
-from tempest.lib.api_schema.response.compute.v2_16 import servers as schemav216
-from tempest.lib.api_schema.response.compute.v2_19 import servers as schemav219
-from tempest.lib.api_schema.response.compute.v2_26 import servers as schemav226
-from tempest.lib.api_schema.response.compute.v2_3 import servers as schemav23
-from tempest.lib.api_schema.response.compute.v2_45 import servers as schemav245
-from tempest.lib.api_schema.response.compute.v2_47 import servers as schemav247
-from tempest.lib.api_schema.response.compute.v2_48 import servers as schemav248
-from tempest.lib.api_schema.response.compute.v2_51 import servers as schemav251
-from tempest.lib.api_schema.response.compute.v2_54 import servers as schemav254
-from tempest.lib.api_schema.response.compute.v2_57 import servers as schemav257
-from tempest.lib.api_schema.response.compute.v2_58 import servers as schemav258
-from tempest.lib.api_schema.response.compute.v2_6 import servers as schemav26
-from tempest.lib.api_schema.response.compute.v2_62 import servers as schemav262
-from tempest.lib.api_schema.response.compute.v2_63 import servers as schemav263
-from tempest.lib.api_schema.response.compute.v2_70 import servers as schemav270
-from tempest.lib.api_schema.response.compute.v2_71 import servers as schemav271
-from tempest.lib.api_schema.response.compute.v2_73 import servers as schemav273
-from tempest.lib.api_schema.response.compute.v2_75 import servers as schemav275
-from tempest.lib.api_schema.response.compute.v2_79 import servers as schemav279
-from tempest.lib.api_schema.response.compute.v2_8 import servers as schemav28
-from tempest.lib.api_schema.response.compute.v2_80 import servers as schemav280
-from tempest.lib.api_schema.response.compute.v2_84 import servers as schemav284
-from tempest.lib.api_schema.response.compute.v2_89 import servers as schemav289
-from tempest.lib.api_schema.response.compute.v2_9 import servers as schemav29
-from tempest.lib.api_schema.response.compute.v2_96 import servers as schemav296
-from tempest.lib.api_schema.response.compute.v2_97 import servers as schemav297
-from tempest.lib.api_schema.response.compute.v2_98 import servers as schemav298
-from tempest.lib.api_schema.response.compute.v2_99 import servers as schemav299
-from tempest.lib.api_schema.response.compute.v2_100 import \
-    servers as schemav2100  # noqa: H306
+from tempest.lib.common import api_version_utils
 from tempest.lib.common import rest_client
+from tempest.lib import exceptions as lib_exc
 from tempest.lib.services.compute import base_compute_client
 
 
+def _lazy_schema(version):
+    # The schemas of the later microversions are only imported when used
+    return api_version_utils.LazySchemaModule(
+        'tempest.lib.api_schema.response.compute.%s.servers' % version)
+
+
 class ServersClient(base_compute_client.BaseComputeClient):
     """Service client for the resource /servers"""
 
     schema_versions_info = [
         {'min': None, 'max': '2.2', 'schema': schema},
-        {'min': '2.3', 'max': '2.5', 'schema': schemav23},
-        {'min': '2.6', 'max': '2.7', 'schema': schemav26},
-        {'min': '2.8', 'max': '2.8', 'schema': schemav28},
-        {'min': '2.9', 'max': '2.15', 'schema': schemav29},
-        {'min': '2.16', 'max': '2.18', 'schema': schemav216},
-        {'min': '2.19', 'max': '2.25', 'schema': schemav219},
-        {'min': '2.26', 'max': '2.44', 'schema': schemav226},
-        {'min': '2.45', 'max': '2.46', 'schema': schemav245},
-        {'min': '2.47', 'max': '2.47', 'schema': schemav247},
-        {'min': '2.48', 'max': '2.50', 'schema': schemav248},
-        {'min': '2.51', 'max': '2.53', 'schema': schemav251},
-        {'min': '2.54', 'max': '2.56', 'schema': schemav254},
-        {'min': '2.57', 'max': '2.57', 'schema': schemav257},
-        {'min': '2.58', 'max': '2.61', 'schema': schemav258},
-        {'min': '2.62', 'max': '2.62', 'schema': schemav262},
-        {'min': '2.63', 'max': '2.69', 'schema': schemav263},
-        {'min': '2.70', 'max': '2.70', 'schema': schemav270},
-        {'min': '2.71', 'max': '2.72', 'schema': schemav271},
-        {'min': '2.73', 'max': '2.74', 'schema': schemav273},
-        {'min': '2.75', 'max': '2.78', 'schema': schemav275},
-        {'min': '2.79', 'max': '2.79', 'schema': schemav279},
-        {'min': '2.80', 'max': '2.83', 'schema': schemav280},
-        {'min': '2.84', 'max': '2.88', 'schema': schemav284},
-        {'min': '2.89', 'max': '2.95', 'schema': schemav289},
-        {'min': '2.96', 'max': '2.96', 'schema': schemav296},
-        {'min': '2.97', 'max': '2.97', 'schema': schemav297},
-        {'min': '2.98', 'max': '2.98', 'schema': schemav298},
-        {'min': '2.99', 'max': '2.99', 'schema': schemav299},
-        {'min': '2.100', 'max': None, 'schema': schemav2100},
+        {'min': '2.3', 'max': '2.5', 'schema': _lazy_schema('v2_3')},
+        {'min': '2.6', 'max': '2.7', 'schema': _lazy_schema('v2_6')},
+        {'min': '2.8', 'max': '2.8', 'schema': _lazy_schema('v2_8')},
+        {'min': '2.9', 'max': '2.15', 'schema': _lazy_schema('v2_9')},
+        {'min': '2.16', 'max': '2.18', 'schema': _lazy_schema('v2_16')},
+        {'min': '2.19', 'max': '2.25', 'schema': _lazy_schema('v2_19')},
+        {'min': '2.26', 'max': '2.44', 'schema': _lazy_schema('v2_26')},
+        {'min': '2.45', 'max': '2.46', 'schema': _lazy_schema('v2_45')},
+        {'min': '2.47', 'max': '2.47', 'schema': _lazy_schema('v2_47')},
+        {'min': '2.48', 'max': '2.50', 'schema': _lazy_schema('v2_48')},
+        {'min': '2.51', 'max': '2.53', 'schema': _lazy_schema('v2_51')},
+        {'min': '2.54', 'max': '2.56', 'schema': _lazy_schema('v2_54')},
+        {'min': '2.57', 'max': '2.57', 'schema': _lazy_schema('v2_57')},
+        {'min': '2.58', 'max': '2.61', 'schema': _lazy_schema('v2_58')},
+        {'min': '2.62', 'max': '2.62', 'schema': _lazy_schema('v2_62')},
+        {'min': '2.63', 'max': '2.69', 'schema': _lazy_schema('v2_63')},
+        {'min': '2.70', 'max': '2.70', 'schema': _lazy_schema('v2_70')},
+        {'min': '2.71', 'max': '2.72', 'schema': _lazy_schema('v2_71')},
+        {'min': '2.73', 'max': '2.74', 'schema': _lazy_schema('v2_73')},
+        {'min': '2.75', 'max': '2.78', 'schema': _lazy_schema('v2_75')},
+        {'min': '2.79', 'max': '2.79', 'schema': _lazy_schema('v2_79')},
+        {'min': '2.80', 'max': '2.83', 'schema': _lazy_schema('v2_80')},
+        {'min': '2.84', 'max': '2.88', 'schema': _lazy_schema('v2_84')},
+        {'min': '2.89', 'max': '2.95', 'schema': _lazy_schema('v2_89')},
+        {'min': '2.96', 'max': '2.96', 'schema': _lazy_schema('v2_96')},
+        {'min': '2.97', 'max': '2.97', 'schema': _lazy_schema('v2_97')},
+        {'min': '2.98', 'max': '2.98', 'schema': _lazy_schema('v2_98')},
+        {'min': '2.99', 'max': '2.99', 'schema': _lazy_schema('v2_99')},
+        {'min': '2.100', 'max': None, 'schema': _lazy_schema('v2_100')},
     ]
 
     def __init__(self, auth_provider, service, region,
@@ -213,6 +191,63 @@ class ServersClient(base_compute_client.BaseComputeClient):
         self.validate_response(_schema, resp, body)
         return rest_client.ResponseBody(resp, body)
 
+    def _check_server_deletion(self, server):
+        """Raise if the deletion of the server failed
+
+        A soft deleted server is force deleted, so that the deletion of the
+        servers is over even if the cloud reclaims the instances lazily.
+        """
+        task_state = server.get('OS-EXT-STS:task_state')
+        if server['status'] == 'ERROR' and task_state is None:
+            details = ("Server %s failed to delete and is in ERROR status." %
+                       server['id'])
+            if 'fault' in server:
+                details += ' Fault: %s.' % server['fault']
+            raise lib_exc.DeleteErrorException(details,
+                                               server_id=server['id'])
+        if server['status'] == 'SOFT_DELETED':
+            try:
+                self.force_delete_server(server['id'])
+            except lib_exc.NotFound:
+                pass
+
+    def is_resource_deleted(self, id):
+        try:
+            server = self.show_server(id)['server']
+        except lib_exc.NotFound:
+            return True
+        self._check_server_deletion(server)
+        return False
+
+    def deleted_resources(self, ids):
+        """Return the ids of the servers which are deleted
+
+        The servers are checked with a single list request, only the
+        servers missing from the list are checked one by one.
+
+        :param ids: The ids of the servers to check
+        :raises lib_exc.DeleteErrorException: If one of the servers is in
+            ERROR status once its deletion is over.
+        """
+        body = self.list_servers(detail=True)
+        if body.get('servers_links'):
+            # Paginated list, a missing server can be on another page
+            return super(ServersClient, self).deleted_resources(ids)
+        servers = {server['id']: server for server in body['servers']}
+        deleted = set()
+        for id in ids:
+            if id not in servers:
+                if self.is_resource_deleted(id):
+                    deleted.add(id)
+            else:
+                self._check_server_deletion(servers[id])
+        return deleted
+
+    @property
+    def resource_type(self):
+        """Returns the primary type of resource this client works with."""
+        return 'server'
+
     def list_addresses(self, server_id):
         """Lists all addresses for a server.
 
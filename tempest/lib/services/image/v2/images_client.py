@@ -18,7 +18,9 @@ from urllib import parse as urllib
 
 from oslo_serialization import jsonutils as json
 
+from tempest.lib.common import http
 from tempest.lib.common import rest_client
+from tempest.lib.common.utils import streaming
 from tempest.lib import exceptions as lib_exc
 
 CHUNKSIZE = 1024 * 64  # 64kB
@@ -269,6 +271,36 @@ class ImagesClient(rest_client.RestClient):
         else:
             return rest_client.ResponseBodyData(resp, body)
 
+    def stream_image_file(self, image_id, dest=None,
+                          algorithms=streaming.DEFAULT_ALGORITHMS,
+                          buffer_size=streaming.BUFFER_SIZE):
+        """Download binary image data to a file or a buffer.
+
+        The image data is streamed, so it is never held in memory as a
+        whole, and its checksums are computed while it is downloaded.
+
+        :param dest: Path of the file to write, a file-like object with a
+                     ``write`` method, a writable buffer large enough for the
+                     data, or None to only compute the checksums
+        :param algorithms: Names of the ``hashlib`` algorithms of the
+                           checksums, e.g. ``os_hash_algo`` of the image
+        :param int buffer_size: Size in bytes of the read buffer
+        :rtype: tuple
+        :return: a tuple with the response and a StreamStats object with the
+                 size, throughput and checksums of the data
+
+        For a full list of available parameters, please refer to the official
+        API reference:
+        https://docs.openstack.org/api-ref/image/v2/#download-binary-image-data
+        """
+        resp = self.show_image_file(image_id, chunked=True)
+        stats = streaming.stream_response(resp, dest, algorithms=algorithms,
+                                          buffer_size=buffer_size)
+        self.LOG.debug("Downloaded image %s: %s", image_id, stats)
+        # The raw response does not know the URL of the request
+        url = '%s/images/%s/file' % (self.base_url.rstrip('/'), image_id)
+        return http.Response.from_urllib3(resp, url), stats
+
     def add_image_tag(self, image_id, tag):
         """Add an image tag.
 
@@ -10,6 +10,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from concurrent import futures
 from urllib import parse as urllib
 
 from oslo_serialization import jsonutils as json
@@ -17,6 +18,29 @@ from oslo_serialization import jsonutils as json
 from tempest.lib.common import rest_client
 
 
+def _bulk_create_schema(collection, count):
+    # One created resource per requested one, in the same order
+    return {
+        'status_code': [201],
+        'response_body': {
+            'type': 'object',
+            'properties': {
+                collection: {
+                    'type': 'array',
+                    'minItems': count,
+                    'maxItems': count,
+                    'items': {
+                        'type': 'object',
+                        'properties': {'id': {'type': 'string'}},
+                        'required': ['id']
+                    }
+                }
+            },
+            'required': [collection]
+        }
+    }
+
+
 class BaseNetworkClient(rest_client.RestClient):
 
     """Base class for Tempest REST clients for Neutron.
@@ -84,3 +108,55 @@ class BaseNetworkClient(rest_client.RestClient):
             body = None
         self.expected_success(expect_response_code, resp.status)
         return rest_client.ResponseBody(resp, body)
+
+    def create_resources(self, uri, collection, resources):
+        """Create several resources with a single bulk request
+
+        The Networking API creates either all the resources or none of
+        them. The response is validated to hold one created resource per
+        requested one.
+
+        :param uri: the URI of the collection, e.g. ``/ports``
+        :param collection: the name of the collection, e.g. ``ports``
+        :param resources: a list of dictionaries, each with the parameters
+            of one resource
+        :return: the created resources under the ``collection`` key, in the
+            order of ``resources``
+        """
+        resources = list(resources)
+        body = self.create_resource(uri, {collection: resources})
+        self.validate_response(
+            _bulk_create_schema(collection, len(resources)),
+            body.response, dict(body))
+        return body
+
+    def delete_resources(self, uri, resource_ids, concurrency=4):
+        """Delete several resources of a collection concurrently
+
+        The Networking API has no bulk delete, so the resources are deleted
+        with concurrent requests sharing a pool of connections. All the
+        deletions are attempted even if some of them fail.
+
+        :param uri: the URI of the collection, e.g. ``/ports``
+        :param resource_ids: the IDs of the resources to delete
+        :param int concurrency: Maximum number of requests sent at once
+        :return: a dict with the response of the deletion of each resource
+            ID
+        :raises: the error of the first resource, in the order of
+            ``resource_ids``, whose deletion failed
+        """
+        resource_ids = list(resource_ids)
+        if not resource_ids:
+            return {}
+        client = self.pooled_client(concurrency)
+        try:
+            with futures.ThreadPoolExecutor(concurrency) as executor:
+                requests = [
+                    executor.submit(client.delete_resource,
+                                    '%s/%s' % (uri, resource_id))
+                    for resource_id in resource_ids]
+                futures.wait(requests)
+        finally:
+            client.http_obj.clear()
+        return dict((resource_id, request.result()) for resource_id, request
+                    in zip(resource_ids, requests))
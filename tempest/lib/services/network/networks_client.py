@@ -64,12 +64,26 @@ class NetworksClient(base.BaseNetworkClient):
     def create_bulk_networks(self, **kwargs):
         """Create multiple networks in a single request.
 
+        The response is validated to hold one created network per requested
+        one, in the order of the ``networks`` list.
+
         For a full list of available parameters, please refer to the official
         API reference:
         https://docs.openstack.org/api-ref/network/v2/index.html#bulk-create-networks
         """
         uri = '/networks'
-        return self.create_resource(uri, kwargs)
+        return self.create_resources(uri, 'networks', kwargs['networks'])
+
+    def delete_networks(self, network_ids, concurrency=4):
+        """Delete many networks with concurrent requests.
+
+        :param network_ids: The IDs of the networks to delete.
+        :param int concurrency: Maximum number of requests sent at once.
+        :return: A dict with the response of each deletion by ID.
+        """
+        uri = '/networks'
+        return self.delete_resources(uri, network_ids,
+                                     concurrency=concurrency)
 
     def list_dhcp_agents_on_hosting_network(self, network_id):
         uri = '/networks/%s/dhcp-agents' % network_id
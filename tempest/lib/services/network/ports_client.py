@@ -71,12 +71,26 @@ class PortsClient(base.BaseNetworkClient):
     def create_bulk_ports(self, **kwargs):
         """Create multiple ports in a single request.
 
+        The response is validated to hold one created port per requested
+        one, in the order of the ``ports`` list.
+
         For a full list of available parameters, please refer to the official
         API reference:
         https://docs.openstack.org/api-ref/network/v2/index.html#bulk-create-ports
         """
         uri = '/ports'
-        return self.create_resource(uri, kwargs)
+        return self.create_resources(uri, 'ports', kwargs['ports'])
+
+    def delete_ports(self, port_ids, concurrency=4):
+        """Delete many ports with concurrent requests.
+
+        :param port_ids: The IDs of the ports to delete.
+        :param int concurrency: Maximum number of requests sent at once.
+        :return: A dict with the response of each deletion by ID.
+        """
+        uri = '/ports'
+        return self.delete_resources(uri, port_ids,
+                                     concurrency=concurrency)
 
     def is_resource_deleted(self, id):
         try:
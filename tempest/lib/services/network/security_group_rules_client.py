@@ -26,6 +26,36 @@ class SecurityGroupRulesClient(base.BaseNetworkClient):
         post_data = {'security_group_rule': kwargs}
         return self.create_resource(uri, post_data)
 
+    def create_security_group_rules(self, security_group_rules):
+        """Creates many OpenStack Networking security group rules at once.
+
+        All the rules are created with a single request, using the bulk
+        create of the Networking API.
+
+        :param security_group_rules: A list of dictionaries, each with the
+            parameters of one rule as accepted by
+            ``create_security_group_rule``.
+
+        For a full list of available parameters, please refer to the official
+        API reference:
+        https://docs.openstack.org/api-ref/network/v2/index.html#bulk-create-security-group-rule
+        """
+        uri = '/security-group-rules'
+        return self.create_resources(uri, 'security_group_rules',
+                                     security_group_rules)
+
+    def delete_security_group_rules(self, security_group_rule_ids,
+                                    concurrency=4):
+        """Deletes many OpenStack Networking security group rules.
+
+        :param security_group_rule_ids: The IDs of the rules to delete.
+        :param int concurrency: Maximum number of requests sent at once.
+        :return: A dict with the response of each deletion by ID.
+        """
+        uri = '/security-group-rules'
+        return self.delete_resources(uri, security_group_rule_ids,
+                                     concurrency=concurrency)
+
     def show_security_group_rule(self, security_group_rule_id, **fields):
         """Shows detailed information for a security group rule.
 
@@ -64,9 +64,23 @@ class SubnetsClient(base.BaseNetworkClient):
     def create_bulk_subnets(self, **kwargs):
         """Create multiple subnets in a single request.
 
+        The response is validated to hold one created subnet per requested
+        one, in the order of the ``subnets`` list.
+
         For a full list of available parameters, please refer to the official
         API reference:
         https://docs.openstack.org/api-ref/network/v2/index.html#bulk-create-subnet
         """
         uri = '/subnets'
-        return self.create_resource(uri, kwargs)
+        return self.create_resources(uri, 'subnets', kwargs['subnets'])
+
+    def delete_subnets(self, subnet_ids, concurrency=4):
+        """Delete many subnets with concurrent requests.
+
+        :param subnet_ids: The IDs of the subnets to delete.
+        :param int concurrency: Maximum number of requests sent at once.
+        :return: A dict with the response of each deletion by ID.
+        """
+        uri = '/subnets'
+        return self.delete_resources(uri, subnet_ids,
+                                     concurrency=concurrency)
@@ -19,6 +19,7 @@ from defusedxml import ElementTree as etree
 from oslo_serialization import jsonutils as json
 
 from tempest.lib.common import rest_client
+from tempest.lib.services.object_storage import container_client
 
 
 class AccountClient(rest_client.RestClient):
@@ -78,3 +79,19 @@ class AccountClient(rest_client.RestClient):
             body = body.strip().splitlines()
         self.expected_success([200, 204], resp.status)
         return resp, body
+
+    def iter_account_containers(self, params=None, limit=None):
+        """Iterate over the containers of the account
+
+        Unlike list_account_containers, the listing is paged transparently
+        using markers and parsed incrementally.
+
+        For a full list of available parameters, please refer to the official
+        API reference:
+        https://docs.openstack.org/api-ref/object-store/#show-account-details-and-list-containers
+
+        :param int limit: Number of containers requested per page
+        :return: a generator of container records as returned by the listing
+                 in JSON format
+        """
+        return container_client.iter_listing(self, '', params, limit)
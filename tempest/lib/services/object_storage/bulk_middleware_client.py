@@ -13,7 +13,80 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from concurrent import futures
+import io
+import itertools
+import tarfile
+import threading
+import time
+from urllib import parse as urllib
+
+from oslo_serialization import jsonutils as json
+
 from tempest.lib.common import rest_client
+from tempest.lib import exceptions
+
+# Defaults of the Swift bulk middleware, used when the cluster does not
+# publish its limits through the /info API
+DEFAULT_MAX_DELETES_PER_REQUEST = 10000
+# Number of objects packed in each archive by bulk_upload
+DEFAULT_UPLOAD_BATCH_SIZE = 1000
+
+
+class _ArchiveBuffer(object):
+    """Write-only file object collecting the output of tarfile"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def pop(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def iter_tar_archive(objects):
+    """Yield a tar archive of the given objects chunk by chunk
+
+    The archive is built in streaming mode, so only the member being added
+    is buffered rather than the whole archive.
+
+    :param objects: iterable of ``(name, data)`` tuples, where data is a
+                    bytes-like object
+    """
+    buf = _ArchiveBuffer()
+    with tarfile.open(fileobj=buf, mode='w|') as tar:
+        for name, data in objects:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(data))
+            chunk = buf.pop()
+            if chunk:
+                yield chunk
+    chunk = buf.pop()
+    if chunk:
+        yield chunk
+
+
+def _merge_bulk_results(results):
+    """Merge the JSON results of several bulk middleware requests"""
+    summary = {'Errors': []}
+    for result in results:
+        for key, value in result.items():
+            if key == 'Errors':
+                summary['Errors'].extend(value)
+            elif key == 'Response Status':
+                # Keep the first failure, if any
+                if not summary.get(key, '').startswith(('4', '5')):
+                    summary[key] = value
+            elif isinstance(value, int):
+                summary[key] = summary.get(key, 0) + value
+    return summary
 
 
 class BulkMiddlewareClient(rest_client.RestClient):
@@ -60,3 +133,132 @@ class BulkMiddlewareClient(rest_client.RestClient):
         resp, body = self.post(url, data, headers)
         self.expected_success([200, 204], resp.status)
         return rest_client.ResponseBodyData(resp, body)
+
+    def _get_bulk_limit(self, section, key, default):
+        """Read a limit of the bulk middleware from the /info API"""
+        try:
+            url = self._get_base_version_url() + 'info'
+            resp, body = self.raw_request(url, 'GET')
+            self._error_checker(resp, body)
+            return json.loads(body).get(section, {}).get(key, default)
+        except (exceptions.RestClientException, ValueError):
+            self.LOG.debug("Unable to read %s.%s from /info, using %s",
+                           section, key, default)
+            return default
+
+    def _run_batches(self, batches, send_batch, concurrency):
+        """Send batches concurrently and merge their results
+
+        At most twice ``concurrency`` batches are materialized at once, so
+        batches may be produced lazily from arbitrarily large inputs.
+        """
+        client = self.pooled_client(concurrency)
+        slots = threading.BoundedSemaphore(concurrency * 2)
+
+        def _send(batch):
+            try:
+                return send_batch(client, batch)
+            finally:
+                slots.release()
+
+        try:
+            with futures.ThreadPoolExecutor(concurrency) as executor:
+                requests = []
+                for batch in batches:
+                    slots.acquire()
+                    requests.append(executor.submit(_send, batch))
+                return _merge_bulk_results(
+                    [request.result() for request in requests])
+        finally:
+            client.http_obj.clear()
+
+    def bulk_delete(self, paths, batch_size=None, concurrency=4):
+        """Delete any number of objects and containers in parallel batches
+
+        The paths are split into ``?bulk-delete`` requests of at most
+        ``batch_size`` entries which are sent concurrently. Containers are
+        only deleted once all the objects have been, so a container and its
+        objects can be given together.
+
+        :param paths: iterable of ``container/object`` or ``container`` paths
+        :param int batch_size: Number of paths per request, defaults to the
+                               ``max_deletes_per_request`` of the cluster
+        :param int concurrency: Maximum number of requests sent at once
+        :return: the merged JSON results of the requests, with the summed
+                 ``Number Deleted`` and ``Number Not Found`` counters and the
+                 list of ``Errors``
+        """
+        paths = (path.strip('/') for path in paths)
+        first = next(paths, None)
+        if first is None:
+            return _merge_bulk_results([])
+        paths = itertools.chain([first], paths)
+        # Only the container names are kept, the objects are batched as
+        # they are read from paths
+        containers = []
+
+        def _objects():
+            for path in paths:
+                if '/' in path:
+                    yield path
+                else:
+                    containers.append(path)
+
+        if batch_size is None:
+            batch_size = self._get_bulk_limit(
+                'bulk_delete', 'max_deletes_per_request',
+                DEFAULT_MAX_DELETES_PER_REQUEST)
+        headers = {'Accept': 'application/json'}
+
+        def _delete(client, batch):
+            data = '\n'.join(urllib.quote(path) for path in batch)
+            resp, body = client.post('?bulk-delete', data, headers)
+            client.expected_success([200, 204], resp.status)
+            return json.loads(body) if body else {}
+
+        results = [self._run_batches(self._batches(_objects(), batch_size),
+                                     _delete, concurrency)]
+        if containers:
+            results.append(self._run_batches(
+                self._batches(containers, batch_size), _delete, concurrency))
+        return _merge_bulk_results(results)
+
+    def bulk_upload(self, upload_path, objects, batch_size=None,
+                    concurrency=4):
+        """Create any number of objects with parallel archive extractions
+
+        The objects are packed into tar archives of ``batch_size`` members,
+        built in streaming mode, and uploaded concurrently with
+        ``?extract-archive=tar`` requests.
+
+        :param str upload_path: Path the archive members are relative to, an
+                                empty string for the account or a container
+        :param objects: iterable of ``(name, data)`` tuples, names being
+                        ``container/object`` paths or object names relative
+                        to ``upload_path``
+        :param int batch_size: Number of objects per archive
+        :param int concurrency: Maximum number of archives uploaded at once
+        :return: the merged JSON results of the requests, with the summed
+                 ``Number Files Created`` counter and the list of ``Errors``
+        """
+        batch_size = batch_size or DEFAULT_UPLOAD_BATCH_SIZE
+        url = '%s?extract-archive=tar' % upload_path
+        headers = {'Accept': 'application/json'}
+
+        def _upload(client, batch):
+            resp, body = client.put(url, iter_tar_archive(batch), headers,
+                                    chunked=True)
+            client.expected_success([200, 201], resp.status)
+            return json.loads(body) if body else {}
+
+        return self._run_batches(self._batches(objects, batch_size),
+                                 _upload, concurrency)
+
+    @staticmethod
+    def _batches(items, batch_size):
+        items = iter(items)
+        while True:
+            batch = list(itertools.islice(items, batch_size))
+            if not batch:
+                return
+            yield batch
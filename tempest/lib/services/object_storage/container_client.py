@@ -12,7 +12,8 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
-
+import codecs
+import json as stdlib_json
 from urllib import parse as urllib
 
 from defusedxml import ElementTree as etree
@@ -21,6 +22,99 @@ from oslo_serialization import jsonutils as json
 from tempest.lib.common import rest_client
 from tempest.lib import exceptions
 
+# Size of the chunks read from a listing response while it is parsed
+LISTING_CHUNKSIZE = 64 * 1024
+
+_JSON_DECODER = stdlib_json.JSONDecoder()
+# Characters skipped between the items of a JSON array
+_SEPARATORS = ' \t\n\r,'
+
+
+def iter_json_array(chunks):
+    """Yield the items of a JSON array as it is read
+
+    Items are decoded as soon as they are complete, so only the current
+    item needs to be held in memory rather than the whole document.
+
+    :param chunks: iterable of bytes holding a JSON array
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    buf = ''
+    started = False
+    chunks = iter(chunks)
+    final = False
+    while not final:
+        chunk = next(chunks, None)
+        final = chunk is None
+        buf += decoder.decode(chunk or b'', final=final)
+        pos = 0
+        while True:
+            while pos < len(buf) and buf[pos] in _SEPARATORS:
+                pos += 1
+            if pos == len(buf):
+                break
+            if not started:
+                if buf[pos] != '[':
+                    raise exceptions.InvalidHTTPResponseBody(
+                        "Expected a JSON array, got %r" % buf[pos:pos + 32])
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == ']':
+                return
+            try:
+                item, end = _JSON_DECODER.raw_decode(buf, pos)
+            except ValueError:
+                if final:
+                    raise exceptions.InvalidHTTPResponseBody(buf[pos:])
+                break
+            if not final and (end == len(buf) or
+                              buf[end] not in _SEPARATORS + ']'):
+                # A trailing number may continue in the next chunk
+                break
+            yield item
+            pos = end
+        buf = buf[pos:]
+    if started:
+        raise exceptions.InvalidHTTPResponseBody("Truncated JSON array")
+
+
+def iter_listing(client, path, params=None, limit=None):
+    """Yield the records of a Swift account or container listing
+
+    The listing is requested page by page in JSON format, using the name of
+    the last record of a page as the ``marker`` of the next request. Each
+    page is parsed while it is being read and the connection is released
+    before its records are yielded, so slow consumers do not hold it open.
+
+    :param client: RestClient of the account or container to list
+    :param str path: Path of the account or container
+    :param dict params: Additional query parameters such as ``prefix``,
+                        ``delimiter``, ``marker`` or ``end_marker``
+    :param int limit: Number of records per page. If not given, the cluster
+                      default is used and pages are requested until an empty
+                      one is returned.
+    """
+    params = dict(params or {}, format='json')
+    if limit:
+        params['limit'] = limit
+    while True:
+        url = '%s?%s' % (path, urllib.urlencode(params))
+        resp, _ = client.get(url, headers={}, chunked=True)
+        try:
+            client.expected_success([200, 204], resp.status)
+            page = list(iter_json_array(resp.stream(LISTING_CHUNKSIZE)))
+        finally:
+            resp.release_conn()
+        if not page:
+            return
+        for record in page:
+            yield record
+        # Pseudo-directories only have a "subdir" key
+        params['marker'] = page[-1].get('name', page[-1].get('subdir'))
+        if limit and len(page) < limit:
+            return
+
 
 class ContainerClient(rest_client.RestClient):
 
@@ -127,3 +221,21 @@ class ContainerClient(rest_client.RestClient):
 
         self.expected_success([200, 204], resp.status)
         return resp, body
+
+    def iter_container_objects(self, container_name, params=None,
+                               limit=None):
+        """Iterate over the objects in a container
+
+        Unlike list_container_objects, the listing is paged transparently
+        using markers and parsed incrementally, so containers holding
+        millions of objects can be walked in constant memory.
+
+        For a full list of available parameters, please refer to the official
+        API reference:
+        https://docs.openstack.org/api-ref/object-store/#show-container-details-and-list-objects
+
+        :param int limit: Number of objects requested per page
+        :return: a generator of object records as returned by the listing in
+                 JSON format
+        """
+        return iter_listing(self, str(container_name), params, limit)
@@ -12,14 +12,74 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
+from concurrent import futures
+import hashlib
 import ssl
+import threading
+import time
 
 from http import client as httplib
 from urllib import parse as urlparse
 
+from oslo_serialization import jsonutils as json
+
+from tempest.lib.common import http
 from tempest.lib.common import rest_client
+from tempest.lib.common.utils import streaming
 from tempest.lib import exceptions
 
+# Size of the chunks read from a ranged download before writing them out
+DOWNLOAD_CHUNKSIZE = 1024 * 1024
+
+
+class TransferStats(object):
+    """Summary of a segmented object upload or download
+
+    :param list segments: The names of the uploaded segments, or the
+                          ``(start, end)`` byte ranges which were downloaded
+    :param int size: Total number of bytes transferred
+    :param float elapsed: Wall clock duration of the transfer in seconds
+    """
+
+    def __init__(self, segments, size, elapsed):
+        self.segments = segments
+        self.size = size
+        self.elapsed = elapsed
+
+    @property
+    def throughput(self):
+        """Transfer rate in bytes per second"""
+        if not self.elapsed:
+            return float(self.size)
+        return self.size / self.elapsed
+
+    def __str__(self):
+        return ("%d bytes in %d segments, %.3f seconds, %.2f MiB/s" %
+                (self.size, len(self.segments), self.elapsed,
+                 self.throughput / (1024 * 1024)))
+
+
+def _iter_segments(data, segment_size):
+    """Split bytes-like or file-like data into segments
+
+    Bytes-like data is sliced without copying, file-like data is read one
+    segment at a time so it never has to fit in memory at once.
+    """
+    if hasattr(data, 'read'):
+        segment = data.read(segment_size)
+        # Always produce at least one, possibly empty, segment
+        yield segment
+        while True:
+            segment = data.read(segment_size)
+            if not segment:
+                return
+            yield segment
+    else:
+        view = memoryview(data or b'')
+        yield view[:segment_size]
+        for offset in range(segment_size, len(view), segment_size):
+            yield view[offset:offset + segment_size]
+
 
 class ObjectClient(rest_client.RestClient):
 
@@ -96,6 +156,199 @@ class ObjectClient(rest_client.RestClient):
         self.expected_success([200, 206], resp.status)
         return resp, body
 
+    def stream_object(self, container, object_name, dest=None,
+                      metadata=None, params=None,
+                      algorithms=streaming.DEFAULT_ALGORITHMS,
+                      buffer_size=streaming.BUFFER_SIZE):
+        """Retrieve object's data into a file or a buffer
+
+        The object data is streamed, so it is never held in memory as a
+        whole, and its checksums are computed while it is downloaded, e.g.
+        the ``md5`` one to compare with the ``etag`` of the object.
+
+        :param str container: Container holding the object
+        :param str object_name: Name of the object
+        :param dest: Path of the file to write, a file-like object with a
+                     ``write`` method, a writable buffer large enough for the
+                     data, or None to only compute the checksums
+        :param dict metadata: Additional headers sent with the request
+        :param dict params: Query parameters of the request
+        :param algorithms: Names of the ``hashlib`` algorithms of the
+                           checksums
+        :param int buffer_size: Size in bytes of the read buffer
+        :rtype: tuple
+        :return: a tuple with the response and a StreamStats object with the
+                 size, throughput and checksums of the data
+        """
+        url = "{0}/{1}".format(container, object_name)
+        if params:
+            url += '?%s' % urlparse.urlencode(params)
+        resp, _ = self.get(url, headers=dict(metadata or {}), chunked=True)
+        try:
+            self.expected_success([200, 206], resp.status)
+        except Exception:
+            resp.release_conn()
+            raise
+        stats = streaming.stream_response(resp, dest, algorithms=algorithms,
+                                          buffer_size=buffer_size)
+        self.LOG.debug("Downloaded %s/%s: %s", container, object_name, stats)
+        # The raw response does not know the URL of the request
+        url = '%s/%s' % (self.base_url.rstrip('/'), url)
+        return http.Response.from_urllib3(resp, url), stats
+
+    def create_large_object(self, container, object_name, data,
+                            segment_size, manifest_type='slo',
+                            segment_container=None, concurrency=4,
+                            metadata=None):
+        """Upload an object as segments in parallel and write its manifest
+
+        The data is split into segments of ``segment_size`` bytes which are
+        uploaded concurrently over a pool of persistent connections. Once all
+        the segments are stored, a static (SLO) or dynamic (DLO) large object
+        manifest is written as ``object_name``.
+
+        :param str container: Container holding the manifest object
+        :param str object_name: Name of the manifest object
+        :param data: bytes-like object or file-like object with a ``read``
+                     method providing the object content
+        :param int segment_size: Size in bytes of each segment
+        :param str manifest_type: Either 'slo' or 'dlo'
+        :param str segment_container: Container holding the segments,
+                                      defaults to ``container``
+        :param int concurrency: Maximum number of segments uploaded at once
+        :param dict metadata: Headers set on the manifest object
+        :rtype: tuple
+        :return: a tuple with the response of the manifest creation and a
+                 TransferStats object listing the uploaded segment names
+        """
+        if manifest_type not in ('slo', 'dlo'):
+            raise exceptions.InvalidParam(
+                invalid_param='manifest_type=%s' % manifest_type)
+        segment_container = segment_container or container
+        segment_prefix = '%s/segments/' % object_name
+
+        client = self.pooled_client(concurrency)
+        # Bound the number of segments read ahead of the uploads, so that
+        # file-like data never holds more than this many segments in memory
+        slots = threading.BoundedSemaphore(concurrency * 2)
+
+        def _upload_segment(segment_name, segment):
+            try:
+                etag = hashlib.md5(segment,
+                                   usedforsecurity=False).hexdigest()
+                client.create_object(segment_container, segment_name,
+                                     segment)
+                return {'path': '/%s/%s' % (segment_container, segment_name),
+                        'etag': etag,
+                        'size_bytes': len(segment)}
+            finally:
+                slots.release()
+
+        start = time.time()
+        try:
+            with futures.ThreadPoolExecutor(concurrency) as executor:
+                uploads = []
+                for index, segment in enumerate(
+                        _iter_segments(data, segment_size)):
+                    slots.acquire()
+                    uploads.append(executor.submit(
+                        _upload_segment,
+                        '%s%08d' % (segment_prefix, index), segment))
+                # Re-raise the first failure, if any
+                segments = [upload.result() for upload in uploads]
+        finally:
+            client.http_obj.clear()
+        stats = TransferStats(
+            [segment['path'].split('/', 2)[2] for segment in segments],
+            sum(segment['size_bytes'] for segment in segments),
+            time.time() - start)
+        self.LOG.debug("Uploaded segments of %s/%s: %s",
+                       container, object_name, stats)
+
+        if manifest_type == 'slo':
+            resp, _ = self.create_object(
+                container, object_name, json.dumps(segments),
+                params={'multipart-manifest': 'put'}, metadata=metadata)
+        else:
+            metadata = dict(metadata or {})
+            metadata['X-Object-Manifest'] = '%s/%s' % (segment_container,
+                                                       segment_prefix)
+            resp, _ = self.create_object(container, object_name, '',
+                                         metadata=metadata)
+        return resp, stats
+
+    def download_object(self, container, object_name, dest,
+                        range_size=64 * 1024 * 1024, concurrency=4,
+                        metadata=None):
+        """Download an object with parallel ranged requests
+
+        The object is split into byte ranges of ``range_size`` bytes which
+        are fetched concurrently over a pool of persistent connections and
+        streamed to their offset in ``dest``, so the object content is never
+        held in memory as a whole. This works for large objects as well.
+
+        :param str container: Container holding the object
+        :param str object_name: Name of the object
+        :param dest: Path of the file to write, or a writable and seekable
+                     file-like object
+        :param int range_size: Size in bytes of each ranged request
+        :param int concurrency: Maximum number of ranges fetched at once
+        :param dict metadata: Additional headers sent with each request
+        :rtype: tuple
+        :return: a tuple with the response of the HEAD request on the object
+                 and a TransferStats object listing the downloaded ranges
+        """
+        resp, _ = self.list_object_metadata(container, object_name,
+                                            headers=dict(metadata or {}))
+        size = int(resp['content-length'])
+        ranges = [(offset, min(offset + range_size, size) - 1)
+                  for offset in range(0, size, range_size)]
+        url = "{0}/{1}".format(container, object_name)
+
+        if isinstance(dest, str):
+            dest_file = open(dest, 'wb')
+        else:
+            dest_file = dest
+        write_lock = threading.Lock()
+        client = self.pooled_client(concurrency)
+
+        def _download_range(first, last):
+            headers = dict(metadata or {})
+            headers['Range'] = 'bytes=%d-%d' % (first, last)
+            range_resp, _ = client.get(url, headers=headers, chunked=True)
+            try:
+                client.expected_success([200, 206], range_resp.status)
+                if range_resp.status != 206 and len(ranges) > 1:
+                    # The server ignored the Range header, writing the
+                    # whole content at this offset would corrupt the file
+                    raise exceptions.UnexpectedResponseCode(
+                        "Expected a partial content response for range "
+                        "%d-%d, got %d" % (first, last, range_resp.status))
+                offset = first
+                for chunk in range_resp.stream(DOWNLOAD_CHUNKSIZE):
+                    with write_lock:
+                        dest_file.seek(offset)
+                        dest_file.write(chunk)
+                    offset += len(chunk)
+            finally:
+                range_resp.release_conn()
+
+        start = time.time()
+        try:
+            with futures.ThreadPoolExecutor(concurrency) as executor:
+                downloads = [executor.submit(_download_range, first, last)
+                             for first, last in ranges]
+                for download in downloads:
+                    download.result()
+            dest_file.flush()
+        finally:
+            client.http_obj.clear()
+            if dest_file is not dest:
+                dest_file.close()
+        stats = TransferStats(ranges, size, time.time() - start)
+        self.LOG.debug("Downloaded %s/%s: %s", container, object_name, stats)
+        return resp, stats
+
     def copy_object_2d_way(self, container, src_object_name, dest_object_name,
                            metadata=None):
         """Copy storage object's data to the new object using COPY."""
@@ -103,6 +103,22 @@ class SnapshotsClient(rest_client.RestClient):
             return True
         return False
 
+    def deleted_resources(self, ids):
+        """Return the ids of the snapshots which are deleted
+
+        The snapshots are checked with a single list request, only the
+        snapshots missing from the list are checked one by one.
+
+        :param ids: The ids of the snapshots to check
+        """
+        body = self.list_snapshots()
+        if body.get('snapshots_links'):
+            # Paginated list, a missing snapshot can be on another page
+            return super(SnapshotsClient, self).deleted_resources(ids)
+        listed = set(snapshot['id'] for snapshot in body['snapshots'])
+        return set(id for id in ids
+                   if id not in listed and self.is_resource_deleted(id))
+
     @property
     def resource_type(self):
         """Returns the primary type of resource this client works with."""
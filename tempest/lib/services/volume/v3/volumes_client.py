@@ -255,6 +255,32 @@ class VolumesClient(base_client.BaseClient):
                 volume['volume']['id'])
         return False
 
+    def deleted_resources(self, ids):
+        """Return the ids of the volumes which are deleted
+
+        The volumes are checked with a single list request, only the
+        volumes missing from the list are checked one by one.
+
+        :param ids: The ids of the volumes to check
+        :raises lib_exc.DeleteErrorException: If one of the volumes is on the
+            status the delete was failed.
+        """
+        body = self.list_volumes(detail=True)
+        if body.get('volumes_links'):
+            # Paginated list, a missing volume can be on another page
+            return super(VolumesClient, self).deleted_resources(ids)
+        volumes = {volume['id']: volume for volume in body['volumes']}
+        deleted = set()
+        for id in ids:
+            if id not in volumes:
+                if self.is_resource_deleted(id):
+                    deleted.add(id)
+            elif volumes[id]['status'] == 'error_deleting':
+                raise lib_exc.DeleteErrorException(
+                    "Volume %s failed to delete and is in error_deleting "
+                    "status" % id)
+        return deleted
+
     @property
     def resource_type(self):
         """Returns the primary type of resource this client works with."""
@@ -29,6 +29,7 @@ from oslo_serialization import jsonutils as json
 from oslo_utils import netutils
 
 from tempest.common import compute
+from tempest.common import console_log
 from tempest.common.utils.linux import remote_client
 from tempest.common.utils import net_utils
 from tempest.common import waiters
@@ -126,6 +127,8 @@ class ScenarioTest(tempest.test.BaseTestCase):
     def setup_clients(cls):
         """This setup the service clients for the tests"""
         super(ScenarioTest, cls).setup_clients()
+        cls.console_log_collector = console_log.ConsoleLogCollector(
+            output_dir=CONF.debug.console_output_dir)
         if CONF.service_available.glance:
             if CONF.image_feature_enabled.api_v2:
                 cls.image_client = cls.os_primary.image_client_v2
@@ -900,7 +903,12 @@ class ScenarioTest(tempest.test.BaseTestCase):
         return image['id']
 
     def log_console_output(self, servers=None, client=None, **kwargs):
-        """Console log output"""
+        """Console log output
+
+        Only the console output added since the last call for the same
+        server is fetched and logged, or written to the server file in
+        ``[debug]/console_output_dir`` when it is set.
+        """
         if not CONF.compute_feature_enabled.console_output:
             LOG.debug('Console output not supported, cannot log')
             return
@@ -908,15 +916,7 @@ class ScenarioTest(tempest.test.BaseTestCase):
         if not servers:
             servers = client.list_servers()
             servers = servers['servers']
-        for server in servers:
-            try:
-                console_output = client.get_console_output(
-                    server['id'], **kwargs)['output']
-                LOG.debug('Console output for %s\nbody=\n%s',
-                          server['id'], console_output)
-            except lib_exc.NotFound:
-                LOG.debug("Server %s disappeared(deleted) while looking "
-                          "for the console log", server['id'])
+        self.console_log_collector.collect(client, servers, **kwargs)
 
     def _log_net_info(self, exc):
         """network debug is called as part of ssh init"""
@@ -1885,8 +1885,13 @@ class ObjectStorageScenarioTest(ScenarioTest):
             present_obj = []
         if not_present_obj is None:
             not_present_obj = []
-        _, object_list = self.container_client.list_container_objects(
-            container_name)
+        # Only keep the names we check for, so huge containers can be
+        # listed without holding the whole listing in memory
+        wanted = set(present_obj) | set(not_present_obj)
+        object_list = set(
+            obj['name'] for obj in
+            self.container_client.iter_container_objects(container_name)
+            if obj['name'] in wanted)
         if present_obj:
             for obj in present_obj:
                 self.assertIn(obj, object_list)
@@ -25,11 +25,15 @@ from oslo_log import log as logging
 import testtools
 
 from tempest import clients
+from tempest.common import concurrency
 from tempest.common import credentials_factory as credentials
 from tempest import config
 from tempest.lib.common import api_microversion_fixture
+from tempest.lib.common import cassette
+from tempest.lib.common import deletion_tracker
 from tempest.lib.common import fixed_network
 from tempest.lib.common import profiler
+from tempest.lib.common import response_cache
 from tempest.lib.common import validation_resources as vr
 from tempest.lib import exceptions as lib_exc
 
@@ -52,6 +56,47 @@ def validate_tearDownClass():
 atexit.register(validate_tearDownClass)
 
 
+def _track_deletion(client, resource_id, *args, **kwargs):
+    deletion_tracker.DeletionTracker().track(client, resource_id, *args,
+                                             **kwargs)
+
+
+def _drain_deletions(errors):
+    """Wait for the tracked deletions, recording the errors in `errors`"""
+    tracker = deletion_tracker.DeletionTracker()
+    if not tracker.pending():
+        return
+    try:
+        tracker.drain()
+    except testtools.MultipleExceptions as e:
+        errors.extend(e.args)
+    except Exception:
+        errors.append(sys.exc_info())
+
+
+class _ConcurrentCleanups(object):
+    """A step of the class cleanup stack whose cleanups run concurrently"""
+
+    def __init__(self, group, max_workers):
+        self.group = group
+        self.max_workers = max_workers
+        self.cleanups = []
+
+    def _run(self, cleanup):
+        fn, args, kwargs = cleanup
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            return sys.exc_info()
+
+    def __call__(self):
+        errors = concurrency.run_in_threads(self._run, self.cleanups,
+                                            max_workers=self.max_workers)
+        errors = [error for error in errors if error]
+        if errors:
+            raise testtools.MultipleExceptions(*errors)
+
+
 class BaseTestCase(testtools.testcase.WithAttributes,
                    testtools.TestCase):
     """The test base class defines Tempest framework for class level fixtures.
@@ -104,6 +149,10 @@ class BaseTestCase(testtools.testcase.WithAttributes,
     # A way to adjust slow test classes
     TIMEOUT_SCALING_FACTOR = 1
 
+    # Maximum number of cleanups added with addConcurrentClassResourceCleanup
+    # running at the same time
+    CLEANUP_CONCURRENCY = 8
+
     # An interprocess lock to implement serial test execution if requested.
     # The serial test classes are the writers as only one of them can be
     # executed. The rest of the test classes are the readers as many of them
@@ -148,6 +197,20 @@ class BaseTestCase(testtools.testcase.WithAttributes,
 
         # Reset state
         cls._reset_class()
+        if CONF.debug.cassette_mode:
+            cassette.enable(
+                os.path.join(CONF.debug.cassette_dir,
+                             '%s.%s' % (cls.__module__, cls.__name__)),
+                CONF.debug.cassette_mode,
+                latency=CONF.debug.cassette_latency)
+        if (CONF.service_clients.response_cache_ttl and
+                not response_cache.is_enabled()):
+            # The cache is shared by all the test classes of the process
+            response_cache.enable(
+                ttl=CONF.service_clients.response_cache_ttl,
+                max_size=CONF.service_clients.response_cache_size,
+                cached_collections=(
+                    CONF.service_clients.response_cache_collections))
         # It should never be overridden by descendants
         if hasattr(super(BaseTestCase, cls), 'setUpClass'):
             super(BaseTestCase, cls).setUpClass()
@@ -238,6 +301,11 @@ class BaseTestCase(testtools.testcase.WithAttributes,
                 LOG.debug('%s released the write lock', cls.__name__)
             else:
                 cls.serial_rw_lock.release_read_lock()
+            if CONF.debug.cassette_mode:
+                cassette.disable()
+            if response_cache.is_enabled():
+                LOG.debug('Response cache statistics: %s',
+                          response_cache.stats())
 
         # If exceptions were raised during teardown, and not before, re-raise
         # the first one
@@ -540,7 +608,10 @@ class BaseTestCase(testtools.testcase.WithAttributes,
         Some test resources have an asynchronous delete process. It's best
         practice for them to schedule a wait for delete via
         `addClassResourceCleanup` to avoid having resources in process of
-        deletion when we reach the credentials cleanup step.
+        deletion when we reach the credentials cleanup step. Resources whose
+        client implements `is_resource_deleted` can use
+        `addClassResourceDeletionWait` instead, so that their deletions are
+        waited for together.
 
         Example::
 
@@ -619,11 +690,15 @@ class BaseTestCase(testtools.testcase.WithAttributes,
         cls.__resource_cleanup_called = True
         cleanup_errors = []
         while cls._class_cleanups:
+            fn, args, kwargs = cls._class_cleanups.pop()
+            if fn is not _track_deletion:
+                # The cleanup may depend on the deletions waited for so far
+                _drain_deletions(cleanup_errors)
             try:
-                fn, args, kwargs = cls._class_cleanups.pop()
                 fn(*args, **kwargs)
             except Exception:
                 cleanup_errors.append(sys.exc_info())
+        _drain_deletions(cleanup_errors)
         if cleanup_errors:
             raise testtools.MultipleExceptions(*cleanup_errors)
 
@@ -644,6 +719,80 @@ class BaseTestCase(testtools.testcase.WithAttributes,
         """
         cls._class_cleanups.append((fn, arguments, keywordArguments))
 
+    @classmethod
+    def addClassResourceDeletionWait(cls, client, resource_id, *arguments,
+                                     **keywordArguments):
+        """Add a wait for the deletion of a resource to resource_cleanup.
+
+        It replaces a cleanup calling `client.wait_for_resource_deletion`,
+        which waits for the resources one after the other. Consecutive
+        deletion waits in the cleanup stack are gathered instead, and the
+        deletions are waited for together by the
+        :py:class:`tempest.lib.common.deletion_tracker.DeletionTracker`
+        before the next cleanup is called, which takes as long as the
+        slowest deletion. Clients which implement `deleted_resources` check
+        all of their resources with a single request.
+
+        Example::
+
+            for volume in volumes:
+                cls.addClassResourceDeletionWait(cls.volumes_client,
+                                                 volume['id'])
+            for volume in volumes:
+                cls.addClassResourceCleanup(
+                    test_utils.call_and_ignore_notfound_exc,
+                    cls.volumes_client.delete_volume, volume['id'])
+
+        :param client: The client of the resource, which implements
+            `is_resource_deleted`
+        :param resource_id: The id of the resource
+        :param arguments: Extra positional arguments for
+            `is_resource_deleted`
+        :param keywordArguments: Extra keyword arguments for
+            `is_resource_deleted`
+        """
+        cls._class_cleanups.append(
+            (_track_deletion, (client, resource_id) + arguments,
+             keywordArguments))
+
+    @classmethod
+    def addConcurrentClassResourceCleanup(cls, group, fn, *arguments,
+                                          **keywordArguments):
+        """Add a cleanup function which can run concurrently with others.
+
+        Cleanups added with consecutive calls for the same `group` form a
+        single step of the cleanup stack, and the functions of a step are
+        called concurrently by up to `CLEANUP_CONCURRENCY` threads. Steps
+        keep being processed in reverse order of adding, with respect to
+        each other and to the cleanups added with `addClassResourceCleanup`,
+        so resources which depend on each other must not share a step.
+
+        Each cleanup must be self-contained, e.g. delete a resource and then
+        wait for its deletion. A waiter added to the step of the call
+        deleting its resource could take every thread of the step before
+        the deletion is called, and never return. All the cleanups of a
+        step are called whatever the outcome of the others, exceptions are
+        accumulated and re-raised as a `MultipleExceptions`.
+
+        Example::
+
+            def delete_server(server_id):
+                test_utils.call_and_ignore_notfound_exc(
+                    cls.servers_client.delete_server, server_id)
+                waiters.wait_for_server_termination(cls.servers_client,
+                                                    server_id)
+
+            for server in servers:
+                cls.addConcurrentClassResourceCleanup(
+                    'servers', delete_server, server['id'])
+        """
+        step = cls._class_cleanups[-1][0] if cls._class_cleanups else None
+        if not (isinstance(step, _ConcurrentCleanups) and
+                step.group == group):
+            step = _ConcurrentCleanups(group, cls.CLEANUP_CONCURRENCY)
+            cls._class_cleanups.append((step, (), {}))
+        step.cleanups.append((fn, arguments, keywordArguments))
+
     def setUp(self):
         super(BaseTestCase, self).setUp()
         if not self.__setupclass_called:
@@ -766,7 +915,8 @@ class BaseTestCase(testtools.testcase.WithAttributes,
             use_neutron=CONF.service_available.neutron,
             ethertype='IPv' + str(CONF.validation.ip_version_for_ssh),
             floating_network_id=CONF.network.public_network_id,
-            floating_network_name=CONF.network.floating_network_name)
+            floating_network_name=CONF.network.floating_network_name,
+            concurrent=CONF.validation.concurrent_provisioning)
 
     @classmethod
     def get_class_validation_resources(cls, os_clients):
@@ -806,6 +956,7 @@ class BaseTestCase(testtools.testcase.WithAttributes,
         cls.addClassResourceCleanup(
             vr.clear_validation_resources, os_clients,
             use_neutron=CONF.service_available.neutron,
+            concurrent=CONF.validation.concurrent_provisioning,
             **resources)
         cls._validation_resources[os_clients] = resources
         return resources
@@ -0,0 +1,367 @@
+# Copyright 2026 OpenStack Foundation
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Static test discovery index
+
+Enumerating tests through ``unittest`` discovery imports every test module of
+tempest and of all installed plugins. This module builds the same list of
+test ids by parsing the test modules with :mod:`ast` instead. The result is
+persisted on disk and each file is only parsed again when its mtime or size
+changed and its content hash no longer matches, so listing, filtering and
+partitioning tests is cheap once the index is warm.
+
+The index understands the decorators which end up in tempest test ids:
+``decorators.idempotent_id``, ``decorators.attr`` and ``utils.services``.
+Attributes applied with a non constant ``condition`` cannot be evaluated
+without the tempest configuration and are left out of the test id; modules
+defining ``load_tests`` generate tests dynamically and are reported by
+:meth:`DiscoveryIndex.dynamic_modules`.
+"""
+
+import ast
+import hashlib
+import os
+import re
+
+from oslo_log import log as logging
+from oslo_serialization import jsonutils as json
+from stestr import scheduler
+from stestr import selection
+
+LOG = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+DEFAULT_INDEX_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+    'tempest', 'discovery_index.json')
+TEST_FILE_PATTERN = re.compile(r'^test.*\.py$')
+TEST_METHOD_PREFIX = 'test'
+# Same grouping tempest configures for stestr in .stestr.conf, all the tests
+# of a class are scheduled on the same worker.
+GROUP_REGEX = re.compile(r'([^\.]*\.)*')
+
+
+def _dotted_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        parent = _dotted_name(node.value)
+        if parent:
+            return '%s.%s' % (parent, node.attr)
+    return None
+
+
+def _constant_strings(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return [node.value]
+    if isinstance(node, (ast.List, ast.Tuple)):
+        values = []
+        for elt in node.elts:
+            if not (isinstance(elt, ast.Constant) and
+                    isinstance(elt.value, str)):
+                return []
+            values.append(elt.value)
+        return values
+    return []
+
+
+def _decorator_attrs(decorator):
+    """Return the testtools attributes a decorator applies to a test"""
+    if not isinstance(decorator, ast.Call):
+        return []
+    name = _dotted_name(decorator.func) or ''
+    name = name.rsplit('.', 1)[-1]
+    if name == 'idempotent_id':
+        ids = _constant_strings(decorator.args[0]) if decorator.args else []
+        return ['id-%s' % i for i in ids]
+    if name == 'services':
+        attrs = []
+        for arg in decorator.args:
+            attrs.extend(_constant_strings(arg))
+        return attrs
+    if name == 'attr':
+        kwargs = {kw.arg: kw.value for kw in decorator.keywords}
+        condition = kwargs.get('condition')
+        if condition is not None and not (
+                isinstance(condition, ast.Constant) and condition.value):
+            return []
+        attrs = []
+        for arg in decorator.args:
+            attrs.extend(_constant_strings(arg))
+        if 'type' in kwargs:
+            attrs.extend(_constant_strings(kwargs['type']))
+        return attrs
+    return []
+
+
+def _module_name(path, top_dir):
+    rel_path = os.path.relpath(os.path.splitext(path)[0], top_dir)
+    return rel_path.replace(os.sep, '.')
+
+
+def scan_module(path, module):
+    """Parse a test module and return its index entry
+
+    :param path: path of the python file
+    :param module: dotted module name of the file
+    :return: a dict with the ``classes`` defined by the module, their
+        resolved base class names and the attributes of their test methods,
+        and whether the module generates tests through ``load_tests``
+    """
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=path)
+    package = module.rsplit('.', 1)[0] if '.' in module else ''
+    names = {}
+    dynamic = False
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    names[alias.asname] = alias.name
+                else:
+                    top = alias.name.split('.', 1)[0]
+                    names[top] = top
+        elif isinstance(node, ast.ImportFrom):
+            source = node.module or ''
+            if node.level:
+                parts = package.split('.')
+                parts = parts[:len(parts) - node.level + 1]
+                source = '.'.join(p for p in parts + [source] if p)
+            for alias in node.names:
+                names[alias.asname or alias.name] = '%s.%s' % (source,
+                                                               alias.name)
+        elif isinstance(node, ast.ClassDef):
+            names[node.name] = '%s.%s' % (module, node.name)
+        elif (isinstance(node, ast.FunctionDef) and
+              node.name == 'load_tests'):
+            dynamic = True
+
+    def resolve(dotted):
+        head, _, tail = dotted.partition('.')
+        if head not in names:
+            return dotted
+        return '.'.join(p for p in (names[head], tail) if p)
+
+    classes = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = [resolve(name) for name in map(_dotted_name, node.bases)
+                 if name]
+        tests = {}
+        for item in node.body:
+            if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if not item.name.startswith(TEST_METHOD_PREFIX):
+                continue
+            attrs = set()
+            for decorator in item.decorator_list:
+                attrs.update(_decorator_attrs(decorator))
+            tests[item.name] = sorted(attrs)
+        classes[node.name] = {'bases': bases, 'tests': tests}
+    return {'module': module, 'dynamic': dynamic, 'classes': classes}
+
+
+def find_modules(test_dir, top_dir):
+    """Yield (path, module) for the python modules of a test directory
+
+    Only packages are walked, like unittest discovery does. Besides the test
+    modules this includes the helper modules they take base classes from.
+    """
+    for dirpath, dirnames, filenames in os.walk(test_dir):
+        if (dirpath != test_dir and
+                not os.path.isfile(os.path.join(dirpath, '__init__.py'))):
+            dirnames[:] = []
+            continue
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith('.py'):
+                path = os.path.join(dirpath, filename)
+                yield path, _module_name(path, top_dir)
+
+
+def _file_hash(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class DiscoveryIndex(object):
+    """Persistent index of the test ids of tempest and its plugins
+
+    :param path: location of the on-disk cache, defaults to
+        ``$XDG_CACHE_HOME/tempest/discovery_index.json``
+    """
+
+    def __init__(self, path=None):
+        self.path = path or DEFAULT_INDEX_PATH
+        self.files = {}
+        self.changed = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                data = json.loads(f.read())
+        except (IOError, ValueError):
+            return
+        if data.get('version') == INDEX_VERSION:
+            self.files = data.get('files', {})
+
+    def save(self):
+        """Write the index to disk, failures are only logged"""
+        tmp_path = '%s.%d.tmp' % (self.path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                f.write(json.dumps({'version': INDEX_VERSION,
+                                    'files': self.files}))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            LOG.warning('Unable to save test discovery index %s: %s',
+                        self.path, e)
+
+    def update(self, test_dirs):
+        """Refresh the index for the given test directories
+
+        Files whose mtime and size did not change are not read at all, files
+        whose content hash did not change are not parsed again. Entries of
+        files which are no longer found are dropped.
+
+        :param test_dirs: iterable of (test_dir, top_level_dir) tuples
+        :return: the index itself
+        """
+        files = {}
+        for test_dir, top_dir in test_dirs:
+            for path, module in find_modules(test_dir, top_dir):
+                files[path] = self._get_entry(path, module)
+        self.files = files
+        return self
+
+    def _get_entry(self, path, module):
+        stat = os.stat(path)
+        entry = self.files.get(path)
+        if (entry and entry['module'] == module and
+                entry['mtime'] == stat.st_mtime_ns and
+                entry['size'] == stat.st_size):
+            return entry
+        digest = _file_hash(path)
+        if not (entry and entry['module'] == module and
+                entry['sha256'] == digest):
+            try:
+                entry = scan_module(path, module)
+            except SyntaxError as e:
+                LOG.warning('Unable to parse test module %s: %s', path, e)
+                entry = {'module': module, 'dynamic': True, 'classes': {}}
+        self.changed += 1
+        entry.update(mtime=stat.st_mtime_ns, size=stat.st_size,
+                     sha256=digest)
+        return entry
+
+    def dynamic_modules(self):
+        """Modules whose test ids can only be known by importing them"""
+        return sorted(entry['module'] for entry in self.files.values()
+                      if entry['dynamic'])
+
+    def test_ids(self):
+        """Return the sorted list of the test ids in the index"""
+        classes = {}
+        for entry in self.files.values():
+            for name, info in entry['classes'].items():
+                classes['%s.%s' % (entry['module'], name)] = info
+        resolved = {}
+
+        def get_tests(name, seen=()):
+            # Returns (tests, is_test_case); a class is a test case when its
+            # hierarchy reaches a base class outside of the indexed modules,
+            # like tempest.test.BaseTestCase, mixins only inherit object.
+            if name in resolved:
+                return resolved[name]
+            info = classes[name]
+            tests = {}
+            is_test_case = False
+            for base in reversed(info['bases']):
+                if base in classes and base not in seen:
+                    base_tests, base_case = get_tests(base, seen + (name,))
+                    tests.update(base_tests)
+                    is_test_case = is_test_case or base_case
+                elif base not in ('object', 'builtins.object'):
+                    is_test_case = True
+            tests.update(info['tests'])
+            resolved[name] = (tests, is_test_case)
+            return resolved[name]
+
+        ids = []
+        for path, entry in self.files.items():
+            if not TEST_FILE_PATTERN.match(os.path.basename(path)):
+                continue
+            for name in entry['classes']:
+                name = '%s.%s' % (entry['module'], name)
+                tests, is_test_case = get_tests(name)
+                if not is_test_case:
+                    continue
+                for test, attrs in tests.items():
+                    test_id = '%s.%s' % (name, test)
+                    if attrs:
+                        test_id = '%s[%s]' % (test_id, ','.join(attrs))
+                    ids.append(test_id)
+        return sorted(ids)
+
+    def filter(self, regexes=None, include_list=None, exclude_list=None,
+               exclude_regex=None):
+        """Select test ids with the same semantics as ``stestr run``"""
+        return sorted(selection.construct_list(
+            self.test_ids(), regexes=regexes, include_list=include_list,
+            exclude_list=exclude_list, exclude_regex=exclude_regex))
+
+    @staticmethod
+    def partition(test_ids, concurrency, repository=None):
+        """Split test ids in worker partitions keeping classes together
+
+        :param test_ids: the test ids to partition
+        :param concurrency: number of workers
+        :param repository: optional stestr repository used to balance the
+            partitions with the recorded test durations
+        :return: a list of ``concurrency`` lists of test ids
+        """
+        return scheduler.partition_tests(
+            test_ids, concurrency, repository,
+            lambda test_id: GROUP_REGEX.match(test_id).group(0))
+
+
+def get_test_dirs(plugin_manager=None):
+    """Return the (test_dir, top_level_dir) pairs of tempest and plugins"""
+    from tempest.test_discover import plugins
+    from tempest.test_discover import test_discover
+
+    plugin_manager = plugin_manager or plugins.TempestTestPluginManager()
+    test_dirs = [(os.path.join(test_discover.BASE_PATH, 'tempest', test_dir),
+                  test_discover.BASE_PATH)
+                 for test_dir in test_discover.TEST_DIRS]
+    plugin_load_tests = plugin_manager.get_plugin_load_tests_tuple()
+    for plugin in sorted(plugin_load_tests or {}):
+        test_dirs.append(tuple(plugin_load_tests[plugin]))
+    return test_dirs
+
+
+def load_index(path=None, test_dirs=None):
+    """Return an up to date index, saving it if anything changed"""
+    index = DiscoveryIndex(path)
+    previous = set(index.files)
+    index.update(test_dirs or get_test_dirs())
+    if index.changed or previous != set(index.files):
+        index.save()
+    return index
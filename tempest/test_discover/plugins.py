@@ -176,14 +176,30 @@ class TempestTestPluginManager(object):
 
     This class is used to manage the lifecycle of external tempest test
     plugins. It provides functions for getting set
+
+    The manager is a process-wide singleton, so the plugins are imported and
+    instantiated once per process. The option lists returned by the plugins
+    are memoized.
     """
 
+    NAMESPACE = 'tempest.test_plugins'
+
     def __init__(self):
+        self._opt_lists = {}
         self.ext_plugins = stevedore.ExtensionManager(
-            'tempest.test_plugins', invoke_on_load=True,
+            self.NAMESPACE, invoke_on_load=True,
             propagate_map_exceptions=True,
             on_load_failure_callback=self.failure_hook)
 
+    @property
+    def ext_plugins(self):
+        return self._ext_plugins
+
+    @ext_plugins.setter
+    def ext_plugins(self, ext_plugins):
+        self._ext_plugins = ext_plugins
+        self._opt_lists = {}
+
     @staticmethod
     def failure_hook(_, ep, err):
         LOG.error('Could not load %r: %s', ep.name, err)
@@ -209,9 +225,11 @@ class TempestTestPluginManager(object):
     def get_plugin_options_list(self):
         plugin_options = []
         for plug in self.ext_plugins:
-            opt_list = plug.obj.get_opt_lists()
-            LOG.info('List additional config options registered by '
-                     'Tempest plugin: %s', plug.name)
+            if plug.name not in self._opt_lists:
+                LOG.info('List additional config options registered by '
+                         'Tempest plugin: %s', plug.name)
+                self._opt_lists[plug.name] = plug.obj.get_opt_lists()
+            opt_list = self._opt_lists[plug.name]
 
             if opt_list:
                 plugin_options.extend(opt_list)
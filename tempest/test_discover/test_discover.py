@@ -17,22 +17,24 @@ import unittest
 
 from tempest.test_discover import plugins
 
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+TEST_DIRS = ('api', 'scenario', 'serial_tests')
+
 
 def load_tests(loader, tests, pattern):
     ext_plugins = plugins.TempestTestPluginManager()
 
     suite = unittest.TestSuite()
-    base_path = os.path.split(os.path.dirname(os.path.abspath(__file__)))[0]
-    base_path = os.path.split(base_path)[0]
     # Load local tempest tests
-    for test_dir in ['api', 'scenario', 'serial_tests']:
-        full_test_dir = os.path.join(base_path, 'tempest', test_dir)
+    for test_dir in TEST_DIRS:
+        full_test_dir = os.path.join(BASE_PATH, 'tempest', test_dir)
         if not pattern:
             suite.addTests(loader.discover(full_test_dir,
-                                           top_level_dir=base_path))
+                                           top_level_dir=BASE_PATH))
         else:
             suite.addTests(loader.discover(full_test_dir, pattern=pattern,
-                                           top_level_dir=base_path))
+                                           top_level_dir=BASE_PATH))
 
     plugin_load_tests = ext_plugins.get_plugin_load_tests_tuple()
     if not plugin_load_tests:
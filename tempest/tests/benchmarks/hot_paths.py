@@ -0,0 +1,236 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Benchmarks of the tempest.lib hot paths
+
+Each benchmark is a function registered with the ``benchmark`` decorator.
+It receives a ``fixtures.Fixture`` which is already set up, and which it can
+use to register cleanups or other fixtures, prepares its input data and
+returns the callable to be timed. Only the returned callable is measured.
+"""
+
+import collections
+from concurrent import futures
+import copy
+import json
+import os
+
+import fixtures
+from oslo_concurrency.fixture import lockutils as lockutils_fixtures
+from testtools import content
+import yaml
+
+from tempest.cmd import subunit_describe_calls
+from tempest.lib.api_schema.response.compute.v2_1 import servers as schema
+from tempest.lib import auth
+from tempest.lib.cli import output_parser
+from tempest.lib.common import preprov_creds
+from tempest.lib.common import rest_client
+from tempest.lib.common.utils import test_utils
+from tempest.tests.lib import fake_auth_provider
+from tempest.tests.lib import fake_credentials
+from tempest.tests.lib import fake_http
+
+
+BENCHMARKS = collections.OrderedDict()
+
+SERVER = {
+    'accessIPv4': '',
+    'accessIPv6': '',
+    'addresses': {'private': [{'addr': '192.168.0.3', 'version': 4}]},
+    'created': '2012-08-20T21:11:09Z',
+    'flavor': {'id': '1', 'links': [
+        {'href': 'http://os.com/openstack/flavors/1', 'rel': 'bookmark'}]},
+    'hostId': '65201c14a29663e06d0748e561207d998b343e1d164bfa0aafa9c45d',
+    'id': '893c7791-f1df-4c3d-8383-3caae9656c62',
+    'image': {'id': '70a599e0-31e7-49b7-b260-868f441e862b', 'links': [
+        {'href': 'http://imgs/70a599e0-31e7-49b7-b260-868f441e862b',
+         'rel': 'bookmark'}]},
+    'links': [
+        {'href': 'http://v2/srvs/893c7791-f1df-4c3d-8383-3caae9656c62',
+         'rel': 'self'},
+        {'href': 'http://srvs/893c7791-f1df-4c3d-8383-3caae9656c62',
+         'rel': 'bookmark'}],
+    'metadata': {'key': 'value'},
+    'name': 'server',
+    'progress': 0,
+    'status': 'ACTIVE',
+    'tenant_id': 'openstack',
+    'updated': '2012-08-20T21:11:09Z',
+    'user_id': 'fake'}
+
+
+def benchmark(name):
+    """Register a benchmark under the given name"""
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def _servers(count):
+    servers = []
+    for index in range(count):
+        server = copy.deepcopy(SERVER)
+        server['id'] = '893c7791-f1df-4c3d-8383-%012d' % index
+        server['name'] = 'server-%d' % index
+        servers.append(server)
+    return servers
+
+
+class _FakeTransport(object):
+
+    def __init__(self, body):
+        self.body = body
+
+    def request(self, method, url, headers=None, body=None, **kwargs):
+        resp = fake_http.fake_http_response(
+            {'content-type': 'application/json'}, status=200)
+        return resp, self.body
+
+
+@benchmark('rest_client.request')
+def rest_client_request(fixture):
+    client = rest_client.RestClient(
+        fake_auth_provider.FakeAuthProvider(), 'compute', 'regionOne')
+    client.http_obj = _FakeTransport(
+        json.dumps({'servers': _servers(10)}).encode('utf-8'))
+    body = json.dumps({'server': {'name': 'server'}})
+
+    def run():
+        client.get('servers/detail')
+        client.post('servers', body)
+    return run
+
+
+@benchmark('auth.v3.base_url')
+def v3_base_url(fixture):
+    provider = auth.KeystoneV3AuthProvider(
+        fake_credentials.FakeKeystoneV3Credentials(), 'fake_identity_uri')
+    catalog = []
+    for index in range(200):
+        endpoints = []
+        for region in range(5):
+            for interface in ('admin', 'internal', 'public'):
+                endpoints.append({
+                    'interface': interface,
+                    'region': 'Region%d' % region,
+                    'url': 'https://%s.service%d.example.com/v2.0/project' % (
+                        interface, index)})
+        catalog.append({'type': 'service%d' % index,
+                        'name': 'service%d' % index,
+                        'endpoints': endpoints})
+    auth_data = ('token', {'catalog': catalog})
+    filters = {'service': 'service199', 'region': 'Region4',
+               'endpoint_type': 'publicURL', 'api_version': 'v2.1'}
+
+    def run():
+        provider.base_url(filters, auth_data=auth_data)
+    return run
+
+
+@benchmark('rest_client.validate_response')
+def validate_response(fixture):
+    resp = fake_http.fake_http_response({}, status=200)
+    body = {'servers': _servers(500)}
+
+    def run():
+        rest_client.RestClient.validate_response(
+            schema.list_servers_detail, resp, body)
+    return run
+
+
+@benchmark('test_utils.find_test_caller')
+def find_test_caller(fixture):
+    def nested(depth):
+        if depth:
+            return nested(depth - 1)
+        return test_utils.find_test_caller()
+
+    def test_benchmark():
+        return nested(30)
+    return test_benchmark
+
+
+@benchmark('preprov_creds.allocation')
+def preprov_allocation(fixture):
+    fixture.useFixture(lockutils_fixtures.ExternalLockFixture())
+    tempdir = fixture.useFixture(fixtures.TempDir()).path
+    accounts = [{'username': 'user%d' % index,
+                 'project_name': 'project%d' % index,
+                 'password': 'password',
+                 'roles': ['member']} for index in range(50)]
+    accounts_file = os.path.join(tempdir, 'accounts.yaml')
+    with open(accounts_file, 'w') as fd:
+        yaml.safe_dump(accounts, fd)
+    provider = preprov_creds.PreProvisionedCredentialProvider(
+        identity_version='v3', test_accounts_file=accounts_file,
+        accounts_lock_dir=os.path.join(tempdir, 'locks'), name='benchmark',
+        admin_role='admin')
+    hashes = list(provider.hash_dict['creds'])
+    workers = 8
+    executor = futures.ThreadPoolExecutor(max_workers=workers)
+    fixture.addCleanup(executor.shutdown)
+
+    def allocate():
+        provider.remove_hash(provider._get_free_hash(hashes))
+
+    def run():
+        for future in [executor.submit(allocate) for _ in range(workers)]:
+            future.result()
+    return run
+
+
+@benchmark('output_parser.tables')
+def output_parser_tables(fixture):
+    lines = []
+    for index in range(10):
+        lines.append('Table %d' % index)
+        lines.append('+------+--------------------------------------+')
+        lines.append('| ID   | Name                                 |')
+        lines.append('+------+--------------------------------------+')
+        for row in range(100):
+            name = 'name-%d-%d' % (index, row)
+            lines.append('| %-4d | %-36s |' % (row, name))
+        lines.append('+------+--------------------------------------+')
+    output = '\n'.join(lines)
+
+    def run():
+        output_parser.tables(output)
+    return run
+
+
+@benchmark('subunit_describe_calls.parse_details')
+def parse_details(fixture):
+    lines = []
+    for index in range(500):
+        url = ('http://10.0.0.1:8774/v2.1/servers/'
+               '893c7791-f1df-4c3d-8383-%012d' % index)
+        lines.extend([
+            '2026-01-01 00:00:00.000 1 INFO tempest.lib.common.rest_client '
+            '[req-%d ] Request (FakeTest:test_fake): 200 GET %s 0.100s' % (
+                index, url),
+            '2026-01-01 00:00:00.000 1 DEBUG tempest.lib.common.rest_client '
+            '[req-%d ] Request - Headers: {"X-Auth-Token": "<omitted>"}' % (
+                index),
+            '        Body: None',
+            '    Response - Headers: {"status": "200"}',
+            '        Body: %s' % json.dumps({'server': SERVER})])
+    details = {'pythonlogging': content.text_content('\n'.join(lines))}
+    parser = subunit_describe_calls.UrlParser()
+
+    def run():
+        parser.parse_details(details)
+    return run
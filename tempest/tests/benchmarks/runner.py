@@ -0,0 +1,264 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Run the tempest.lib benchmarks and compare them with a baseline
+
+Every benchmark is timed with ``timeit``: the number of calls per sample is
+picked automatically, and the best of ``--repeat`` samples is kept. To make
+results comparable between machines, each time is divided by the time of a
+fixed pure python calibration loop measured in the same run, and only these
+relative scores are compared with the baseline.
+
+A benchmark regresses when its score grows more than ``--threshold`` (a
+fraction) over the baseline, in which case the command exits with 1.
+
+The calibration only makes up for part of the differences between
+machines, and on a shared machine the score of a benchmark can vary by
+more than 100% between runs of the same code. The gate is therefore a
+comparison with the merge base of the change, benchmarked by the same
+command on the same machine: ``--compare-ref`` checks out the merge base of
+``HEAD`` and the given ref in a temporary git worktree, records its
+baseline there, and compares the change with it, with a threshold of 0.3
+by default. This is what ``tox -e bench`` does, against
+``origin/master``::
+
+    $ tox -e bench
+    $ tox -e bench -- --compare-ref origin/master --filter rest_client
+
+The stored ``baseline.json`` is specific to the machine which recorded it,
+and comparing with it, the default without ``--compare-ref``, only catches
+gross regressions with a threshold of 2.0. Use ``--save`` to store the
+results of the run as the new baseline::
+
+    $ tox -e bench -- --save
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import timeit
+
+import fixtures
+import prettytable
+
+from tempest.tests.benchmarks import hot_paths
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'baseline.json')
+
+
+def _calibration_loop():
+    total = 0
+    for index in range(1000):
+        total += index % 7
+    return total
+
+
+def measure(func, repeat=5):
+    """Return the best time of a single call to func, in seconds"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_benchmarks(names, repeat=5):
+    """Time the given benchmarks
+
+    :param names: names of benchmarks from ``hot_paths.BENCHMARKS``
+    :param repeat: number of samples of each benchmark
+    :return: a dict with the calibration time and the time of a single
+        call of each benchmark, in seconds
+    """
+    results = {}
+    # The calibration loop is sampled around every benchmark, and its best
+    # time kept, so that a transient slowdown does not skew all the scores
+    calibration = [measure(_calibration_loop, repeat=repeat)]
+    for name in names:
+        with fixtures.Fixture() as fixture:
+            func = hot_paths.BENCHMARKS[name](fixture)
+            results[name] = measure(func, repeat=repeat)
+        calibration.append(measure(_calibration_loop, repeat=repeat))
+    return {'calibration': min(calibration), 'results': results}
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {'calibration': 1.0, 'results': {}}
+    with open(path) as fd:
+        return json.load(fd)
+
+
+def save_baseline(path, run, baseline=None):
+    """Store the results of a run, keeping other baseline results"""
+    results = {}
+    if baseline and baseline['results']:
+        # Rescale the results kept from the previous baseline
+        scale = run['calibration'] / baseline['calibration']
+        results = {name: value * scale
+                   for name, value in baseline['results'].items()}
+    results.update(run['results'])
+    with open(path, 'w') as fd:
+        json.dump({'calibration': run['calibration'], 'results': results},
+                  fd, indent=2, sort_keys=True)
+        fd.write('\n')
+
+
+def record_ref_baseline(ref, path, filter='.*', repeat=5):
+    """Save a baseline of the merge base of HEAD and a git ref
+
+    The merge base is checked out in a temporary git worktree, next to
+    ``path``, and benchmarked there by a separate process.
+
+    :param ref: the git ref, e.g. ``origin/master``
+    :param path: path of the baseline to save
+    :return: the commit which was benchmarked
+    :raises subprocess.CalledProcessError: if a git command or the
+        benchmarks of the merge base failed
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    top = subprocess.check_output(['git', 'rev-parse', '--show-toplevel'],
+                                  cwd=here, universal_newlines=True).strip()
+    commit = subprocess.check_output(['git', 'merge-base', 'HEAD', ref],
+                                     cwd=top, universal_newlines=True).strip()
+    tree = os.path.join(os.path.dirname(path), 'tree')
+    subprocess.check_call(['git', 'worktree', 'add', '--detach', tree,
+                           commit], cwd=top, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.DEVNULL)
+    try:
+        subprocess.check_call(
+            [sys.executable, '-m', 'tempest.tests.benchmarks', '--save',
+             '--baseline', path, '--filter', filter,
+             '--repeat', str(repeat)],
+            cwd=tree, env=dict(os.environ, PYTHONPATH=tree),
+            stdout=subprocess.DEVNULL)
+    finally:
+        subprocess.call(['git', 'worktree', 'remove', '--force', tree],
+                        cwd=top)
+    return commit
+
+
+def compare(run, baseline, threshold):
+    """Compare the results of a run with a baseline
+
+    :return: a list of ``(name, baseline score, score, change, regressed)``
+        tuples, where the scores are relative to the calibration time of
+        each run and the change is a fraction of the baseline score. The
+        baseline score and the change are None for new benchmarks.
+    """
+    rows = []
+    for name, value in sorted(run['results'].items()):
+        score = value / run['calibration']
+        if name not in baseline['results']:
+            rows.append((name, None, score, None, False))
+            continue
+        base = baseline['results'][name] / baseline['calibration']
+        change = score / base - 1
+        rows.append((name, base, score, change, change > threshold))
+    return rows
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m tempest.tests.benchmarks',
+        description='Benchmark the tempest.lib hot paths and compare the '
+                    'results with a baseline.')
+    parser.add_argument('--filter', default='.*',
+                        help='Regular expression selecting the benchmarks '
+                             'to run.')
+    parser.add_argument('--threshold', type=float,
+                        help='Relative slowdown over the baseline above '
+                             'which a benchmark fails. Default: 0.3 with '
+                             '--compare-ref, 2.0 otherwise.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of samples of each benchmark, the best '
+                             'one is kept. Default: 5.')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='Path of the baseline results. Default: %s.' %
+                             BASELINE)
+    parser.add_argument('--compare-ref', metavar='REF',
+                        help='Compare with the merge base of HEAD and this '
+                             'git ref, benchmarked in the same run, instead '
+                             'of the stored baseline.')
+    parser.add_argument('--save', action='store_true',
+                        help='Store the results as the new baseline instead '
+                             'of failing on regressions.')
+    parser.add_argument('--list', action='store_true',
+                        help='List the benchmarks and exit.')
+    return parser
+
+
+def main(argv=None, stdout=sys.stdout):
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    if args.compare_ref and args.save:
+        parser.error('--save cannot be used with --compare-ref')
+    if args.threshold is None:
+        args.threshold = 0.3 if args.compare_ref else 2.0
+    names = [name for name in hot_paths.BENCHMARKS
+             if re.search(args.filter, name)]
+    if args.list:
+        stdout.write('\n'.join(names) + '\n')
+        return 0
+    if not names:
+        stdout.write('No benchmark matches %s\n' % args.filter)
+        return 1
+    if args.compare_ref:
+        with fixtures.TempDir() as tempdir:
+            path = os.path.join(tempdir.path, 'baseline.json')
+            try:
+                commit = record_ref_baseline(args.compare_ref, path,
+                                             args.filter, args.repeat)
+            except (OSError, subprocess.CalledProcessError) as e:
+                stdout.write('Failed to benchmark the merge base with %s: '
+                             '%s\n' % (args.compare_ref, e))
+                return 1
+            baseline = load_baseline(path)
+        stdout.write('Comparing with %s\n' % commit)
+    else:
+        baseline = load_baseline(args.baseline)
+    run = run_benchmarks(names, repeat=args.repeat)
+    rows = compare(run, baseline, args.threshold)
+
+    table = prettytable.PrettyTable(
+        ['Benchmark', 'Time (us)', 'Baseline', 'Score', 'Change', 'Status'])
+    table.align = 'r'
+    table.align['Benchmark'] = 'l'
+    regressions = []
+    for name, base, score, change, regressed in rows:
+        if change is None:
+            status = 'NEW'
+        elif regressed:
+            status = 'REGRESSED'
+            regressions.append(name)
+        else:
+            status = 'OK'
+        table.add_row([
+            name, '%.1f' % (run['results'][name] * 1e6),
+            '-' if base is None else '%.2f' % base, '%.2f' % score,
+            '-' if change is None else '%+.1f%%' % (change * 100), status])
+    stdout.write('%s\n' % table)
+
+    if args.save:
+        save_baseline(args.baseline, run, baseline)
+        stdout.write('Baseline saved to %s\n' % args.baseline)
+        return 0
+    if regressions:
+        stdout.write('Regressed beyond %d%%: %s\n' % (
+            args.threshold * 100, ', '.join(regressions)))
+        return 1
+    return 0
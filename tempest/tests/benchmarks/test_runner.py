@@ -0,0 +1,169 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import io
+import json
+import os
+import subprocess
+import sys
+from unittest import mock
+
+import fixtures
+
+from tempest.tests import base
+from tempest.tests.benchmarks import hot_paths
+from tempest.tests.benchmarks import runner
+
+
+class TestHotPaths(base.TestCase):
+
+    def test_benchmarks_run(self):
+        for benchmark in hot_paths.BENCHMARKS.values():
+            with fixtures.Fixture() as fixture:
+                benchmark(fixture)()
+
+
+class TestRunner(base.TestCase):
+
+    def setUp(self):
+        super(TestRunner, self).setUp()
+        self.baseline = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'baseline.json')
+        # Fake timings: the calibration loop takes 1 unit, and the fake
+        # benchmarks take the time found in self.times
+        self.times = {'fast': 2.0, 'slow': 10.0}
+        self.patch('tempest.tests.benchmarks.hot_paths.BENCHMARKS',
+                   collections.OrderedDict(
+                       (name, self._benchmark(name)) for name in self.times))
+        self.patch('tempest.tests.benchmarks.runner.measure',
+                   lambda func, repeat: func())
+
+    def _benchmark(self, name):
+        def setup(fixture):
+            return lambda: self.times[name]
+        return setup
+
+    def _main(self, *args):
+        stdout = io.StringIO()
+        self.patch('tempest.tests.benchmarks.runner._calibration_loop',
+                   lambda: 1.0)
+        ret = runner.main(['--baseline', self.baseline] + list(args),
+                          stdout=stdout)
+        return ret, stdout.getvalue()
+
+    def test_compare(self):
+        run = {'calibration': 2.0,
+               'results': {'same': 4.0, 'slower': 8.0, 'new': 1.0}}
+        baseline = {'calibration': 1.0,
+                    'results': {'same': 2.0, 'slower': 2.0}}
+        self.assertEqual([('new', None, 0.5, None, False),
+                          ('same', 2.0, 2.0, 0.0, False),
+                          ('slower', 2.0, 4.0, 1.0, True)],
+                         runner.compare(run, baseline, 0.5))
+
+    def test_save_baseline_keeps_results(self):
+        runner.save_baseline(self.baseline,
+                             {'calibration': 2.0, 'results': {'new': 1.0}},
+                             {'calibration': 1.0, 'results': {'old': 3.0,
+                                                              'new': 5.0}})
+        with open(self.baseline) as fd:
+            self.assertEqual({'calibration': 2.0,
+                              'results': {'old': 6.0, 'new': 1.0}},
+                             json.load(fd))
+
+    def test_main(self):
+        ret, output = self._main('--save')
+        self.assertEqual(0, ret)
+        self.assertEqual(2, output.count('NEW'))
+        ret, output = self._main()
+        self.assertEqual(0, ret)
+        self.assertEqual(2, output.count(' OK '))
+
+        self.times['slow'] = 16.0
+        ret, output = self._main('--threshold', '0.5')
+        self.assertEqual(1, ret)
+        self.assertIn('REGRESSED', output)
+        self.assertIn('Regressed beyond 50%: slow', output)
+        # Only the selected benchmarks are run
+        ret, output = self._main('--filter', 'fast')
+        self.assertEqual(0, ret)
+        self.assertNotIn('slow', output)
+
+    def test_main_no_match(self):
+        ret, output = self._main('--filter', 'missing')
+        self.assertEqual(1, ret)
+        self.assertIn('No benchmark matches missing', output)
+
+    def test_main_compare_ref(self):
+        def record(ref, path, filter, repeat):
+            runner.save_baseline(path, {'calibration': 1.0, 'results': {
+                'fast': 2.0, 'slow': 10.0}})
+            return 'abc123'
+
+        record_ref_baseline = self.patch(
+            'tempest.tests.benchmarks.runner.record_ref_baseline',
+            side_effect=record)
+        self.times['slow'] = 12.0
+        ret, output = self._main('--compare-ref', 'origin/master')
+        record_ref_baseline.assert_called_once_with(
+            'origin/master', mock.ANY, '.*', 5)
+        self.assertEqual(0, ret)
+        self.assertIn('Comparing with abc123', output)
+        # The threshold is tight when comparing with the merge base
+        self.times['slow'] = 14.0
+        ret, output = self._main('--compare-ref', 'origin/master')
+        self.assertEqual(1, ret)
+        self.assertIn('Regressed beyond 30%: slow', output)
+        # The stored baseline is left alone
+        self.assertFalse(os.path.exists(self.baseline))
+
+    def test_main_compare_ref_failure(self):
+        self.patch('tempest.tests.benchmarks.runner.record_ref_baseline',
+                   side_effect=subprocess.CalledProcessError(1, 'git'))
+        ret, output = self._main('--compare-ref', 'missing')
+        self.assertEqual(1, ret)
+        self.assertIn('Failed to benchmark the merge base with missing',
+                      output)
+
+    def test_main_compare_ref_save(self):
+        self.patch('sys.stderr', io.StringIO())
+        self.assertRaises(SystemExit, self._main, '--compare-ref',
+                          'origin/master', '--save')
+
+    def test_record_ref_baseline(self):
+        check_output = self.patch(
+            'subprocess.check_output', side_effect=['/repo\n', 'abc123\n'])
+        check_call = self.patch('subprocess.check_call')
+        call = self.patch('subprocess.call')
+        self.assertEqual('abc123', runner.record_ref_baseline(
+            'origin/master', '/tmp/bench/baseline.json', 'rest', 3))
+        check_output.assert_called_with(
+            ['git', 'merge-base', 'HEAD', 'origin/master'], cwd='/repo',
+            universal_newlines=True)
+        worktree_add, benchmarks = check_call.call_args_list
+        self.assertEqual(['git', 'worktree', 'add', '--detach',
+                          '/tmp/bench/tree', 'abc123'],
+                         worktree_add[0][0])
+        self.assertEqual(
+            [sys.executable, '-m', 'tempest.tests.benchmarks', '--save',
+             '--baseline', '/tmp/bench/baseline.json', '--filter', 'rest',
+             '--repeat', '3'], benchmarks[0][0])
+        self.assertEqual('/tmp/bench/tree', benchmarks[1]['cwd'])
+        self.assertEqual('/tmp/bench/tree', benchmarks[1]['env']['PYTHONPATH'])
+        # The worktree is removed
+        call.assert_called_once_with(
+            ['git', 'worktree', 'remove', '--force', '/tmp/bench/tree'],
+            cwd='/repo')
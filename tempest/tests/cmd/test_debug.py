@@ -0,0 +1,82 @@
+# Copyright 2026 OpenStack Foundation
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import io
+import subprocess
+from unittest import mock
+
+from tempest.cmd import debug
+from tempest.tests import base
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        500 |     tempest.lib.exceptions
+import time:      1000 |       1500 |   tempest.lib
+import time:      2000 |       3500 | tempest
+Traceback lines are ignored
+"""
+
+
+class TestImportProfile(base.TestCase):
+
+    def test_parse_importtime(self):
+        records = debug.parse_importtime(IMPORTTIME_OUTPUT)
+        self.assertEqual(
+            [debug.ImportRecord('_io', 120, 120, 1),
+             debug.ImportRecord('tempest.lib.exceptions', 300, 500, 2),
+             debug.ImportRecord('tempest.lib', 1000, 1500, 1),
+             debug.ImportRecord('tempest', 2000, 3500, 0)],
+            records)
+
+    @mock.patch('subprocess.run')
+    def test_profile_imports_skips_startup_modules(self, mock_run):
+        mock_run.side_effect = [
+            mock.Mock(returncode=0, stderr='import time: 120 | 120 | _io'),
+            mock.Mock(returncode=0, stderr=IMPORTTIME_OUTPUT)]
+        records = debug.profile_imports(['tempest'], python='python')
+        self.assertEqual(['tempest.lib.exceptions', 'tempest.lib', 'tempest'],
+                         [r.name for r in records])
+        mock_run.assert_called_with(
+            ['python', '-X', 'importtime', '-c', 'import tempest'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True)
+
+    @mock.patch('subprocess.run')
+    def test_profile_imports_failure(self, mock_run):
+        mock_run.return_value = mock.Mock(returncode=1, stderr='error')
+        self.assertRaises(subprocess.CalledProcessError,
+                          debug.profile_imports, ['fake'])
+
+    def _take_action(self, *args):
+        cmd = debug.TempestDebugImportProfile(None, None)
+        parsed_args = cmd.get_parser('import-profile').parse_args(args)
+        records = debug.parse_importtime(IMPORTTIME_OUTPUT)
+        with mock.patch.object(debug, 'profile_imports',
+                               return_value=records) as profile, \
+                mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            cmd.take_action(parsed_args)
+        return profile, out.getvalue()
+
+    def test_take_action(self):
+        profile, output = self._take_action('--top', '2', '--sort', 'self')
+        profile.assert_called_once_with(['tempest.cmd.main'])
+        self.assertIn('| tempest ', output)
+        self.assertIn('| tempest.lib ', output)
+        self.assertNotIn('tempest.lib.exceptions', output)
+        self.assertIn('Total import time: 3.5 ms for 4 modules', output)
+
+    def test_take_action_max_total(self):
+        self._take_action('--max-total', '3.5')
+        self.assertRaises(SystemExit, self._take_action, '--max-total', '3')
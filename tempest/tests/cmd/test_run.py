@@ -65,6 +65,17 @@ class TestTempestRun(base.TestCase):
         setattr(args, 'regex', 'i_am_a_fun_little_regex')
         self.assertEqual(['smoke'], self.run_cmd._build_regex(args))
 
+    @mock.patch('tempest.test_discover.index.load_index')
+    def test__list_tests_from_index(self, mock_load_index):
+        mock_load_index.return_value.dynamic_modules.return_value = []
+        mock_load_index.return_value.filter.return_value = ['a.b.test_c']
+        with mock.patch('builtins.print') as mock_print:
+            self.assertEqual(0, self.run_cmd._list_tests_from_index(
+                ['smoke'], None, None, 'slow'))
+        mock_load_index.return_value.filter.assert_called_once_with(
+            ['smoke'], None, None, 'slow')
+        mock_print.assert_called_once_with('a.b.test_c')
+
 
 class TestRunReturnCode(base.TestCase):
 
@@ -367,6 +378,7 @@ class TestTakeAction(base.TestCase):
         parsed_args.workspace = None
         parsed_args.state = None
         parsed_args.list_tests = False
+        parsed_args.freeze_config = False
         parsed_args.config_file = path
         parsed_args.slowest = False
 
@@ -383,6 +395,7 @@ class TestTakeAction(base.TestCase):
         parsed_args.workspace = None
         parsed_args.state = None
         parsed_args.list_tests = False
+        parsed_args.freeze_config = False
         parsed_args.config_file = ''
 
         with mock.patch('stestr.commands.run_command'):
@@ -398,6 +411,7 @@ class TestTakeAction(base.TestCase):
         parsed_args.workspace_path = self.store_file
         parsed_args.state = None
         parsed_args.list_tests = False
+        parsed_args.freeze_config = False
         parsed_args.config_file = path
         parsed_args.slowest = False
 
@@ -415,6 +429,7 @@ class TestTakeAction(base.TestCase):
         parsed_args.workspace_path = self.store_file
         parsed_args.state = None
         parsed_args.list_tests = False
+        parsed_args.freeze_config = False
         parsed_args.config_file = ''
         parsed_args.slowest = False
 
@@ -433,6 +448,7 @@ class TestTakeAction(base.TestCase):
         parsed_args.workspace = None
         parsed_args.state = True
         parsed_args.list_tests = False
+        parsed_args.freeze_config = False
         parsed_args.config_file = ''
 
         with mock.patch('stestr.commands.run_command'):
@@ -448,6 +464,7 @@ class TestTakeAction(base.TestCase):
         parsed_args.workspace_path = self.store_file
         parsed_args.state = True
         parsed_args.list_tests = False
+        parsed_args.freeze_config = False
         parsed_args.config_file = ''
         parsed_args.slowest = False
 
@@ -468,6 +485,7 @@ class TestTakeAction(base.TestCase):
         parsed_args.workspace_path = self.store_file
         parsed_args.state = True
         parsed_args.list_tests = False
+        parsed_args.freeze_config = False
         parsed_args.config_file = path
         parsed_args.slowest = False
 
@@ -476,3 +494,31 @@ class TestTakeAction(base.TestCase):
             self.assertEqual(0, tempest_run.take_action(parsed_args))
             m.assert_called()
         mock_init_state.assert_called()
+
+    def test_freeze_config(self):
+        self._setup_test_dirs()
+        _, path = tempfile.mkstemp()
+        self.addCleanup(os.remove, path)
+        tempest_run = run.TempestRun(app=mock.Mock(), app_args=mock.Mock())
+        parsed_args = mock.Mock()
+        parsed_args.workspace = None
+        parsed_args.state = None
+        parsed_args.list_tests = False
+        parsed_args.freeze_config = True
+        parsed_args.config_file = path
+        parsed_args.slowest = False
+        self.useFixture(fixtures.EnvironmentVariable(
+            config.CONFIG_SNAPSHOT_ENV))
+        atexit_register = self.useFixture(
+            fixtures.MockPatch('atexit.register')).mock
+        snapshot = mock.Mock()
+
+        with mock.patch.object(run.CONF, 'freeze',
+                               return_value=snapshot), \
+                mock.patch('stestr.commands.run_command') as m:
+            m.return_value = 0
+            self.assertEqual(0, tempest_run.take_action(parsed_args))
+        snapshot_path = os.environ[config.CONFIG_SNAPSHOT_ENV]
+        snapshot.save.assert_called_once_with(snapshot_path)
+        atexit_register.assert_called_once_with(os.remove, snapshot_path)
+        os.remove(snapshot_path)
@@ -18,9 +18,11 @@ from unittest import mock
 from urllib import parse as urlparse
 
 from tempest.common import compute
+from tempest import config
 from tempest import exceptions
 from tempest.lib import exceptions as lib_exc
 from tempest.tests import base
+from tempest.tests import fake_config
 
 
 class TestCompute(base.TestCase):
@@ -158,3 +160,64 @@ class TestCompute(base.TestCase):
         self.assertEqual(recv_version, RFP_VERSION)
         # cached_stream should be empty in the end.
         self.assertEqual(webSocket.cached_stream, b'')
+
+
+class TestCreateTestServer(base.TestCase):
+
+    def setUp(self):
+        super(TestCreateTestServer, self).setUp()
+        self.useFixture(fake_config.ConfigFixture())
+        self.patchobject(config, 'TempestConfigPrivate',
+                         fake_config.FakePrivate)
+        self.clients = mock.Mock()
+        servers_client = self.clients.servers_client
+        servers_client.create_server.return_value = mock.MagicMock(
+            response={'x-openstack-request-id': 'req-1'})
+        servers_client.list_servers.return_value = {'servers': [
+            {'id': 'id-%d' % i, 'name': 'server-%d' % i} for i in range(3)]}
+        self.mock_wait = self.patchobject(compute.waiters,
+                                          'wait_for_server_status')
+        self.mock_wait_termination = self.patchobject(
+            compute.waiters, 'wait_for_server_termination')
+        self.mock_threads = self.patchobject(
+            compute.concurrency, 'run_in_threads',
+            side_effect=compute.concurrency.run_in_threads)
+
+    def test_create_test_servers_concurrent(self):
+        self.mock_wait.side_effect = lambda client, server_id, *args, **kw: {
+            'id': server_id, 'status': 'ACTIVE'}
+        servers = compute.create_test_servers(
+            self.clients, 3, name='server', wait_until='ACTIVE')
+        self.assertEqual(['id-0', 'id-1', 'id-2'],
+                         [server['id'] for server in servers])
+        self.clients.servers_client.create_server.assert_called_once_with(
+            name='server', imageRef=mock.ANY, flavorRef=mock.ANY,
+            min_count=3, max_count=3)
+        self.assertEqual(3, self.mock_wait.call_count)
+        self.mock_threads.assert_called_once()
+
+    def test_create_test_server_not_concurrent(self):
+        compute.create_test_server(self.clients, name='server',
+                                   wait_until='ACTIVE', min_count=3)
+        self.assertEqual(3, self.mock_wait.call_count)
+        self.mock_threads.assert_not_called()
+
+    def test_create_test_servers_concurrent_cleanup(self):
+        def wait(client, server_id, *args, **kwargs):
+            if server_id == 'id-1':
+                raise lib_exc.TimeoutException()
+            return {'id': server_id}
+
+        self.mock_wait.side_effect = wait
+        self.assertRaises(lib_exc.TimeoutException,
+                          compute.create_test_servers, self.clients, 3,
+                          name='server', wait_until='ACTIVE')
+        delete_server = self.clients.servers_client.delete_server
+        self.assertEqual(
+            ['id-0', 'id-1', 'id-2'],
+            sorted(c[0][0] for c in delete_server.call_args_list))
+        self.assertEqual(
+            ['id-0', 'id-1', 'id-2'],
+            sorted(c[0][1] for c in
+                   self.mock_wait_termination.call_args_list))
+        self.assertEqual(3, self.mock_threads.call_count)
@@ -97,3 +97,21 @@ class TestConcurrency(base.TestCase):
         self.assertIn(0, ids)
         self.assertIn(1, ids)
         self.assertIn(2, ids)
+
+    def test_run_in_threads(self):
+        result = concurrency.run_in_threads(lambda x: x * 2, [3, 1, 2])
+        self.assertEqual([6, 2, 4], result)
+        self.assertEqual([], concurrency.run_in_threads(str, []))
+
+    def test_run_in_threads_raises_after_all_calls(self):
+        called = []
+
+        def target(item):
+            called.append(item)
+            if item == 1:
+                raise ValueError(item)
+            return item
+
+        self.assertRaises(ValueError, concurrency.run_in_threads,
+                          target, [0, 1, 2], max_workers=1)
+        self.assertEqual([0, 1, 2], called)
@@ -0,0 +1,116 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+
+import fixtures
+
+from tempest.common import console_log
+from tempest.lib import exceptions as lib_exc
+from tempest.tests import base
+
+
+class FakeServersClient(object):
+
+    def __init__(self, consoles):
+        self.consoles = consoles
+        self.lengths = []
+
+    def get_console_output(self, server_id, length=None):
+        if server_id not in self.consoles:
+            raise lib_exc.NotFound()
+        self.lengths.append(length)
+        lines = self.consoles[server_id].splitlines(True)
+        if length is not None:
+            lines = lines[-length:]
+        return {'output': ''.join(lines)}
+
+
+def _lines(first, last):
+    return ''.join('line %d\n' % index for index in range(first, last))
+
+
+class TestConsoleLogCollector(base.TestCase):
+
+    def setUp(self):
+        super(TestConsoleLogCollector, self).setUp()
+        self.output_dir = self.useFixture(fixtures.TempDir()).path
+        self.client = FakeServersClient({'srv1': _lines(0, 1000)})
+        self.collector = console_log.ConsoleLogCollector(
+            output_dir=self.output_dir)
+
+    def _collect(self, server_id='srv1', **kwargs):
+        return ''.join(self.collector.collect_server(
+            self.client, server_id, **kwargs))
+
+    def test_incremental(self):
+        self.assertEqual(_lines(0, 1000), self._collect())
+        self.assertEqual('', self._collect())
+        self.client.consoles['srv1'] += _lines(1000, 1003)
+        self.assertEqual(_lines(1000, 1003), self._collect())
+        # Only the tail of the console was requested after the first time
+        self.assertEqual([None, 100, 100], self.client.lengths)
+        with open(os.path.join(self.output_dir, 'console-srv1.log')) as fd:
+            self.assertEqual(self.client.consoles['srv1'], fd.read())
+
+    def test_tail_extended(self):
+        self._collect()
+        self.client.consoles['srv1'] += _lines(1000, 1300)
+        self.assertEqual(_lines(1000, 1300), self._collect())
+        self.assertEqual([None, 100, 400], self.client.lengths)
+
+    def test_whole_console_fallback(self):
+        self.collector.max_tail_length = 400
+        self._collect()
+        self.client.consoles['srv1'] += _lines(1000, 1500)
+        self.assertEqual(_lines(1000, 1500), self._collect())
+        self.assertEqual([None, 100, None], self.client.lengths)
+
+    def test_console_reset(self):
+        self._collect()
+        self.client.consoles['srv1'] = _lines(0, 10)
+        self.assertEqual(_lines(0, 10), self._collect())
+
+    def test_partial_line(self):
+        self.client.consoles['srv1'] = _lines(0, 10) + 'partial'
+        self.assertEqual(_lines(0, 10) + 'partial', self._collect())
+        self.client.consoles['srv1'] = _lines(0, 10) + 'partial line\nnew\n'
+        self.assertEqual('partial line\nnew\n', self._collect())
+
+    def test_length(self):
+        self.assertEqual(_lines(990, 1000), self._collect(length=10))
+        self.client.consoles['srv1'] += _lines(1000, 1300)
+        self.assertEqual(_lines(1100, 1300), self._collect(length=200))
+        self.assertEqual([10, 100, 200], self.client.lengths)
+
+    def test_collect_many(self):
+        self.client.consoles['srv2'] = _lines(0, 5)
+        results = self.collector.collect(
+            self.client, [{'id': 'srv1'}, {'id': 'missing'}, {'id': 'srv2'}])
+        self.assertEqual({'srv1': _lines(0, 1000).splitlines(True),
+                          'missing': [],
+                          'srv2': _lines(0, 5).splitlines(True)}, results)
+        self.assertEqual(['console-srv1.log', 'console-srv2.log'],
+                         sorted(os.listdir(self.output_dir)))
+
+    def test_log(self):
+        logger = self.useFixture(fixtures.FakeLogger(
+            name='tempest.common.console_log', level='DEBUG'))
+        self.collector.output_dir = None
+        self._collect()
+        self.client.consoles['srv1'] += _lines(1000, 1001)
+        self._collect()
+        self.assertEqual(1, logger.output.count('line 1000\n'))
+        self.assertEqual(1, logger.output.count('line 999\n'))
@@ -0,0 +1,109 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from tempest.common import identity
+from tempest.lib import exceptions as lib_exc
+from tempest.tests import base
+
+
+class TestIdentityLookups(base.TestCase):
+
+    def setUp(self):
+        super(TestIdentityLookups, self).setUp()
+        self.addCleanup(identity.clear_indexes)
+        self.tenants = [{'id': str(index), 'name': 'tenant-%d' % index}
+                        for index in range(1000)]
+        self.client = mock.Mock()
+        self.client.list_tenants.side_effect = lambda: {
+            'tenants': list(self.tenants)}
+        self.client.show_tenant.side_effect = self._show_tenant
+        self.client.list_tenant_users.side_effect = lambda tenant_id: {
+            'users': [{'id': tenant_id + '-user', 'name': 'user'}]}
+
+    def _show_tenant(self, tenant_id):
+        for tenant in self.tenants:
+            if tenant['id'] == tenant_id:
+                return {'tenant': tenant}
+        raise lib_exc.NotFound()
+
+    def test_get_tenant_by_name(self):
+        for index in (10, 999, 10):
+            self.assertEqual(
+                self.tenants[index],
+                identity.get_tenant_by_name(self.client,
+                                            'tenant-%d' % index))
+        # The index is built once, the hits are verified
+        self.assertEqual(1, self.client.list_tenants.call_count)
+        self.assertEqual([mock.call('999'), mock.call('10')],
+                         self.client.show_tenant.call_args_list)
+
+    def test_get_tenant_by_name_recreated(self):
+        identity.get_tenant_by_name(self.client, 'tenant-0')
+        # The tenant is deleted and created again with a new id
+        self.tenants[0] = {'id': 'recreated', 'name': 'tenant-0'}
+        self.assertEqual(
+            'recreated',
+            identity.get_tenant_by_name(self.client, 'tenant-0')['id'])
+        self.assertEqual(2, self.client.list_tenants.call_count)
+        # The tenant is deleted
+        del self.tenants[0]
+        self.assertRaises(lib_exc.NotFound, identity.get_tenant_by_name,
+                          self.client, 'tenant-0')
+        self.assertEqual(3, self.client.list_tenants.call_count)
+
+    def test_get_tenant_by_name_refreshed(self):
+        identity.get_tenant_by_name(self.client, 'tenant-0')
+        self.tenants.append({'id': 'new', 'name': 'new'})
+        self.assertEqual('new',
+                         identity.get_tenant_by_name(self.client, 'new')['id'])
+        self.assertRaises(lib_exc.NotFound, identity.get_tenant_by_name,
+                          self.client, 'missing')
+        self.assertEqual(3, self.client.list_tenants.call_count)
+        identity.clear_indexes()
+        identity.get_tenant_by_name(self.client, 'new')
+        self.assertEqual(4, self.client.list_tenants.call_count)
+
+    def test_get_user_by_username(self):
+        self.assertEqual(
+            {'id': '1-user', 'name': 'user'},
+            identity.get_user_by_username(self.client, '1', 'user'))
+        self.assertEqual(
+            {'id': '2-user', 'name': 'user'},
+            identity.get_user_by_username(self.client, '2', 'user'))
+        self.client.list_tenant_users.assert_called_with('2')
+        self.assertRaises(lib_exc.NotFound, identity.get_user_by_username,
+                          self.client, '1', 'missing')
+
+    def test_get_user_by_project(self):
+        users_client = mock.Mock()
+        users_client.list_users.return_value = {'users': [
+            {'id': 'other', 'name': 'user'}, {'id': 'member', 'name': 'user'}]}
+        roles_client = mock.Mock()
+        roles_client.list_role_assignments.side_effect = lambda **kwargs: {
+            'role_assignments': [{}] if kwargs['user.id'] == 'member'
+            else []}
+        self.assertEqual('member', identity.get_user_by_project(
+            users_client, roles_client, 'project', 'user')['id'])
+        users_client.list_users.assert_called_once_with(name='user')
+        roles_client.list_role_assignments.assert_called_with(
+            **{'scope.project.id': 'project', 'user.id': 'member'})
+
+        roles_client.list_role_assignments.side_effect = None
+        roles_client.list_role_assignments.return_value = {
+            'role_assignments': []}
+        self.assertRaises(lib_exc.NotFound, identity.get_user_by_project,
+                          users_client, roles_client, 'project', 'user')
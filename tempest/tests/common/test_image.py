@@ -0,0 +1,127 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from http import client as http_client
+import os
+import time
+
+import fixtures
+
+from tempest.common import image
+from tempest.tests import base
+
+
+class TestRandomDataServer(base.TestCase):
+
+    def _start(self, **kwargs):
+        server = image.RandomDataServer(**kwargs)
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def _request(self, server, method='GET', headers=None):
+        connection = http_client.HTTPConnection(server.host, server.port,
+                                                timeout=10)
+        self.addCleanup(connection.close)
+        connection.request(method, '/', headers=headers or {})
+        response = connection.getresponse()
+        return response, response.read()
+
+    def test_get_and_head(self):
+        server = self._start(size=3 * 1024 * 1024 + 5, rate=None)
+        response, data = self._request(server)
+        self.assertEqual(200, response.status)
+        self.assertEqual(str(len(data)), response.getheader('Content-Length'))
+        self.assertEqual(3 * 1024 * 1024 + 5, len(data))
+        # The random block is repeated, so the data is the same on each
+        # request
+        self.assertEqual(data[:image.BUFFER_SIZE],
+                         data[image.BUFFER_SIZE:2 * image.BUFFER_SIZE])
+        self.assertEqual(data, self._request(server)[1])
+
+        response, body = self._request(server, method='HEAD')
+        self.assertEqual(b'', body)
+        self.assertEqual(str(len(data)), response.getheader('Content-Length'))
+        self.assertEqual('bytes', response.getheader('Accept-Ranges'))
+
+    def test_ranges(self):
+        server = self._start(size=2 * 1024 * 1024, rate=None)
+        _, data = self._request(server)
+        for header, first, last in (('bytes=10-19', 10, 19),
+                                    ('bytes=1048570-1048580', 1048570,
+                                     1048580),
+                                    ('bytes=2097000-', 2097000, 2097151),
+                                    ('bytes=-100', 2097052, 2097151),
+                                    ('bytes=2097100-3000000', 2097100,
+                                     2097151)):
+            response, body = self._request(server, headers={'Range': header})
+            self.assertEqual(206, response.status)
+            self.assertEqual('bytes %d-%d/2097152' % (first, last),
+                             response.getheader('Content-Range'))
+            self.assertEqual(data[first:last + 1], body)
+
+        response, body = self._request(
+            server, headers={'Range': 'bytes=3000000-'})
+        self.assertEqual(416, response.status)
+        self.assertEqual('bytes */2097152',
+                         response.getheader('Content-Range'))
+        # Several ranges are not supported, the whole data is sent
+        response, body = self._request(
+            server, headers={'Range': 'bytes=0-1,5-6'})
+        self.assertEqual(200, response.status)
+        self.assertEqual(data, body)
+
+    def test_rate_limit(self):
+        server = self._start(size=64 * 1024, rate=256 * 1024,
+                             chunk_size=16 * 1024)
+        start = time.monotonic()
+        _, data = self._request(server)
+        self.assertEqual(64 * 1024, len(data))
+        # The last chunk is sent once the first three are under the limit
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+
+    def test_concurrent_requests(self):
+        server = self._start(size=64 * 1024, rate=128 * 1024,
+                             chunk_size=16 * 1024)
+        connections = []
+        start = time.monotonic()
+        for _ in range(4):
+            connection = http_client.HTTPConnection(server.host, server.port,
+                                                    timeout=10)
+            self.addCleanup(connection.close)
+            connection.request('GET', '/')
+            connections.append(connection)
+        for connection in connections:
+            self.assertEqual(64 * 1024,
+                             len(connection.getresponse().read()))
+        # The throttled requests are served at the same time
+        self.assertLess(time.monotonic() - start, 1.5)
+
+    def test_file(self):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                            'image.raw')
+        content = os.urandom(200 * 1024)
+        with open(path, 'wb') as fd:
+            fd.write(content)
+        for rate in (None, 10 * 1024 * 1024):
+            server = self._start(path=path, rate=rate)
+            response, data = self._request(server)
+            self.assertEqual(str(len(content)),
+                             response.getheader('Content-Length'))
+            self.assertEqual(content, data)
+            response, data = self._request(
+                server, headers={'Range': 'bytes=100000-100099'})
+            self.assertEqual(206, response.status)
+            self.assertEqual(content[100000:100100], data)
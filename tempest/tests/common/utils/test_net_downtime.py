@@ -0,0 +1,136 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import http.server
+import threading
+import time
+
+import testtools
+
+from tempest.common.utils import net_downtime
+from tempest.tests import base
+
+
+class FakeProbe(net_downtime.Probe):
+
+    def __init__(self, name):
+        super(FakeProbe, self).__init__('fake', name=name)
+        self.down = False
+        self.closed = False
+
+    async def probe(self):
+        if self.down:
+            raise IOError('down')
+
+    def close(self):
+        self.closed = True
+
+
+class FakeHandler(http.server.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self.send_response(200 if self.path == '/' else 404)
+        self.end_headers()
+        self.wfile.write(b'fake-hostname')
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSummarizeSamples(base.TestCase):
+
+    def test_outages_and_statistics(self):
+        samples = [net_downtime.Sample(0.0, 0.010),
+                   net_downtime.Sample(0.1, 0.030),
+                   net_downtime.Sample(0.2, None),
+                   net_downtime.Sample(0.3, None),
+                   net_downtime.Sample(0.4, 0.020),
+                   net_downtime.Sample(0.5, None)]
+        results = net_downtime.summarize_samples(reversed(samples))
+        self.assertEqual(6, results['sent'])
+        self.assertEqual(3, results['lost'])
+        self.assertEqual([(0.2, 0.4), (0.5, 0.5)], results['outages'])
+        self.assertAlmostEqual(0.2, results['downtime'])
+        self.assertAlmostEqual(0.015, results['jitter'])
+        self.assertEqual(0.010, results['rtt']['min'])
+        self.assertEqual(0.030, results['rtt']['max'])
+        self.assertAlmostEqual(0.020, results['rtt']['avg'])
+        self.assertEqual(0.020, results['rtt']['p50'])
+        self.assertEqual(0.030, results['rtt']['p99'])
+
+    def test_no_reply(self):
+        results = net_downtime.summarize_samples(
+            [net_downtime.Sample(0.0, None), net_downtime.Sample(0.1, None)])
+        self.assertEqual([(0.0, 0.1)], results['outages'])
+        self.assertNotIn('rtt', results)
+
+
+class TestProbes(base.TestCase):
+
+    def setUp(self):
+        super(TestProbes, self).setUp()
+        self.server = http.server.HTTPServer(('127.0.0.1', 0), FakeHandler)
+        self.port = self.server.server_address[1]
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def _probe(self, probe):
+        asyncio.run(probe.probe())
+
+    def test_tcp_probe(self):
+        self._probe(net_downtime.TcpProbe('127.0.0.1', self.port))
+
+    def test_http_probe(self):
+        self._probe(net_downtime.HttpProbe(
+            '127.0.0.1', self.port, expected_text='fake-hostname'))
+        self.assertRaises(ValueError, self._probe, net_downtime.HttpProbe(
+            '127.0.0.1', self.port, expected_text='other-hostname'))
+        self.assertRaises(ValueError, self._probe, net_downtime.HttpProbe(
+            '127.0.0.1', self.port, path='/missing'))
+
+
+class TestProbeDowntimeMeter(base.TestCase):
+
+    def test_downtime(self):
+        up = FakeProbe('up')
+        flapping = FakeProbe('flapping')
+        meter = net_downtime.ProbeDowntimeMeter([up, flapping],
+                                                interval=0.005)
+        with meter:
+            time.sleep(0.05)
+            flapping.down = True
+            time.sleep(0.05)
+            flapping.down = False
+            time.sleep(0.05)
+            results = meter.get_results()
+        self.assertTrue(up.closed)
+        self.assertTrue(flapping.closed)
+        self.assertEqual(0, results['up']['lost'])
+        self.assertGreater(results['up']['sent'], 10)
+        self.assertEqual(1, len(results['flapping']['outages']))
+        self.assertGreater(results['flapping']['downtime'], 0.03)
+        self.assertLess(results['flapping']['downtime'], 0.5)
+
+    def test_start_error(self):
+        probe = FakeProbe('fake')
+
+        async def start():
+            raise PermissionError('not permitted')
+        probe.start = start
+        meter = net_downtime.ProbeDowntimeMeter([probe])
+        exc = self.assertRaises(testtools.MultipleExceptions, meter.setUp)
+        self.assertEqual(PermissionError, exc.args[0][0])
+        self.assertTrue(probe.closed)
@@ -11,9 +11,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import os
 import subprocess
+import sys
+import textwrap
 from unittest import mock
 
+import fixtures
 
 from tempest.lib.cli import base as cli_base
 from tempest.lib import exceptions
@@ -149,3 +153,65 @@ class TestCLIClient(base.TestCase):
         self.assertEqual(mock_execute.call_count, 1)
         self.assertIn('--os-identity-api-version 0.0 ',
                       mock_execute.call_args[0][2])
+
+
+FAKE_OPENSTACK_SHELL = """
+import sys
+
+
+def main(argv):
+    print(' '.join(argv[-2:]))
+    sys.stderr.write('pid %d\\n' % __import__('os').getpid())
+    if 'fail' in argv:
+        return 1
+    if 'exit' in argv:
+        sys.exit(2)
+"""
+
+
+class TestCLIBatch(base.TestCase):
+
+    def setUp(self):
+        super(TestCLIBatch, self).setUp()
+        # A fake openstack client run by a fake openstack script
+        directory = self.useFixture(fixtures.TempDir()).path
+        os.mkdir(os.path.join(directory, 'openstackclient'))
+        with open(os.path.join(directory, 'openstackclient',
+                               '__init__.py'), 'w'):
+            pass
+        with open(os.path.join(directory, 'openstackclient',
+                               'shell.py'), 'w') as f:
+            f.write(textwrap.dedent(FAKE_OPENSTACK_SHELL))
+        with open(os.path.join(directory, 'openstack'), 'w') as f:
+            f.write('#!%s\n' % sys.executable)
+        self.useFixture(fixtures.EnvironmentVariable('PYTHONPATH',
+                                                     directory))
+        cli = cli_base.CLIClient(username='user', password='pass',
+                                 cli_dir=directory)
+        self.batch = cli.batch()
+        self.addCleanup(self.batch.close)
+
+    def test_commands_share_a_process(self):
+        first = self.batch.openstack('server list', params='--long')
+        self.assertEqual('list --long\n', first)
+        second = self.batch.openstack('server show', params='fake',
+                                      merge_stderr=True)
+        self.assertIn('show fake\n', second)
+        self.assertIn('pid %d' % self.batch._proc.pid, second)
+
+    def test_command_failure(self):
+        self.assertRaises(exceptions.CommandFailed, self.batch.openstack,
+                          'server show', params='fail')
+        exc = self.assertRaises(exceptions.CommandFailed,
+                                self.batch.openstack, 'server show',
+                                params='exit')
+        self.assertEqual(2, exc.returncode)
+        self.assertEqual('show fail\n', self.batch.openstack(
+            'server show', params='fail', fail_ok=True))
+
+    def test_close(self):
+        with self.batch as batch:
+            batch.openstack('server list')
+            proc = batch._proc
+        self.assertIsNone(self.batch._proc)
+        self.assertEqual(0, proc.returncode)
@@ -122,6 +122,22 @@ class TestOutputParser(base.TestCase):
         self.assertIsInstance(actual, list)
         self.assertEqual(expected, actual)
 
+    def test_columns(self):
+        expected = {'ID': ['11', '21', '31'],
+                    'Name': ['foo', 'bar', 'bee'],
+                    'Status': ['BUILD', 'ERROR', 'None']}
+        self.assertEqual(expected, output_parser.columns(self.OUTPUT_LINES))
+
+    def test_columns_without_rows(self):
+        output_lines = """
++----+------+
+| ID | Name |
++----+------+
++----+------+
+"""
+        self.assertEqual({'ID': [], 'Name': []},
+                         output_parser.columns(output_lines))
+
     def test_details_multiple_with_invalid_line(self):
         self.assertRaises(exceptions.InvalidStructure,
                           output_parser.details_multiple,
@@ -12,6 +12,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import sys
+from unittest import mock
+
 import testtools
 
 from tempest.lib.common import api_version_utils
@@ -194,3 +197,46 @@ class TestMicroversionHeaderMatches(base.TestCase):
             api_version_utils.compare_version_header_to_response(
                 microversion_header_name, request_microversion, test_response,
                 "eq"))
+
+
+class TestSelectSchema(base.TestCase):
+
+    schema_versions_info = [
+        {'min': None, 'max': '2.1', 'schema': 'schemav21'},
+        {'min': '2.2', 'max': '2.9', 'schema': 'schemav22'},
+        {'min': '2.10', 'max': None,
+         'schema': api_version_utils.LazySchemaModule(
+             'tempest.lib.api_schema.response.compute.v2_16.servers')}]
+
+    def test_select_schema(self):
+        self.assertEqual('schemav21', api_version_utils.select_schema(
+            self.schema_versions_info, None))
+        self.assertEqual('schemav22', api_version_utils.select_schema(
+            self.schema_versions_info, '2.5'))
+
+    def test_select_schema_module(self):
+        schema = api_version_utils.select_schema(
+            self.schema_versions_info, 'latest')
+        module = sys.modules['tempest.lib.api_schema.response.compute.'
+                             'v2_16.servers']
+        self.assertIs(module, schema)
+        # The lazy module also gives the attributes of the module
+        self.assertIs(module.get_server,
+                      self.schema_versions_info[2]['schema'].get_server)
+
+    def test_select_schema_not_found(self):
+        self.assertRaises(exceptions.JSONSchemaNotFound,
+                          api_version_utils.select_schema,
+                          self.schema_versions_info[:2], '2.10')
+
+    def test_select_schema_cached(self):
+        schema_versions_info = [{'min': None, 'max': None, 'schema': 'v21'}]
+        api_version_utils.select_schema(schema_versions_info, '2.3')
+        with mock.patch('tempest.lib.common.api_version_request.'
+                        'APIVersionRequest') as version_request:
+            self.assertEqual('v21', api_version_utils.select_schema(
+                schema_versions_info, '2.3'))
+            version_request.assert_not_called()
+        # Another list of the same content is resolved on its own
+        self.assertEqual('v1', api_version_utils.select_schema(
+            [{'min': None, 'max': None, 'schema': 'v1'}], '2.3'))
@@ -0,0 +1,159 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import gzip
+import json
+import os
+from unittest import mock
+
+import fixtures
+
+from tempest.lib import auth
+from tempest.lib.common import cassette
+from tempest.lib import exceptions
+from tempest.lib.services.compute import servers_client
+from tempest.lib.services.object_storage import container_client
+from tempest.lib.services.object_storage import object_client
+from tempest.tests import base
+from tempest.tests.lib import fake_cloud
+from tempest.tests.lib import fake_http
+
+
+class TestCassette(base.TestCase):
+
+    def setUp(self):
+        super(TestCassette, self).setUp()
+        self.path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                 'cassette')
+        self.addCleanup(cassette.disable)
+        self.cloud = fake_cloud.FakeCloud()
+        self.fixture = self.useFixture(
+            fake_cloud.FakeCloudFixture(self.cloud))
+
+    def _client(self, client_class, service):
+        auth_provider = auth.KeystoneV3AuthProvider(
+            self.fixture.get_credentials(), self.fixture.identity_uri)
+        return client_class(auth_provider, service, 'RegionOne',
+                            build_interval=0.01, build_timeout=5)
+
+    def _server_lifecycle(self):
+        client = self._client(servers_client.ServersClient, 'compute')
+        server = client.create_server(name='fake', imageRef='image',
+                                      flavorRef='1')['server']
+        client.show_server(server['id'])
+        client.show_server(server['id'])
+        servers = client.list_servers()['servers']
+        client.delete_server(server['id'])
+        return server['id'], servers
+
+    def test_record_and_replay(self):
+        cassette.enable(self.path, cassette.RECORD)
+        recorded = self._server_lifecycle()
+        cassette.disable()
+        requests = sum(self.cloud.requests.values())
+
+        cassette.enable(self.path, cassette.REPLAY)
+        self.assertEqual(recorded, self._server_lifecycle())
+        # Nothing reached the cloud
+        self.assertEqual(requests, sum(self.cloud.requests.values()))
+
+    def test_record_is_compact_and_redacted(self):
+        cassette.enable(self.path, cassette.RECORD)
+        self._server_lifecycle()
+        interactions = cassette._cassette['cassette'].interactions
+        cassette.disable()
+
+        self.assertEqual(6, len(interactions))
+        self.assertEqual('<redacted>',
+                         interactions[0]['headers']['x-subject-token'])
+        # The two identical show_server responses share their body
+        self.assertEqual(interactions[2]['body'], interactions[3]['body'])
+        digests = set(interaction[key] for interaction in interactions
+                      for key in ('request', 'body')) - set([None])
+        self.assertEqual(sorted(digest + '.gz' for digest in digests),
+                         sorted(os.listdir(os.path.join(self.path,
+                                                        'bodies'))))
+        for token in self.cloud._tokens:
+            for root, _, files in os.walk(self.path):
+                for name in files:
+                    with open(os.path.join(root, name), 'rb') as fd:
+                        data = fd.read()
+                    if name.endswith('.gz'):
+                        data = gzip.decompress(data)
+                    self.assertNotIn(token.encode(), data)
+        self.assertNotIn(b'secret', data)
+
+    def test_record_redacts_v2_tokens(self):
+        recorder = cassette.Cassette(self.path, cassette.RECORD)
+        token = 'v2-token-id'
+        recorder.record(
+            'POST', 'http://cloud/identity/v2.0/tokens', {}, '{}',
+            fake_http.fake_http_response({}), json.dumps(
+                {'access': {'token': {'id': token}}}), 0.1)
+        recorder.record(
+            'GET', 'http://cloud/compute/v2.1/servers', {}, None,
+            fake_http.fake_http_response({}),
+            json.dumps({'token': token}), 0.1)
+        for interaction in recorder.interactions:
+            body = recorder._load_body(interaction['body'])
+            self.assertNotIn(token.encode(), body)
+            self.assertIn(b'<redacted>', body)
+
+    def test_replay_latency(self):
+        cassette.enable(self.path, cassette.RECORD)
+        self._server_lifecycle()
+        elapsed = [interaction['elapsed'] for interaction
+                   in cassette._cassette['cassette'].interactions]
+        cassette.disable()
+
+        cassette.enable(self.path, cassette.REPLAY, latency=0.5)
+        with mock.patch('time.sleep') as sleep:
+            self._server_lifecycle()
+        self.assertEqual([mock.call(value * 0.5) for value in elapsed],
+                         sleep.call_args_list)
+
+    def test_replay_streamed_response(self):
+        containers = self._client(container_client.ContainerClient,
+                                  'object-store')
+        objects = self._client(object_client.ObjectClient, 'object-store')
+        containers.create_container('container')
+        objects.create_object('container', 'object', b'data')
+
+        cassette.enable(self.path, cassette.RECORD)
+        recorded = [item['name'] for item
+                    in containers.iter_container_objects('container')]
+        cassette.disable()
+        requests = sum(self.cloud.requests.values())
+
+        cassette.enable(self.path, cassette.REPLAY)
+        self.assertEqual(['object'], recorded)
+        self.assertEqual(recorded, [
+            item['name'] for item
+            in containers.iter_container_objects('container')])
+        self.assertEqual(requests, sum(self.cloud.requests.values()))
+
+    def test_not_recorded(self):
+        cassette.enable(self.path, cassette.RECORD)
+        self._client(servers_client.ServersClient, 'compute').list_servers()
+        cassette.disable()
+
+        cassette.enable(self.path, cassette.REPLAY)
+        client = self._client(servers_client.ServersClient, 'compute')
+        self.assertRaises(exceptions.InteractionNotRecorded,
+                          client.show_server, 'missing')
+
+    def test_invalid_mode(self):
+        self.assertRaises(exceptions.InvalidParam, cassette.enable,
+                          self.path, 'invalid')
@@ -0,0 +1,109 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import itertools
+from unittest import mock
+
+import testtools
+
+from tempest.lib.common import deletion_tracker
+from tempest.lib.common import rest_client
+from tempest.lib import exceptions
+from tempest.tests import base
+from tempest.tests.lib import fake_auth_provider
+
+
+class FakeClient(rest_client.RestClient):
+
+    def __init__(self, deleted_after, build_timeout=10, build_interval=1):
+        super(FakeClient, self).__init__(
+            fake_auth_provider.FakeAuthProvider(), 'fake', 'regionOne',
+            build_timeout=build_timeout, build_interval=build_interval)
+        # Number of checks after which each resource is deleted
+        self.deleted_after = deleted_after
+        self.checks = dict.fromkeys(deleted_after, 0)
+        self.list_calls = 0
+
+    def is_resource_deleted(self, id, *args, **kwargs):
+        self.checks[id] += 1
+        if self.deleted_after[id] is None:
+            raise exceptions.DeleteErrorException(resource_id=id)
+        return self.checks[id] > self.deleted_after[id]
+
+    def deleted_resources(self, ids):
+        self.list_calls += 1
+        return super(FakeClient, self).deleted_resources(ids)
+
+    @property
+    def resource_type(self):
+        return 'fake'
+
+
+class TestDeletionTracker(base.TestCase):
+
+    def setUp(self):
+        super(TestDeletionTracker, self).setUp()
+        self.tracker = deletion_tracker.DeletionTracker()
+        self.addCleanup(self.tracker._pending.clear)
+        self.sleep = self.patch('time.sleep')
+
+    def test_singleton(self):
+        self.assertIs(self.tracker, deletion_tracker.DeletionTracker())
+
+    def test_drain(self):
+        volumes = FakeClient({'vol1': 0, 'vol2': 2}, build_interval=2)
+        servers = FakeClient({'srv1': 1}, build_interval=1)
+        self.tracker.track(volumes, 'vol1')
+        self.tracker.track(volumes, 'vol2')
+        self.tracker.track(servers, 'srv1')
+        self.assertEqual([(volumes, 'vol1'), (volumes, 'vol2'),
+                          (servers, 'srv1')], self.tracker.pending())
+        self.tracker.drain()
+        self.assertEqual([], self.tracker.pending())
+        # One batched check per client and pass, the passes stop when all
+        # the resources of a client are deleted
+        self.assertEqual(3, volumes.list_calls)
+        self.assertEqual(2, servers.list_calls)
+        self.assertEqual([mock.call(1), mock.call(2)],
+                         self.sleep.call_args_list)
+
+    def test_drain_with_extra_arguments(self):
+        client = FakeClient({'res1': 1})
+        client.is_resource_deleted = mock.Mock(side_effect=[False, True])
+        self.tracker.track(client, 'res1', 'extra', key='value')
+        self.tracker.drain()
+        self.assertEqual(0, client.list_calls)
+        client.is_resource_deleted.assert_called_with(
+            'res1', 'extra', key='value')
+
+    def test_drain_errors(self):
+        client = FakeClient({'ok': 0, 'failed': None, 'stuck': 100},
+                            build_timeout=5)
+        with mock.patch('time.time', side_effect=itertools.count(0, 2)):
+            self.tracker.track(client, 'ok')
+            self.tracker.track(client, 'failed')
+            self.tracker.track(client, 'stuck')
+            exc = self.assertRaises(testtools.MultipleExceptions,
+                                    self.tracker.drain)
+        errors = [error[0] for error in exc.args]
+        self.assertEqual([exceptions.DeleteErrorException,
+                          exceptions.TimeoutException], errors)
+        self.assertEqual([], self.tracker.pending())
+
+    def test_drain_single_error(self):
+        client = FakeClient({'failed': None})
+        self.tracker.track(client, 'failed')
+        self.assertRaises(exceptions.DeleteErrorException,
+                          self.tracker.drain)
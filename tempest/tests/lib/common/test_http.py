@@ -12,6 +12,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import copy
+import pickle
+
 import urllib3
 
 from tempest.lib.common import http
@@ -26,6 +29,26 @@ REQUEST_URL = 'http://10.0.0.107:5000/v2.0'
 REQUEST_METHOD = 'GET'
 
 
+class TestResponse(base.TestCase):
+
+    def test_response(self):
+        response = http.Response.from_urllib3(urllib3.HTTPResponse(
+            headers={'Content-Type': 'application/json', 'X-Foo': 'bar'},
+            status=201, reason='Created', version=11), REQUEST_URL)
+
+        self.assertEqual({'content-type': 'application/json',
+                          'x-foo': 'bar', 'status': '201',
+                          'content-location': REQUEST_URL}, response)
+        self.assertEqual((201, 'Created', 11),
+                         (response.status, response.reason, response.version))
+        self.assertFalse(hasattr(response, '__dict__'))
+        for clone in (copy.copy(response), copy.deepcopy(response),
+                      pickle.loads(pickle.dumps(response))):
+            self.assertEqual(response, clone)
+            self.assertEqual(201, clone.status)
+            self.assertEqual('Created', clone.reason)
+
+
 class TestClosingHttp(base.TestCase):
 
     def closing_http(self, **kwargs):
@@ -174,6 +197,29 @@ class TestClosingHttp(base.TestCase):
             retries=retry(raise_on_redirect=False, redirect=5))
         self.assertIsInstance(response, urllib3.HTTPResponse)
 
+    def test_request_keep_alive(self):
+        # Given
+        connection = self.closing_http(keep_alive=True, maxsize=4)
+        http_response = urllib3.HTTPResponse()
+        request = self.patch('urllib3.PoolManager.request',
+                             return_value=http_response)
+        retry = self.patch('urllib3.util.Retry')
+        clear = self.patch('urllib3.PoolManager.clear')
+
+        # When
+        connection.request(
+            method=REQUEST_METHOD,
+            url=REQUEST_URL)
+
+        # Then
+        request.assert_called_once_with(
+            REQUEST_METHOD,
+            REQUEST_URL,
+            retries=retry(raise_on_redirect=False, redirect=5))
+        clear.assert_not_called()
+        self.assertEqual(4, connection.connection_pool_kw['maxsize'])
+        self.assertTrue(connection.connection_pool_kw['block'])
+
 
 class TestClosingProxyHttp(TestClosingHttp):
 
@@ -12,7 +12,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from unittest import mock
+
+import fixtures
+import jsonschema
+
 from tempest.lib.api_schema.response.compute.v2_1 import parameter_types
+from tempest.lib.common import jsonschema_validator
 from tempest.lib.common import rest_client
 from tempest.lib import exceptions
 from tempest.tests import base
@@ -81,3 +87,46 @@ class TestJSONSchemaDateTimeFormat(base.TestCase):
         self.assertRaises(exceptions.InvalidHTTPResponseBody,
                           rest_client.RestClient.validate_response,
                           self.date_time_schema[0], resp, body)
+
+
+class TestCachedValidator(base.TestCase):
+
+    def setUp(self):
+        super(TestCachedValidator, self).setUp()
+        self.schema = {'type': 'object',
+                       'properties': {'foo': {'type': 'integer'}},
+                       'required': ['foo']}
+
+    def test_get_validator_cached(self):
+        with mock.patch.object(jsonschema_validator.JSONSCHEMA_VALIDATOR,
+                               'check_schema') as check_schema:
+            validator = jsonschema_validator.get_validator(self.schema)
+            self.assertIs(validator,
+                          jsonschema_validator.get_validator(self.schema))
+            check_schema.assert_called_once_with(self.schema)
+        self.assertIsNot(validator,
+                         jsonschema_validator.get_validator(
+                             dict(self.schema)))
+
+    def test_get_validator_cache_size(self):
+        self.useFixture(fixtures.MockPatchObject(
+            jsonschema_validator, 'VALIDATOR_CACHE_SIZE', 2))
+        self.useFixture(fixtures.MockPatchObject(
+            jsonschema_validator, '_VALIDATORS', {}))
+        schemas = [{'type': 'object'} for _ in range(3)]
+        for schema in schemas:
+            jsonschema_validator.get_validator(schema)
+        self.assertEqual(
+            [id(schema) for schema in schemas[1:]],
+            list(jsonschema_validator._VALIDATORS))
+
+    def test_validate(self):
+        jsonschema_validator.validate({'foo': 1}, self.schema)
+        self.assertRaises(jsonschema.ValidationError,
+                          jsonschema_validator.validate,
+                          {'foo': 'bar'}, self.schema)
+
+    def test_validate_invalid_schema(self):
+        self.assertRaises(jsonschema.SchemaError,
+                          jsonschema_validator.validate,
+                          {}, {'type': 'invalid'})
@@ -0,0 +1,145 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from tempest.lib import auth
+from tempest.lib.common import response_cache
+from tempest.lib.services.compute import flavors_client
+from tempest.lib.services.compute import servers_client
+from tempest.lib.services.network import networks_client
+from tempest.tests import base
+from tempest.tests.lib import fake_cloud
+
+
+class TestResponseCache(base.TestCase):
+
+    def setUp(self):
+        super(TestResponseCache, self).setUp()
+        self.addCleanup(response_cache.disable)
+        self.cloud = fake_cloud.FakeCloud()
+        self.fixture = self.useFixture(
+            fake_cloud.FakeCloudFixture(self.cloud))
+        self.auth_provider = self._auth_provider()
+
+    def _auth_provider(self):
+        return auth.KeystoneV3AuthProvider(
+            self.fixture.get_credentials(), self.fixture.identity_uri)
+
+    def _client(self, client_class, service, auth_provider=None):
+        return client_class(auth_provider or self.auth_provider, service,
+                            'RegionOne', build_interval=0.01,
+                            build_timeout=5)
+
+    def test_cached(self):
+        response_cache.enable()
+        client = self._client(flavors_client.FlavorsClient, 'compute')
+        flavors = client.list_flavors()
+        self.assertEqual(flavors, client.list_flavors())
+        self.assertEqual(client.list_flavors(detail=True),
+                         client.list_flavors(detail=True))
+        # A single flavor is not cached
+        flavor_id = flavors['flavors'][0]['id']
+        self.assertEqual(client.show_flavor(flavor_id),
+                         client.show_flavor(flavor_id))
+        self.assertEqual(4, self.cloud.requests['GET', 'compute'])
+        self.assertEqual(dict(hits=2, misses=2, evictions=0,
+                              invalidations=0, size=2),
+                         response_cache.stats())
+
+    def test_not_cached(self):
+        response_cache.enable()
+        client = self._client(servers_client.ServersClient, 'compute')
+        client.list_servers()
+        client.list_servers()
+        self.assertEqual(2, self.cloud.requests['GET', 'compute'])
+        # Nothing is cached without the cache
+        response_cache.disable()
+        client = self._client(flavors_client.FlavorsClient, 'compute')
+        client.list_flavors()
+        client.list_flavors()
+        self.assertEqual(4, self.cloud.requests['GET', 'compute'])
+        self.assertEqual({}, response_cache.stats())
+
+    def test_cached_per_token(self):
+        response_cache.enable()
+        self._client(flavors_client.FlavorsClient, 'compute').list_flavors()
+        self._client(flavors_client.FlavorsClient, 'compute',
+                     self._auth_provider()).list_flavors()
+        self.assertEqual(2, self.cloud.requests['GET', 'compute'])
+
+    def test_invalidated(self):
+        response_cache.enable()
+        client = self._client(networks_client.NetworksClient, 'network')
+        self.assertEqual([], client.list_networks()['networks'])
+        self.assertEqual([], client.list_networks()['networks'])
+        network = client.create_network(name='net')['network']
+        self.assertEqual([network['id']], [
+            item['id'] for item in client.list_networks()['networks']])
+        client.delete_network(network['id'])
+        self.assertEqual([], client.list_networks()['networks'])
+        self.assertEqual(3, self.cloud.requests['GET', 'network'])
+        self.assertEqual(2, response_cache.stats()['invalidations'])
+
+    def test_expired(self):
+        cache = response_cache.ResponseCache(ttl=10)
+        with mock.patch('time.monotonic', return_value=100):
+            cache.put('key', ('host', 'flavors'), {}, b'body')
+        with mock.patch('time.monotonic', return_value=109):
+            self.assertEqual(({}, b'body'), cache.get('key'))
+        with mock.patch('time.monotonic', return_value=110):
+            self.assertIsNone(cache.get('key'))
+        self.assertEqual(0, cache.stats()['size'])
+
+    def test_evicted(self):
+        cache = response_cache.ResponseCache(max_size=2)
+        for key in ('a', 'b'):
+            cache.put(key, ('host', 'flavors'), {}, key)
+        # The least recently used entry is evicted
+        cache.get('a')
+        cache.put('c', ('host', 'flavors'), {}, 'c')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(({}, 'a'), cache.get('a'))
+        self.assertEqual(({}, 'c'), cache.get('c'))
+        self.assertEqual(1, cache.stats()['evictions'])
+
+    def test_collection(self):
+        cache = response_cache.ResponseCache()
+        for url, collection in (
+                ('http://host/compute/v2.1/flavors/detail?minRam=1',
+                 ('host', 'flavors')),
+                ('http://host/image/v2/images?limit=10', ('host', 'images')),
+                ('http://host/compute/v2.1/flavors/id', None),
+                ('http://host/image/v2/images/id', None),
+                ('http://host/image/v2/images/id/file', None),
+                ('http://host:9696/v2.0/networks/id', None),
+                ('http://host/identity/v3/users/id/projects', None),
+                ('http://host/identity/v3/projects/id/users/id/roles', None),
+                ('http://host/compute/', ('host', 'versions')),
+                ('http://host:9696/v2.0', ('host:9696', 'versions')),
+                ('http://host:9292', ('host:9292', 'versions')),
+                ('http://host/compute/v2.1/servers/id', None)):
+            self.assertEqual(collection, cache.collection(url))
+        self.assertIsNone(response_cache.ResponseCache(
+            cached_collections=['flavors']).collection('http://host/v3'))
+
+    def test_key(self):
+        cache = response_cache.ResponseCache()
+        self.assertEqual(
+            ('token', 'http://host/v3', (('accept', 'json'),
+                                         ('openstack-api-version', '3.0'))),
+            cache.key('http://host/v3', {'X-Auth-Token': 'token',
+                                         'OpenStack-API-Version': '3.0',
+                                         'Accept': 'json'}))
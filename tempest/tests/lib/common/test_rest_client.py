@@ -614,6 +614,15 @@ class TestRestClientUtils(BaseRestClientTestClass):
         self.fake_auth_provider.get_token = get_token
         self.assertIsNotNone(str(self.rest_client))
 
+    def test_pooled_client(self):
+        client = self.rest_client.pooled_client(8)
+
+        self.assertIsNot(self.rest_client.http_obj, client.http_obj)
+        self.assertTrue(client.http_obj.keep_alive)
+        self.assertFalse(self.rest_client.http_obj.keep_alive)
+        self.assertEqual(8, client.http_obj.connection_pool_kw['maxsize'])
+        self.assertIs(self.rest_client.auth_provider, client.auth_provider)
+
 
 class TestRateLimiting(BaseRestClientTestClass):
 
@@ -916,6 +925,15 @@ class TestResponseBody(base.TestCase):
         self.assertEqual("response: %s\nBody: %s" % (response, body),
                          str(actual))
 
+    def test_slots(self):
+        response = http.Response({'x-foo': 'bar'}, status=200)
+        actual = rest_client.ResponseBody(response, {'key1': 'value1'})
+        self.assertFalse(hasattr(actual, '__dict__'))
+        clone = copy.deepcopy(actual)
+        self.assertEqual(actual, clone)
+        self.assertEqual(response, clone.response)
+        self.assertEqual(200, clone.response.status)
+
 
 class TestResponseBodyData(base.TestCase):
 
@@ -33,6 +33,8 @@ SERVICES = 'tempest.lib.services'
 SG_CLIENT = (SERVICES + '.%s.security_groups_client.SecurityGroupsClient.%s')
 SGR_CLIENT = (SERVICES + '.%s.security_group_rules_client.'
               'SecurityGroupRulesClient.create_security_group_rule')
+SGR_BULK = (SERVICES + '.network.security_group_rules_client.'
+            'SecurityGroupRulesClient.create_security_group_rules')
 KP_CLIENT = (SERVICES + '.compute.keypairs_client.KeyPairsClient.%s')
 FIP_CLIENT = (SERVICES + '.%s.floating_ips_client.FloatingIPsClient.%s')
 
@@ -52,6 +54,8 @@ class TestValidationResources(base.TestCase):
             SGR_CLIENT % 'compute', autospec=True))
         self.mock_sgr_network = self.useFixture(fixtures.MockPatch(
             SGR_CLIENT % 'network', autospec=True))
+        self.mock_sgr_bulk = self.useFixture(fixtures.MockPatch(
+            SGR_BULK, autospec=True))
         self.mock_kp = self.useFixture(fixtures.MockPatch(
             KP_CLIENT % 'create_keypair', autospec=True,
             return_value=FAKE_KEYPAIR))
@@ -96,6 +100,22 @@ class TestValidationResources(base.TestCase):
             self.assertIn(expected_sg_id, call[1].values())
             self.assertIn(expected_ethertype, call[1].values())
 
+    def test_create_ssh_security_group_neutron_bulk(self):
+        sg = vr.create_ssh_security_group(self.os, add_rule=True,
+                                          use_neutron=True,
+                                          ethertype='fake_ethertype',
+                                          bulk=True)
+        self.assertEqual(FAKE_SECURITY_GROUP['security_group'], sg)
+        # All the rules are created with a single request
+        self.assertEqual(self.mock_sgr_network.mock.call_count, 0)
+        self.mock_sgr_bulk.mock.assert_called_once()
+        rules = self.mock_sgr_bulk.mock.call_args[0][1]
+        self.assertEqual(['tcp', 'icmp'],
+                         [rule['protocol'] for rule in rules])
+        for rule in rules:
+            self.assertEqual('sg_id', rule['security_group_id'])
+            self.assertEqual('fake_ethertype', rule['ethertype'])
+
     def test_create_ssh_security_no_rules(self):
         sg = vr.create_ssh_security_group(self.os, add_rule=False)
         self.assertEqual(FAKE_SECURITY_GROUP['security_group'], sg)
@@ -164,6 +184,33 @@ class TestValidationResources(base.TestCase):
         self.assertEqual(resources['floating_ip']['id'],
                          FAKE_FIP_NEUTRON['floatingip']['id'])
 
+    def test_create_validation_resources_concurrent(self):
+        resources = vr.create_validation_resources(
+            self.os, keypair=True, floating_ip=True, security_group=True,
+            security_group_rules=True, use_neutron=True,
+            floating_network_id='my_fni', concurrent=True)
+        self.assertEqual(FAKE_KEYPAIR['keypair'], resources['keypair'])
+        self.assertEqual(FAKE_SECURITY_GROUP['security_group'],
+                         resources['security_group'])
+        self.assertEqual('1.2.3.4', resources['floating_ip']['ip'])
+        # The rules are created with the bulk request
+        self.mock_sgr_bulk.mock.assert_called_once()
+        self.assertEqual(self.mock_sgr_network.mock.call_count, 0)
+
+    @mock.patch.object(vr, 'clear_validation_resources', autospec=True)
+    def test_create_validation_resources_concurrent_error(self, mock_clear):
+        self.mock_fip_network.mock.side_effect = lib_exc.Conflict('fip')
+        with testtools.ExpectedException(lib_exc.Conflict):
+            vr.create_validation_resources(
+                self.os, keypair=True, floating_ip=True, security_group=True,
+                use_neutron=True, concurrent=True)
+        # The resources provisioned in parallel with the failed one are
+        # cleaned up
+        mock_clear.assert_called_once_with(
+            self.os, keypair=FAKE_KEYPAIR['keypair'], floating_ip=None,
+            security_group=FAKE_SECURITY_GROUP['security_group'],
+            use_neutron=True, concurrent=True)
+
 
 class TestClearValidationResourcesFixture(base.TestCase):
 
@@ -262,6 +309,22 @@ class TestClearValidationResourcesFixture(base.TestCase):
         self.assertGreater(self.mock_sg_network.mock.call_count, 0)
         self.assertGreater(self.mock_fip_network.mock.call_count, 0)
 
+    def test_clear_validation_resources_exceptions_concurrent(self):
+        # The first exception is reported in the same order as the serial
+        # cleanup, whichever cleanup fails first
+        self.mock_sg_network.mock.side_effect = Exception('sg exception')
+        self.mock_fip_network.mock.side_effect = Exception('fip exception')
+        with testtools.ExpectedException(Exception, value_re='sg'):
+            vr.clear_validation_resources(
+                self.os,
+                floating_ip=FAKE_FIP_NEUTRON['floatingip'],
+                security_group=FAKE_SECURITY_GROUP['security_group'],
+                keypair=FAKE_KEYPAIR['keypair'],
+                use_neutron=True, concurrent=True)
+        self.assertGreater(self.mock_kp.mock.call_count, 0)
+        self.assertGreater(self.mock_sg_network.mock.call_count, 0)
+        self.assertGreater(self.mock_fip_network.mock.call_count, 0)
+
     def test_clear_validation_resources_wait_not_found_wait(self):
         # Test that a not found on wait is not an exception
         self.mock_sg_wait_network.mock.side_effect = lib_exc.NotFound('yay')
@@ -308,7 +371,8 @@ class TestValidationResourcesFixture(base.TestCase):
                               security_group=True, security_group_rules=True,
                               ethertype='v6', use_neutron=True,
                               floating_network_id='fnid',
-                              floating_network_name='fnname')
+                              floating_network_name='fnname',
+                              concurrent=True)
         # First mock cleanup
         self.useFixture(fixtures.MockPatchObject(
             vr, 'clear_validation_resources', autospec=True))
@@ -333,7 +397,8 @@ class TestValidationResourcesFixture(base.TestCase):
                               security_group=True, security_group_rules=True,
                               ethertype='v6', use_neutron=True,
                               floating_network_id='fnid',
-                              floating_network_name='fnname')
+                              floating_network_name='fnname',
+                              concurrent=True)
         with vr.ValidationResourcesFixture(exp_clients,
                                            **exp_parameters) as vr_fixture:
             # Assert vr have been provisioned
@@ -342,4 +407,5 @@ class TestValidationResourcesFixture(base.TestCase):
             self.assertEqual(exp_vr, vr_fixture.resources)
         # After context manager is closed, clear is invoked
         exp_vr['use_neutron'] = exp_parameters['use_neutron']
+        exp_vr['concurrent'] = exp_parameters['concurrent']
         mock_clear.assert_called_once_with(exp_clients, **exp_vr)
@@ -13,6 +13,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import hashlib
+
 from tempest.lib.common.utils import data_utils
 from tempest.tests import base
 
@@ -139,6 +141,51 @@ class TestDataUtils(base.TestCase):
         actual = data_utils.random_bytes(size=2048)
         self.assertEqual(2048, len(actual))
 
+    def test_random_bytes_too_large(self):
+        self.assertRaises(RuntimeError, data_utils.random_bytes,
+                          size=(1 << 20) + 1)
+
+    def test_random_data(self):
+        actual = data_utils.random_data(3 << 20)
+        self.assertIsInstance(actual, bytes)
+        self.assertEqual(3 << 20, len(actual))
+        self.assertNotEqual(actual, data_utils.random_data(3 << 20))
+
+    def test_random_data_seeded(self):
+        actual = data_utils.random_data(100000, seed=42)
+        self.assertEqual(actual, data_utils.random_data(100000, seed=42))
+        self.assertNotEqual(actual, data_utils.random_data(100000, seed=43))
+
+    def test_random_data_stream(self):
+        stream = data_utils.RandomDataStream(100000,
+                                             hash_algorithms=('sha256',))
+        self.assertEqual(100000, len(stream))
+        self.assertRaises(ValueError, stream.hexdigest, 'sha256')
+        chunks = []
+        chunk = stream.read(4096)
+        while chunk:
+            chunks.append(chunk)
+            chunk = stream.read(4096)
+        data = b''.join(chunks)
+        self.assertEqual(100000, len(data))
+        self.assertEqual(hashlib.sha256(data).hexdigest(),
+                         stream.hexdigest('sha256'))
+        # Only the checksums of hash_algorithms are computed
+        self.assertRaises(ValueError, stream.hexdigest, 'md5')
+
+    def test_random_data_stream_seeded(self):
+        expected = data_utils.random_data(200000, seed='abc')
+        stream = data_utils.RandomDataStream(200000, seed='abc')
+        # The checksum of a seeded stream is known before reading it
+        self.assertEqual(hashlib.md5(expected).hexdigest(),
+                         stream.hexdigest())
+        # and its content does not depend on the size of the reads
+        data = stream.read(1) + stream.read(70001) + stream.read()
+        self.assertEqual(expected, data)
+        self.assertEqual(b'', stream.read())
+        self.assertEqual(hashlib.md5(expected).hexdigest(),
+                         stream.hexdigest())
+
     def test_chunkify(self):
         data = "aaa"
         chunks = data_utils.chunkify(data, 2)
@@ -13,6 +13,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import os
+import sys
+import types
+
+import fixtures
 
 from tempest.lib.common.utils import misc
 from tempest.tests import base
@@ -50,3 +55,20 @@ class TestMisc(base.TestCase):
         self.assertEqual(test, test2)
         test3 = TestBar()
         self.assertNotEqual(test, test3)
+
+    def test_lazy_import(self):
+        path = self.useFixture(fixtures.TempDir()).path
+        with open(os.path.join(path, 'fake_lazy_module.py'), 'w') as f:
+            f.write('VALUE = 42\n')
+        self.useFixture(fixtures.MonkeyPatch('sys.path', [path] + sys.path))
+        self.addCleanup(sys.modules.pop, 'fake_lazy_module', None)
+        module = misc.lazy_import('fake_lazy_module')
+        self.assertIs(module, sys.modules['fake_lazy_module'])
+        # The module is only executed on first attribute access
+        self.assertIsNot(types.ModuleType, type(module))
+        self.assertEqual(42, module.VALUE)
+        self.assertIs(types.ModuleType, type(module))
+        self.assertIs(module, misc.lazy_import('fake_lazy_module'))
+
+    def test_lazy_import_not_found(self):
+        self.assertRaises(ImportError, misc.lazy_import, 'tempest.fake_module')
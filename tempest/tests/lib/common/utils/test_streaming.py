@@ -0,0 +1,136 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import hashlib
+import io
+import os
+
+import fixtures
+import urllib3
+
+from tempest.lib import auth
+from tempest.lib.common.utils import streaming
+from tempest.lib import exceptions
+from tempest.lib.services.image.v2 import images_client
+from tempest.lib.services.object_storage import container_client
+from tempest.lib.services.object_storage import object_client
+from tempest.tests import base
+from tempest.tests.lib import fake_cloud
+
+DATA = os.urandom(100 * 1024 + 7)
+
+
+class TestStreamResponse(base.TestCase):
+
+    def _response(self, data=DATA, length=True):
+        headers = {'Content-Length': str(len(data))} if length else {}
+        return urllib3.HTTPResponse(body=io.BytesIO(data), headers=headers,
+                                    status=200, preload_content=False)
+
+    def _assert_stats(self, stats, data=DATA):
+        self.assertEqual(len(data), stats.size)
+        self.assertEqual({'md5': hashlib.md5(data).hexdigest(),
+                          'sha256': hashlib.sha256(data).hexdigest()},
+                         stats.checksums)
+        self.assertGreater(stats.throughput, 0)
+
+    def test_file(self):
+        dest = io.BytesIO()
+        stats = streaming.stream_response(self._response(), dest,
+                                          buffer_size=4096)
+        self.assertEqual(DATA, dest.getvalue())
+        self._assert_stats(stats)
+
+    def test_path(self):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'data')
+        stats = streaming.stream_response(self._response(), path)
+        with open(path, 'rb') as fd:
+            self.assertEqual(DATA, fd.read())
+        self._assert_stats(stats)
+
+    def test_buffer(self):
+        for length in (True, False):
+            dest = bytearray(len(DATA) + 10)
+            stats = streaming.stream_response(
+                self._response(length=length), dest, buffer_size=4096)
+            self.assertEqual(DATA, bytes(dest[:len(DATA)]))
+            self._assert_stats(stats)
+
+    def test_buffer_too_small(self):
+        self.assertRaises(exceptions.InvalidParam,
+                          streaming.stream_response, self._response(),
+                          bytearray(len(DATA) - 1))
+        self.assertRaises(exceptions.InvalidParam,
+                          streaming.stream_response,
+                          self._response(length=False),
+                          bytearray(len(DATA) - 1))
+        self.assertRaises(exceptions.InvalidParam,
+                          streaming.stream_response, self._response(),
+                          bytes(len(DATA)))
+
+    def test_checksums_only(self):
+        stats = streaming.stream_response(self._response(),
+                                          algorithms=['sha512'])
+        self.assertEqual({'sha512': hashlib.sha512(DATA).hexdigest()},
+                         stats.checksums)
+        self.assertEqual(len(DATA), stats.size)
+
+
+class TestStreamingClients(base.TestCase):
+
+    def setUp(self):
+        super(TestStreamingClients, self).setUp()
+        self.cloud = fake_cloud.FakeCloud()
+        self.fixture = self.useFixture(
+            fake_cloud.FakeCloudFixture(self.cloud))
+        self.auth_provider = auth.KeystoneV3AuthProvider(
+            self.fixture.get_credentials(), self.fixture.identity_uri)
+
+    def _client(self, client_class, service):
+        return client_class(self.auth_provider, service, 'RegionOne',
+                            build_interval=0.01, build_timeout=5)
+
+    def test_stream_object(self):
+        containers = self._client(container_client.ContainerClient,
+                                  'object-store')
+        objects = self._client(object_client.ObjectClient, 'object-store')
+        containers.create_container('container')
+        objects.create_object('container', 'object', DATA)
+
+        dest = io.BytesIO()
+        resp, stats = objects.stream_object('container', 'object', dest)
+        self.assertEqual(200, resp.status)
+        self.assertEqual(
+            objects.get_object('container', 'object')[0]['content-location'],
+            resp['content-location'])
+        self.assertEqual(DATA, dest.getvalue())
+        self.assertEqual(hashlib.md5(DATA).hexdigest(), stats.checksums['md5'])
+
+    def test_stream_image_file(self):
+        client = self._client(images_client.ImagesClient, 'image')
+        image = client.create_image(name='image', container_format='bare',
+                                    disk_format='raw')
+        client.store_image_file(image['id'], io.BytesIO(DATA))
+
+        dest = bytearray(len(DATA))
+        resp, stats = client.stream_image_file(image['id'], dest,
+                                               algorithms=['sha512'])
+        self.assertEqual(200, resp.status)
+        self.assertEqual(
+            client.show_image_file(image['id']).response['content-location'],
+            resp['content-location'])
+        self.assertEqual(DATA, bytes(dest))
+        self.assertEqual({'sha512': hashlib.sha512(DATA).hexdigest()},
+                         stats.checksums)
@@ -16,7 +16,9 @@
 import copy
 from unittest import mock
 
+import fixtures
 
+from tempest.lib import exceptions as lib_exc
 from tempest.lib.services.compute import base_compute_client
 from tempest.lib.services.compute import servers_client
 from tempest.tests.lib import fake_auth_provider
@@ -1029,6 +1031,60 @@ class TestServersClient(base.BaseServiceTest):
             status=204,
             )
 
+    def test_is_resource_deleted(self):
+        self.useFixture(fixtures.MockPatchObject(
+            self.client, 'show_server', side_effect=lib_exc.NotFound))
+        self.assertTrue(self.client.is_resource_deleted(self.server_id))
+
+    def test_is_resource_deleted_error(self):
+        self.useFixture(fixtures.MockPatchObject(
+            self.client, 'show_server', return_value={'server': {
+                'id': self.server_id, 'status': 'ERROR'}}))
+        self.assertRaises(lib_exc.DeleteErrorException,
+                          self.client.is_resource_deleted, self.server_id)
+
+    @mock.patch.object(servers_client.ServersClient, 'is_resource_deleted',
+                       return_value=True)
+    def test_deleted_resources(self, is_resource_deleted):
+        self.useFixture(fixtures.MockPatchObject(
+            self.client, 'list_servers', return_value={'servers': [
+                {'id': 'server1', 'status': 'ACTIVE',
+                 'OS-EXT-STS:task_state': 'deleting'},
+                {'id': 'server2', 'status': 'ERROR',
+                 'OS-EXT-STS:task_state': 'deleting'}]}))
+        self.assertEqual(
+            {'server3'},
+            self.client.deleted_resources(['server1', 'server2', 'server3']))
+        self.client.list_servers.assert_called_once_with(detail=True)
+        # Only the servers missing from the list are checked one by one
+        is_resource_deleted.assert_called_once_with('server3')
+
+    def test_deleted_resources_error(self):
+        self.useFixture(fixtures.MockPatchObject(
+            self.client, 'list_servers', return_value={'servers': [
+                {'id': 'server1', 'status': 'ERROR'}]}))
+        self.assertRaises(lib_exc.DeleteErrorException,
+                          self.client.deleted_resources, ['server1'])
+
+    def test_deleted_resources_soft_deleted(self):
+        self.useFixture(fixtures.MockPatchObject(
+            self.client, 'list_servers', return_value={'servers': [
+                {'id': 'server1', 'status': 'SOFT_DELETED'}]}))
+        self.useFixture(fixtures.MockPatchObject(
+            self.client, 'force_delete_server', side_effect=lib_exc.NotFound))
+        self.assertEqual(set(), self.client.deleted_resources(['server1']))
+        self.client.force_delete_server.assert_called_once_with('server1')
+
+    @mock.patch.object(servers_client.ServersClient, 'is_resource_deleted',
+                       side_effect=[True, False])
+    def test_deleted_resources_paginated(self, is_resource_deleted):
+        self.useFixture(fixtures.MockPatchObject(
+            self.client, 'list_servers', return_value={
+                'servers': [], 'servers_links': [{'rel': 'next'}]}))
+        self.assertEqual({'server1'},
+                         self.client.deleted_resources(['server1', 'server2']))
+        self.assertEqual(2, is_resource_deleted.call_count)
+
 
 class TestServersClientMinV26(base.BaseServiceTest):
 
@@ -15,6 +15,7 @@
 
 from unittest import mock
 
+from tempest.lib import exceptions
 from tempest.lib.services.network import base as base_network_client
 from tempest.tests.lib import fake_auth_provider
 from tempest.tests.lib import fake_http
@@ -94,3 +95,46 @@ class TestBaseNetworkClient(base.BaseServiceTest):
         mock_put.assert_called_once_with('v2.0/fake_url', '{"foo": "bar"}')
         self.mock_expected_success.assert_called_once_with(
             201, 201)
+
+    @mock.patch('tempest.lib.common.rest_client.RestClient.post')
+    def test_create_resources(self, mock_post):
+        response = fake_http.fake_http_response(headers=None, status=201)
+        mock_post.return_value = (
+            response, '{"ports": [{"id": "1"}, {"id": "2"}]}')
+
+        resp = self.client.create_resources(
+            '/ports', 'ports', iter([{'name': 'a'}, {'name': 'b'}]))
+
+        self.assertEqual(['1', '2'], [port['id'] for port in resp['ports']])
+        mock_post.assert_called_once_with(
+            'v2.0/ports', '{"ports": [{"name": "a"}, {"name": "b"}]}')
+
+    @mock.patch('tempest.lib.common.rest_client.RestClient.post')
+    def test_create_resources_missing_resource(self, mock_post):
+        response = fake_http.fake_http_response(headers=None, status=201)
+        mock_post.return_value = response, '{"ports": [{"id": "1"}]}'
+
+        self.assertRaises(exceptions.InvalidHTTPResponseBody,
+                          self.client.create_resources, '/ports', 'ports',
+                          [{'name': 'a'}, {'name': 'b'}])
+
+    @mock.patch('tempest.lib.common.rest_client.RestClient.delete')
+    def test_delete_resources(self, mock_delete):
+        def delete(url):
+            if url.endswith('/2'):
+                raise exceptions.NotFound()
+            response = fake_http.fake_http_response(headers=None,
+                                                    status=204)
+            return response, ''
+        mock_delete.side_effect = delete
+
+        self.assertEqual({'1': {}, '3': {}}, self.client.delete_resources(
+            '/ports', ['1', '3']))
+        self.assertRaises(exceptions.NotFound, self.client.delete_resources,
+                          '/ports', ['1', '2', '3'])
+        # All the deletions are attempted despite the failure
+        self.assertEqual(
+            ['v2.0/ports/1', 'v2.0/ports/1', 'v2.0/ports/2', 'v2.0/ports/3',
+             'v2.0/ports/3'],
+            sorted(call[0][0] for call in mock_delete.call_args_list))
+        self.assertEqual({}, self.client.delete_resources('/ports', []))
@@ -169,7 +169,7 @@ class TestNetworksClient(base.BaseServiceTest):
             self.FAKE_NETWORKS,
             bytes_body,
             201,
-            networks=self.FAKE_NETWORKS_REQ)
+            **self.FAKE_NETWORKS_REQ)
 
     def _test_show_network(self, bytes_body=False):
         self.check_service_client_function(
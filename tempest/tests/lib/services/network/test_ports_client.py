@@ -197,7 +197,7 @@ class TestPortsClient(base.BaseServiceTest):
             self.FAKE_PORTS,
             bytes_body,
             201,
-            ports=self.FAKE_PORTS_REQ)
+            **self.FAKE_PORTS_REQ)
 
     def _test_show_port(self, bytes_body=False):
         self.check_service_client_function(
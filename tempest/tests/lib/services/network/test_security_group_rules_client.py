@@ -99,6 +99,27 @@ class TestSecurityGroupsClient(base.BaseServiceTest):
                 mock_args=['v2.0/security-group-rules', payload],
                 **kwargs)
 
+    def _test_create_security_group_rules(self, bytes_body=False):
+        rules = [{'direction': 'ingress', 'protocol': 'tcp',
+                  'security_group_id': '85cc3048-abc3-43cc-89b3-377341426ac5',
+                  'port_range_min': 22, 'port_range_max': 22},
+                 {'direction': 'ingress', 'protocol': 'icmp',
+                  'security_group_id': '85cc3048-abc3-43cc-89b3-377341426ac5'}]
+        payload = json.dumps({"security_group_rules": rules}, sort_keys=True)
+        json_dumps = json.dumps
+
+        with mock.patch.object(network_base.json, 'dumps') as mock_dumps:
+            mock_dumps.side_effect = lambda d: json_dumps(d, sort_keys=True)
+
+            self.check_service_client_function(
+                self.client.create_security_group_rules,
+                'tempest.lib.common.rest_client.RestClient.post',
+                self.FAKE_SECURITY_GROUP_RULES,
+                bytes_body,
+                status=201,
+                mock_args=['v2.0/security-group-rules', payload],
+                security_group_rules=rules)
+
     def _test_show_security_group_rule(self, bytes_body=False):
         self.check_service_client_function(
             self.client.show_security_group_rule,
@@ -121,6 +142,12 @@ class TestSecurityGroupsClient(base.BaseServiceTest):
     def test_create_security_group_rule_with_bytes_body(self):
         self._test_create_security_group_rule(bytes_body=True)
 
+    def test_create_security_group_rules_with_str_body(self):
+        self._test_create_security_group_rules()
+
+    def test_create_security_group_rules_with_bytes_body(self):
+        self._test_create_security_group_rules(bytes_body=True)
+
     def test_show_security_group_rule_with_str_body(self):
         self._test_show_security_group_rule()
 
@@ -12,6 +12,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import io
+import tarfile
+from unittest import mock
+
 from tempest.lib.services.object_storage import bulk_middleware_client
 from tempest.tests.lib import fake_auth_provider
 from tempest.tests.lib.services import base
@@ -64,3 +68,79 @@ class TestBulkMiddlewareClient(base.BaseServiceTest):
 
     def test_delete_bulk_data_with_post_204(self):
         self._test_delete_bulk_data_with_post(204)
+
+    @mock.patch.object(bulk_middleware_client.BulkMiddlewareClient, 'post')
+    def test_bulk_delete(self, mock_post):
+        sent = []
+
+        def fake_post(url, data, headers):
+            paths = data.split('\n')
+            sent.append(paths)
+            body = {'Number Deleted': len(paths), 'Number Not Found': 0,
+                    'Response Status': '200 OK', 'Errors': []}
+            return self.create_response(body)
+
+        mock_post.side_effect = fake_post
+        # The paths may be given by any iterator
+        paths = iter(['cont1/obj%d' % i for i in range(5)] +
+                     ['cont1', 'c 2/o 1'])
+
+        result = self.client.bulk_delete(paths, batch_size=2, concurrency=2)
+
+        self.assertEqual(7, result['Number Deleted'])
+        self.assertEqual('200 OK', result['Response Status'])
+        self.assertEqual([], result['Errors'])
+        # The container is only deleted after all of the objects
+        self.assertEqual(['cont1'], sent[-1])
+        self.assertIn('c%202/o%201', sum(sent, []))
+        self.assertEqual(4, len(sent))
+
+    @mock.patch.object(bulk_middleware_client.BulkMiddlewareClient,
+                       'raw_request')
+    @mock.patch.object(bulk_middleware_client.BulkMiddlewareClient, 'post')
+    def test_bulk_delete_batch_size_from_info(self, mock_post, mock_info):
+        info = {'bulk_delete': {'max_deletes_per_request': 3}}
+        mock_info.return_value = self.create_response(info)
+        body = {'Number Deleted': 3, 'Response Status': '400 Bad Request',
+                'Errors': [['cont1/obj0', '409 Conflict']]}
+        mock_post.return_value = self.create_response(body)
+
+        result = self.client.bulk_delete(
+            ['cont1/obj%d' % i for i in range(7)])
+
+        self.assertEqual(3, mock_post.call_count)
+        self.assertEqual('400 Bad Request', result['Response Status'])
+        self.assertEqual(3, len(result['Errors']))
+
+    def test_bulk_delete_nothing(self):
+        self.assertEqual({'Errors': []}, self.client.bulk_delete([]))
+
+    @mock.patch.object(bulk_middleware_client.BulkMiddlewareClient, 'put')
+    def test_bulk_upload(self, mock_put):
+        archives = []
+
+        def fake_put(url, data, headers, chunked=False):
+            self.assertTrue(chunked)
+            self.assertEqual('cont1?extract-archive=tar', url)
+            archive = tarfile.open(fileobj=io.BytesIO(b''.join(data)))
+            members = dict((member.name,
+                            archive.extractfile(member).read())
+                           for member in archive.getmembers())
+            archives.append(members)
+            body = {'Number Files Created': len(members),
+                    'Response Status': '201 Created', 'Errors': []}
+            return self.create_response(body)
+
+        mock_put.side_effect = fake_put
+        objects = (('obj%d' % i, b'data%d' % i) for i in range(5))
+
+        result = self.client.bulk_upload('cont1', objects, batch_size=2)
+
+        self.assertEqual(5, result['Number Files Created'])
+        # Archives are uploaded concurrently, in no particular order
+        self.assertEqual([1, 2, 2], sorted(len(a) for a in archives))
+        uploaded = {}
+        for archive in archives:
+            uploaded.update(archive)
+        self.assertEqual(dict(('obj%d' % i, b'data%d' % i)
+                              for i in range(5)), uploaded)
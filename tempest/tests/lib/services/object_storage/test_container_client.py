@@ -0,0 +1,121 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+from urllib import parse as urllib
+
+from oslo_serialization import jsonutils as json
+
+from tempest.lib import exceptions
+from tempest.lib.services.object_storage import account_client
+from tempest.lib.services.object_storage import container_client
+from tempest.tests import base
+from tempest.tests.lib import fake_auth_provider
+
+
+class TestIterJsonArray(base.TestCase):
+
+    def _split(self, data, size):
+        return [data[i:i + size] for i in range(0, len(data), size)]
+
+    def test_iter_json_array(self):
+        items = [{'name': 'obj%d' % i, 'bytes': i} for i in range(20)]
+        data = json.dumps(items).encode()
+        for size in (1, 3, 7, len(data)):
+            self.assertEqual(
+                items,
+                list(container_client.iter_json_array(
+                    self._split(data, size))))
+
+    def test_iter_json_array_numbers_and_unicode(self):
+        data = json.dumps([123456, 'café', 1.5]).encode()
+        self.assertEqual(
+            [123456, 'café', 1.5],
+            list(container_client.iter_json_array(self._split(data, 1))))
+
+    def test_iter_json_array_empty(self):
+        self.assertEqual([], list(container_client.iter_json_array([])))
+        self.assertEqual([],
+                         list(container_client.iter_json_array([b' [ ] '])))
+
+    def test_iter_json_array_not_an_array(self):
+        self.assertRaises(exceptions.InvalidHTTPResponseBody, list,
+                          container_client.iter_json_array([b'{}']))
+
+    def test_iter_json_array_truncated(self):
+        self.assertRaises(exceptions.InvalidHTTPResponseBody, list,
+                          container_client.iter_json_array([b'[{"a": 1}']))
+
+
+class TestIterListing(base.TestCase):
+
+    def setUp(self):
+        super(TestIterListing, self).setUp()
+        self.fake_auth = fake_auth_provider.FakeAuthProvider()
+        self.names = ['obj%02d' % i for i in range(7)]
+        self.urls = []
+
+    def _fake_get(self, url, headers=None, chunked=False):
+        self.urls.append(url)
+        path, _, query = url.partition('?')
+        params = dict(urllib.parse_qsl(query))
+        names = [name for name in self.names
+                 if name > params.get('marker', '')]
+        names = names[:int(params.get('limit', 3))]
+        resp = mock.Mock(status=200)
+        resp.stream.return_value = [
+            json.dumps([{'name': name} for name in names]).encode()]
+        return resp, b''
+
+    @mock.patch.object(container_client.ContainerClient, 'get')
+    def test_iter_container_objects(self, mock_get):
+        mock_get.side_effect = self._fake_get
+        client = container_client.ContainerClient(self.fake_auth, 'swift',
+                                                  'region1')
+
+        objects = client.iter_container_objects('container1', limit=3)
+
+        self.assertEqual(self.names, [obj['name'] for obj in objects])
+        self.assertEqual(
+            ['container1?format=json&limit=3',
+             'container1?format=json&limit=3&marker=obj02',
+             'container1?format=json&limit=3&marker=obj05'],
+            self.urls)
+
+    @mock.patch.object(container_client.ContainerClient, 'get')
+    def test_iter_container_objects_without_limit(self, mock_get):
+        mock_get.side_effect = self._fake_get
+        client = container_client.ContainerClient(self.fake_auth, 'swift',
+                                                  'region1')
+
+        objects = client.iter_container_objects('container1',
+                                                params={'marker': 'obj01'})
+
+        self.assertEqual(self.names[2:], [obj['name'] for obj in objects])
+        # Without a known page size, paging stops on an empty page
+        self.assertEqual(3, len(self.urls))
+        for call in mock_get.return_value.release_conn.call_args_list:
+            self.assertEqual(mock.call(), call)
+
+    @mock.patch.object(account_client.AccountClient, 'get')
+    def test_iter_account_containers(self, mock_get):
+        mock_get.side_effect = self._fake_get
+        client = account_client.AccountClient(self.fake_auth, 'swift',
+                                              'region1')
+
+        containers = client.iter_account_containers(limit=5)
+
+        self.assertEqual(self.names, [cont['name'] for cont in containers])
+        self.assertEqual(['?format=json&limit=5',
+                          '?format=json&limit=5&marker=obj04'], self.urls)
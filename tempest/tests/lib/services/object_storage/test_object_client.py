@@ -13,9 +13,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-
+import io
 from unittest import mock
 
+from oslo_serialization import jsonutils as json
+
 from tempest.lib import exceptions
 from tempest.lib.services.object_storage import object_client
 from tempest.tests import base
@@ -47,6 +49,95 @@ class TestObjectClient(base.TestCase):
         self._validate_create_object_continue('hello', mock_poc,
                                               initial_status=201)
 
+    @mock.patch.object(object_client.ObjectClient, 'create_object')
+    def test_create_large_object_slo(self, mock_create):
+        mock_create.return_value = ({'status': '201'}, '')
+        data = b'0123456789'
+
+        resp, stats = self.object_client.create_large_object(
+            'container1', 'object1', data, 4, concurrency=2)
+
+        self.assertEqual({'status': '201'}, resp)
+        self.assertEqual(['object1/segments/00000000',
+                          'object1/segments/00000001',
+                          'object1/segments/00000002'], stats.segments)
+        self.assertEqual(len(data), stats.size)
+        uploaded = dict((c[0][1], bytes(c[0][2]))
+                        for c in mock_create.call_args_list[:-1])
+        self.assertEqual(b'0123', uploaded['object1/segments/00000000'])
+        self.assertEqual(b'89', uploaded['object1/segments/00000002'])
+
+        manifest_call = mock_create.call_args_list[-1]
+        self.assertEqual(('container1', 'object1'), manifest_call[0][:2])
+        self.assertEqual({'multipart-manifest': 'put'},
+                         manifest_call[1]['params'])
+        manifest = json.loads(manifest_call[0][2])
+        self.assertEqual(
+            ['/container1/object1/segments/00000000',
+             '/container1/object1/segments/00000001',
+             '/container1/object1/segments/00000002'],
+            [segment['path'] for segment in manifest])
+        self.assertEqual([4, 4, 2],
+                         [segment['size_bytes'] for segment in manifest])
+
+    @mock.patch.object(object_client.ObjectClient, 'create_object')
+    def test_create_large_object_dlo_from_file(self, mock_create):
+        mock_create.return_value = ({'status': '201'}, '')
+
+        _, stats = self.object_client.create_large_object(
+            'container1', 'object1', io.BytesIO(b'0123456789'), 5,
+            manifest_type='dlo', segment_container='segments1')
+
+        self.assertEqual(2, len(stats.segments))
+        for segment_call in mock_create.call_args_list[:-1]:
+            self.assertEqual('segments1', segment_call[0][0])
+        mock_create.assert_called_with(
+            'container1', 'object1', '',
+            metadata={'X-Object-Manifest': 'segments1/object1/segments/'})
+
+    def test_create_large_object_invalid_manifest_type(self):
+        self.assertRaises(exceptions.InvalidParam,
+                          self.object_client.create_large_object,
+                          'container1', 'object1', b'data', 4,
+                          manifest_type='invalid')
+
+    @mock.patch.object(object_client.ObjectClient, 'get')
+    @mock.patch.object(object_client.ObjectClient, 'list_object_metadata')
+    def test_download_object(self, mock_head, mock_get):
+        data = b'0123456789'
+        mock_head.return_value = ({'content-length': str(len(data))}, '')
+
+        def fake_get(url, headers=None, chunked=False):
+            first, last = headers['Range'][len('bytes='):].split('-')
+            range_resp = mock.Mock(status=206)
+            range_resp.stream.return_value = [
+                data[int(first):int(last) + 1]]
+            return range_resp, b''
+
+        mock_get.side_effect = fake_get
+        dest = io.BytesIO()
+
+        _, stats = self.object_client.download_object(
+            'container1', 'object1', dest, range_size=3, concurrency=3)
+
+        self.assertEqual(data, dest.getvalue())
+        self.assertEqual([(0, 2), (3, 5), (6, 8), (9, 9)], stats.segments)
+        self.assertEqual(len(data), stats.size)
+        self.assertEqual(4, mock_get.call_count)
+
+    @mock.patch.object(object_client.ObjectClient, 'get')
+    @mock.patch.object(object_client.ObjectClient, 'list_object_metadata')
+    def test_download_object_range_ignored(self, mock_head, mock_get):
+        mock_head.return_value = ({'content-length': '10'}, '')
+        range_resp = mock.Mock(status=200)
+        mock_get.return_value = (range_resp, b'')
+
+        self.assertRaises(exceptions.UnexpectedResponseCode,
+                          self.object_client.download_object,
+                          'container1', 'object1', io.BytesIO(),
+                          range_size=5)
+        range_resp.release_conn.assert_called_with()
+
     def _validate_create_object_continue(self, req_data,
                                          mock_poc, initial_status=100):
 
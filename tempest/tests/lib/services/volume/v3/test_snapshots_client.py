@@ -12,6 +12,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from unittest import mock
+
+import fixtures
+
 from tempest.lib.services.volume.v3 import snapshots_client
 from tempest.tests.lib import fake_auth_provider
 from tempest.tests.lib.services import base
@@ -244,3 +248,13 @@ class TestSnapshotsClient(base.BaseServiceTest):
             {},
             snapshot_id="521752a6-acf6-4b2d-bc7a-119f9148cd8c",
             status=202)
+
+    @mock.patch.object(snapshots_client.SnapshotsClient,
+                       'is_resource_deleted', return_value=True)
+    def test_deleted_resources(self, is_resource_deleted):
+        self.useFixture(fixtures.MockPatchObject(
+            self.client, 'list_snapshots',
+            return_value={'snapshots': [{'id': 'snap1'}]}))
+        self.assertEqual({'snap2'},
+                         self.client.deleted_resources(['snap1', 'snap2']))
+        is_resource_deleted.assert_called_once_with('snap2')
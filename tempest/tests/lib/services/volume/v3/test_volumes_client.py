@@ -13,8 +13,12 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from unittest import mock
+
+import fixtures
 from oslo_serialization import jsonutils as json
 
+from tempest.lib import exceptions as lib_exc
 from tempest.lib.services.volume.v3 import volumes_client
 from tempest.tests.lib import fake_auth_provider
 from tempest.tests.lib.services import base
@@ -139,3 +143,32 @@ class TestVolumesClient(base.BaseServiceTest):
 
     def test_show_volume_summary_with_bytes_body(self):
         self._test_show_volume_summary(bytes_body=True)
+
+    @mock.patch.object(volumes_client.VolumesClient, 'is_resource_deleted',
+                       return_value=True)
+    def test_deleted_resources(self, is_resource_deleted):
+        self.useFixture(fixtures.MockPatchObject(
+            self.client, 'list_volumes', return_value={'volumes': [
+                {'id': 'vol1', 'status': 'deleting'}]}))
+        self.assertEqual({'vol2'},
+                         self.client.deleted_resources(['vol1', 'vol2']))
+        self.client.list_volumes.assert_called_once_with(detail=True)
+        # Only the volumes missing from the list are checked one by one
+        is_resource_deleted.assert_called_once_with('vol2')
+
+    def test_deleted_resources_error_deleting(self):
+        self.useFixture(fixtures.MockPatchObject(
+            self.client, 'list_volumes', return_value={'volumes': [
+                {'id': 'vol1', 'status': 'error_deleting'}]}))
+        self.assertRaises(lib_exc.DeleteErrorException,
+                          self.client.deleted_resources, ['vol1'])
+
+    @mock.patch.object(volumes_client.VolumesClient, 'is_resource_deleted',
+                       side_effect=[True, False])
+    def test_deleted_resources_paginated(self, is_resource_deleted):
+        self.useFixture(fixtures.MockPatchObject(
+            self.client, 'list_volumes', return_value={
+                'volumes': [], 'volumes_links': [{'rel': 'next'}]}))
+        self.assertEqual({'vol1'},
+                         self.client.deleted_resources(['vol1', 'vol2']))
+        self.assertEqual(2, is_resource_deleted.call_count)
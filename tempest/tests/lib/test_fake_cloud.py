@@ -0,0 +1,167 @@
+# Copyright 2026 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import io
+import json
+import time
+
+from tempest.lib import auth
+from tempest.lib import exceptions
+from tempest.lib.services.compute import keypairs_client
+from tempest.lib.services.compute import servers_client
+from tempest.lib.services.image.v2 import images_client
+from tempest.lib.services.network import ports_client
+from tempest.lib.services.object_storage import container_client
+from tempest.lib.services.object_storage import object_client
+from tempest.lib.services.volume.v3 import volumes_client
+from tempest.tests import base
+from tempest.tests.lib import fake_cloud
+
+
+class TestFakeCloud(base.TestCase):
+
+    def setUp(self):
+        super(TestFakeCloud, self).setUp()
+        self.cloud = fake_cloud.FakeCloud(delays={'volume': 0.05})
+        self.fixture = self.useFixture(fake_cloud.FakeCloudFixture(
+            self.cloud))
+        self.auth_provider = auth.KeystoneV3AuthProvider(
+            self.fixture.get_credentials(), self.fixture.identity_uri)
+
+    def _client(self, client_class, service):
+        return client_class(self.auth_provider, service, 'RegionOne',
+                            build_interval=0.01, build_timeout=5)
+
+    def _token(self):
+        _, headers, _ = self.cloud.handle(
+            'POST', '/identity/v3/auth/tokens',
+            {'Content-Type': 'application/json'},
+            json.dumps({'auth': {
+                'identity': {'methods': ['password'], 'password': {
+                    'user': {'name': 'admin', 'password': 'secret'}}},
+                'scope': {'project': {'name': 'admin'}}}}).encode())
+        return headers['X-Subject-Token']
+
+    def test_server_lifecycle(self):
+        client = self._client(servers_client.ServersClient, 'compute')
+        server = client.create_server(name='fake', imageRef='image',
+                                      flavorRef='1')['server']
+        server = client.show_server(server['id'])['server']
+        self.assertEqual('ACTIVE', server['status'])
+        self.assertEqual(self.auth_provider.credentials.user_id,
+                         server['user_id'])
+        self.assertEqual([server['id']],
+                         [s['id'] for s in client.list_servers()['servers']])
+        client.delete_server(server['id'])
+        self.assertRaises(exceptions.NotFound, client.show_server,
+                          server['id'])
+        self.assertEqual([], client.list_servers(detail=True)['servers'])
+
+    def test_volume_transitions(self):
+        client = self._client(volumes_client.VolumesClient, 'volumev3')
+        volume = client.create_volume(size=1)['volume']
+        self.assertEqual('creating', volume['status'])
+        time.sleep(0.05)
+        volume = client.show_volume(volume['id'])['volume']
+        self.assertEqual('available', volume['status'])
+        client.delete_volume(volume['id'])
+        volume = client.show_volume(volume['id'])['volume']
+        self.assertEqual('deleting', volume['status'])
+        client.wait_for_resource_deletion(volume['id'])
+
+    def test_bulk_create_and_filters(self):
+        client = self._client(ports_client.PortsClient, 'network')
+        ports = client.create_bulk_ports(ports=[
+            {'network_id': 'net1', 'name': 'port1'},
+            {'network_id': 'net2', 'name': 'port2'}])['ports']
+        self.assertEqual(2, len(ports))
+        listed = client.list_ports(network_id='net2')['ports']
+        self.assertEqual(['port2'], [port['name'] for port in listed])
+
+    def test_image_and_object_data(self):
+        images = self._client(images_client.ImagesClient, 'image')
+        image = images.create_image(name='fake', disk_format='raw',
+                                    container_format='bare')
+        images.store_image_file(image['id'], io.BytesIO(b'image data'))
+        image = images.show_image(image['id'])
+        self.assertEqual('active', image['status'])
+        self.assertEqual(10, image['size'])
+        self.assertEqual(b'image data',
+                         images.show_image_file(image['id']).data)
+
+        containers = self._client(container_client.ContainerClient,
+                                  'object-store')
+        objects = self._client(object_client.ObjectClient, 'object-store')
+        containers.create_container('container')
+        objects.create_object('container', 'object', b'{"object": 1}')
+        _, data = objects.get_object('container', 'object')
+        self.assertEqual(b'{"object": 1}', data)
+        _, listing = containers.list_container_objects(
+            'container', params={'format': 'json'})
+        self.assertEqual(['object'], [item['name'] for item in listing])
+        self.assertRaises(exceptions.Conflict,
+                          containers.delete_container, 'container')
+
+    def test_keypairs_are_validated(self):
+        client = self._client(keypairs_client.KeyPairsClient, 'compute')
+        client.create_keypair(name='key')
+        self.assertEqual('key', client.show_keypair('key')['keypair']['name'])
+        self.assertRaises(exceptions.Conflict,
+                          client.create_keypair, name='key')
+
+    def test_faults_and_latency(self):
+        self.cloud.faults.append(fake_cloud.Fault(
+            '/servers$', status=409, method='POST', count=1))
+        self.cloud.latency = {'compute': 0.02}
+        client = self._client(servers_client.ServersClient, 'compute')
+        start = time.monotonic()
+        self.assertRaises(exceptions.Conflict, client.create_server,
+                          name='fake', imageRef='image', flavorRef='1')
+        self.assertGreaterEqual(time.monotonic() - start, 0.02)
+        client.create_server(name='fake', imageRef='image', flavorRef='1')
+        self.assertEqual(2, self.cloud.requests[('POST', 'compute')])
+
+    def test_invalid_response(self):
+        token = self._token()
+        # A server with none of the required attributes
+        self.cloud._store('server', {'id': 'broken'})
+        status, _, body = self.cloud.handle(
+            'GET', '/compute/v2.1/servers/broken', {'X-Auth-Token': token},
+            b'')
+        self.assertEqual(500, status)
+        self.assertIn(b'Invalid simulated response', body)
+
+    def test_bad_request(self):
+        headers = {'Content-Type': 'application/json',
+                   'X-Auth-Token': self._token()}
+        for body in (b'not json', b'{}'):
+            status, resp_headers, resp_body = self.cloud.handle(
+                'POST', '/compute/v2.1/servers', headers, body)
+            self.assertEqual(400, status)
+            self.assertEqual('application/json',
+                             resp_headers['Content-Type'])
+            self.assertEqual(400, json.loads(resp_body)['error']['code'])
+
+    def test_bad_request_over_http(self):
+        client = self._client(servers_client.ServersClient, 'compute')
+        self.assertRaises(exceptions.BadRequest, client.post, 'servers',
+                          'not json')
+        # The simulator keeps serving requests
+        self.assertEqual([], client.list_servers()['servers'])
+
+    def test_unauthenticated(self):
+        status, _, _ = self.cloud.handle(
+            'GET', '/compute/v2.1/servers', {}, b'')
+        self.assertEqual(401, status)
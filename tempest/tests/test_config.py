@@ -12,6 +12,12 @@
 # License for the specific language governing permissions and limitations under
 # the License.
 
+import os
+import pickle
+from unittest import mock
+
+import fixtures
+from oslo_config import cfg
 import testtools
 
 from tempest import config
@@ -87,3 +93,85 @@ class TestServiceClientConfig(base.TestCase):
         with testtools.ExpectedException(exceptions.UnknownServiceClient,
                                          '.*' + unknown_service + '.*'):
             config.service_client_config(service_client_name=unknown_service)
+
+
+class TestConfigSnapshot(base.TestCase):
+
+    def setUp(self):
+        super(TestConfigSnapshot, self).setUp()
+        self.useFixture(fake_config.ServiceClientsConfigFixture())
+        self.private = fake_config.ServiceClientsFakePrivate()
+        self.snapshot = config.TempestConfigSnapshot.from_config(self.private)
+
+    def test_snapshot_values(self):
+        self.assertEqual(88, self.snapshot.compute.build_interval)
+        self.assertEqual(self.private.compute_feature_enabled.resize,
+                         self.snapshot.compute_feature_enabled.resize)
+        self.assertIs(self.snapshot['compute-feature-enabled'],
+                      self.snapshot.compute_feature_enabled)
+        self.assertEqual(99, self.snapshot.fake_service1.build_timeout)
+        self.assertEqual(self.private.pause_teardown,
+                         self.snapshot.pause_teardown)
+        self.assertIn('build_interval', self.snapshot.compute)
+
+    def test_snapshot_is_frozen(self):
+        self.assertRaises(AttributeError, setattr, self.snapshot.compute,
+                          'build_interval', 1)
+        self.assertRaises(AttributeError, setattr, self.snapshot,
+                          'compute', None)
+        self.assertRaises(cfg.NoSuchOptError, getattr,
+                          self.snapshot.compute, 'fake_option')
+        self.assertFalse(hasattr(self.snapshot, 'fake_group'))
+        # The snapshot holds copies of the values
+        self.useFixture(fixtures.MockPatchObject(
+            self.private.compute, 'build_interval', 1))
+        self.assertEqual(88, self.snapshot.compute.build_interval)
+
+    def test_save_and_load(self):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                            'snapshot.json')
+        self.snapshot.save(path)
+        loaded = config.TempestConfigSnapshot.load(path)
+        self.assertEqual(self.snapshot.compute.to_dict(),
+                         loaded.compute.to_dict())
+        self.assertEqual(
+            self.snapshot.compute_feature_enabled.to_dict(),
+            loaded.compute_feature_enabled.to_dict())
+        unpickled = pickle.loads(pickle.dumps(loaded))
+        self.assertEqual(88, unpickled.compute.build_interval)
+
+    def test_load_unsupported_version(self):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                            'snapshot.json')
+        with open(path, 'w') as f:
+            f.write('{"version": 0}')
+        self.assertRaises(exceptions.InvalidConfiguration,
+                          config.TempestConfigSnapshot.load, path)
+
+    def test_proxy_freeze(self):
+        proxy = config.TempestConfigProxy()
+        proxy._config = self.private
+        snapshot = proxy.freeze()
+        self.assertIsInstance(snapshot, config.TempestConfigSnapshot)
+        self.assertIs(snapshot, proxy.freeze())
+        # Groups are instance attributes of the proxy
+        self.assertIs(snapshot.compute, vars(proxy)['compute'])
+        self.assertEqual(88, proxy.compute.build_interval)
+        self.assertEqual(self.private.fake_service2.catalog_type,
+                         proxy.fake_service2.catalog_type)
+
+    @mock.patch.object(config, '_register_tempest_service_clients')
+    @mock.patch.object(config.TempestConfigSnapshot, 'register')
+    def test_proxy_load_snapshot(self, register, register_clients):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                            'snapshot.json')
+        self.snapshot.save(path)
+        self.useFixture(fixtures.EnvironmentVariable(
+            config.CONFIG_SNAPSHOT_ENV, path))
+        self.useFixture(fixtures.MockPatch(
+            'tempest.test_discover.plugins.TempestTestPluginManager'))
+        proxy = config.TempestConfigProxy()
+        self.assertEqual(88, proxy.compute.build_interval)
+        self.assertIsInstance(proxy._config, config.TempestConfigSnapshot)
+        register.assert_called_once_with()
+        register_clients.assert_called_once_with()
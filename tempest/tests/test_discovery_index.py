@@ -0,0 +1,180 @@
+# Copyright 2026 OpenStack Foundation
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import shutil
+import tempfile
+import textwrap
+from unittest import mock
+
+from tempest.test_discover import index
+from tempest.tests import base
+
+BASE_MODULE = """
+from tempest import test
+
+
+class BaseFakeTest(test.BaseTestCase):
+    pass
+
+
+class FakeMixin(object):
+    def test_mixin(self):
+        pass
+"""
+
+TEST_MODULE = """
+from tempest.common import utils
+from tempest.lib import decorators
+from . import base
+
+
+class FakeTest(base.BaseFakeTest):
+
+    @decorators.attr(type='smoke')
+    @decorators.idempotent_id('f3b4d5a4-5b39-4d4f-a4d6-8e2b3b1c0d01')
+    def test_one(self):
+        pass
+
+    @utils.services('compute', 'network')
+    @decorators.attr(type=['slow', 'multinode'], condition=CONF.multinode)
+    def test_two(self):
+        pass
+
+    def helper(self):
+        pass
+
+
+class FakeChildTest(FakeTest, base.FakeMixin):
+
+    def test_two(self):
+        pass
+"""
+
+
+class TestDiscoveryIndex(base.TestCase):
+
+    def setUp(self):
+        super(TestDiscoveryIndex, self).setUp()
+        self.top_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.top_dir, ignore_errors=True)
+        self.test_dir = os.path.join(self.top_dir, 'fake', 'api')
+        self._write('fake/__init__.py', '')
+        self._write('fake/api/__init__.py', '')
+        self._write('fake/api/base.py', BASE_MODULE)
+        self._write('fake/api/test_fake.py', TEST_MODULE)
+        self.index_path = os.path.join(self.top_dir, 'index.json')
+
+    def _write(self, path, content):
+        path = os.path.join(self.top_dir, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(textwrap.dedent(content))
+        return path
+
+    def _load(self):
+        return index.load_index(self.index_path,
+                                [(self.test_dir, self.top_dir)])
+
+    def test_test_ids(self):
+        expected = [
+            'fake.api.test_fake.FakeChildTest.test_mixin',
+            'fake.api.test_fake.FakeChildTest.test_one'
+            '[id-f3b4d5a4-5b39-4d4f-a4d6-8e2b3b1c0d01,smoke]',
+            'fake.api.test_fake.FakeChildTest.test_two',
+            'fake.api.test_fake.FakeTest.test_one'
+            '[id-f3b4d5a4-5b39-4d4f-a4d6-8e2b3b1c0d01,smoke]',
+            'fake.api.test_fake.FakeTest.test_two[compute,network]',
+        ]
+        self.assertEqual(expected, self._load().test_ids())
+
+    def test_skip_non_package_and_dynamic_modules(self):
+        self._write('fake/api/scripts/test_script.py', TEST_MODULE)
+        self._write('fake/api/test_scenarios.py', """
+            from tempest import test
+
+
+            def load_tests(loader, suite, pattern):
+                return suite
+
+
+            class ScenarioTest(test.BaseTestCase):
+                def test_scenario(self):
+                    pass
+            """)
+        discovery_index = self._load()
+        self.assertEqual(['fake.api.test_scenarios'],
+                         discovery_index.dynamic_modules())
+        self.assertIn('fake.api.test_scenarios.ScenarioTest.test_scenario',
+                      discovery_index.test_ids())
+        self.assertFalse([test_id for test_id in discovery_index.test_ids()
+                          if 'scripts' in test_id])
+
+    def test_cached_index(self):
+        self.assertEqual(3, self._load().changed)
+        self.assertTrue(os.path.isfile(self.index_path))
+        with mock.patch.object(index, 'scan_module') as scan_module:
+            discovery_index = self._load()
+        scan_module.assert_not_called()
+        self.assertEqual(0, discovery_index.changed)
+        self.assertEqual(5, len(discovery_index.test_ids()))
+
+    def test_touched_file_is_not_parsed(self):
+        self._load()
+        path = os.path.join(self.test_dir, 'test_fake.py')
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        with mock.patch.object(index, 'scan_module') as scan_module:
+            discovery_index = self._load()
+        scan_module.assert_not_called()
+        self.assertEqual(1, discovery_index.changed)
+        self.assertEqual(5, len(discovery_index.test_ids()))
+
+    def test_modified_and_removed_files(self):
+        self._load()
+        self._write('fake/api/test_fake.py', """
+            from tempest import test
+
+
+            class OtherTest(test.BaseTestCase):
+                def test_other(self):
+                    pass
+            """)
+        self.assertEqual(['fake.api.test_fake.OtherTest.test_other'],
+                         self._load().test_ids())
+        os.remove(os.path.join(self.test_dir, 'test_fake.py'))
+        self.assertEqual([], self._load().test_ids())
+
+    def test_filter(self):
+        discovery_index = self._load()
+        self.assertEqual(
+            ['fake.api.test_fake.FakeChildTest.test_one'
+             '[id-f3b4d5a4-5b39-4d4f-a4d6-8e2b3b1c0d01,smoke]',
+             'fake.api.test_fake.FakeTest.test_one'
+             '[id-f3b4d5a4-5b39-4d4f-a4d6-8e2b3b1c0d01,smoke]'],
+            discovery_index.filter(['smoke']))
+        self.assertEqual(
+            ['fake.api.test_fake.FakeTest.test_one'
+             '[id-f3b4d5a4-5b39-4d4f-a4d6-8e2b3b1c0d01,smoke]',
+             'fake.api.test_fake.FakeTest.test_two[compute,network]'],
+            discovery_index.filter(exclude_regex='FakeChildTest'))
+
+    def test_partition_keeps_classes_together(self):
+        test_ids = self._load().test_ids()
+        partitions = index.DiscoveryIndex.partition(test_ids, 2)
+        self.assertEqual(2, len(partitions))
+        self.assertEqual(sorted(test_ids), sorted(sum(partitions, [])))
+        for partition in partitions:
+            self.assertEqual(1, len({test_id.split('.test_')[0]
+                                     for test_id in partition}))
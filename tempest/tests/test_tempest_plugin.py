@@ -13,6 +13,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from unittest import mock
+
 from tempest.lib.services import clients
 from tempest.test_discover import plugins
 from tempest.tests import base
@@ -84,3 +86,27 @@ class TestPluginDiscovery(base.TestCase):
         manager._register_service_clients()
         registered_clients = registry.get_service_clients()
         self.assertNotIn(fake_obj.name, registered_clients)
+
+    @mock.patch('stevedore.ExtensionManager')
+    def test_plugins_loaded_once(self, mock_manager):
+        manager = type(plugins.TempestTestPluginManager())()
+        self.assertEqual(mock_manager.return_value, manager.ext_plugins)
+        self.assertEqual(mock_manager.return_value, manager.ext_plugins)
+        mock_manager.assert_called_once_with(
+            'tempest.test_plugins', invoke_on_load=True,
+            propagate_map_exceptions=True,
+            on_load_failure_callback=manager.failure_hook)
+
+    def test_get_plugin_options_list_memoized(self):
+        manager = plugins.TempestTestPluginManager()
+        fake_obj = fake_plugin.FakeStevedoreObj()
+        manager.ext_plugins = [fake_obj]
+        with mock.patch.object(fake_obj.obj, 'get_opt_lists',
+                               return_value=[('fake-group', [])]) as m:
+            self.assertEqual([('fake-group', [])],
+                             manager.get_plugin_options_list())
+            self.assertEqual([('fake-group', [])],
+                             manager.get_plugin_options_list())
+        m.assert_called_once_with()
+        manager.ext_plugins = [fake_obj]
+        self.assertEqual([], manager.get_plugin_options_list())
@@ -14,6 +14,7 @@
 #    under the License.
 
 import os
+import threading
 import unittest
 from unittest import mock
 
@@ -23,6 +24,7 @@ import testtools
 
 from tempest import clients
 from tempest import config
+from tempest.lib.common import cassette
 from tempest.lib.common import validation_resources as vr
 from tempest.lib import decorators
 from tempest.lib import exceptions as lib_exc
@@ -85,6 +87,7 @@ class TestValidationResources(base.TestCase):
                 autospec=True)
     def test_validation_resources_new(self, mock_create_vr):
         cfg.CONF.set_default('run_validation', True, 'validation')
+        cfg.CONF.set_default('concurrent_provisioning', True, 'validation')
         cfg.CONF.set_default('neutron', True, 'service_available')
         creds = fake_credentials.FakeKeystoneV3Credentials()
         osclients = clients.Manager(creds)
@@ -99,6 +102,7 @@ class TestValidationResources(base.TestCase):
             self.assertEqual(mock.call(vr.clear_validation_resources,
                                        osclients,
                                        use_neutron=True,
+                                       concurrent=True,
                                        **expected_vr),
                              mock_add_class_cleanup.call_args)
         self.assertEqual(mock_create_vr.call_count, 1)
@@ -274,6 +278,28 @@ class TestTempestBaseTestClass(base.TestCase):
         # Cleanup stack is empty
         self.assertEqual(0, len(test_cleanups._class_cleanups))
 
+    def test_cassette_per_class(self):
+        cfg.CONF.set_default('neutron', False, 'service_available')
+        cfg.CONF.set_default('cassette_mode', 'replay', 'debug')
+        cfg.CONF.set_default('cassette_dir', '/cassettes', 'debug')
+        enable = self.patchobject(cassette, 'enable')
+        disable = self.patchobject(cassette, 'disable')
+
+        class TestWithCassette(self.parent_test):
+
+            @classmethod
+            def resource_setup(cls):
+                enable.assert_called_once_with(
+                    '/cassettes/%s.TestWithCassette' % __name__, 'replay',
+                    latency=0.0)
+                disable.assert_not_called()
+
+        log = []
+        unittest.TestSuite((TestWithCassette(),)).run(
+            LoggingTestResult(log))
+        self.assertFalse(log)
+        disable.assert_called_once_with()
+
     def test_resource_cleanup_failures(self):
         cfg.CONF.set_default('neutron', False, 'service_available')
         exp_args = (1, 2,)
@@ -314,6 +340,148 @@ class TestTempestBaseTestClass(base.TestCase):
         # Cleanup stack is empty
         self.assertEqual(0, len(test_cleanups._class_cleanups))
 
+    def test_concurrent_resource_cleanup(self):
+        cfg.CONF.set_default('neutron', False, 'service_available')
+        calls = []
+        barrier = threading.Barrier(3, timeout=10)
+
+        def concurrent_cleanup(name):
+            # All the cleanups of the step must be running at the same time
+            barrier.wait()
+            calls.append(name)
+
+        class TestWithConcurrentCleanups(self.parent_test):
+
+            @classmethod
+            def resource_setup(cls):
+                cls.addClassResourceCleanup(calls.append, 'network')
+                for name in ('server1', 'server2', 'server3'):
+                    cls.addConcurrentClassResourceCleanup(
+                        'servers', concurrent_cleanup, name)
+                cls.addClassResourceCleanup(calls.append, 'port')
+
+        test_cleanups = TestWithConcurrentCleanups()
+        suite = unittest.TestSuite((test_cleanups,))
+        log = []
+        result = LoggingTestResult(log)
+        suite.run(result)
+        self.assertFalse(log)
+        # LIFO order is kept between the steps
+        self.assertEqual('port', calls[0])
+        self.assertEqual(['server1', 'server2', 'server3'],
+                         sorted(calls[1:4]))
+        self.assertEqual('network', calls[4])
+        self.assertEqual(0, len(test_cleanups._class_cleanups))
+
+    def test_concurrent_resource_cleanup_failures(self):
+        cfg.CONF.set_default('neutron', False, 'service_available')
+        mock1 = mock.Mock(side_effect=Exception('mock1 cleanup failure'))
+        mock2 = mock.Mock()
+        mock3 = mock.Mock(side_effect=Exception('mock3 cleanup failure'))
+        mock4 = mock.Mock()
+
+        class TestWithFailingCleanups(self.parent_test):
+
+            @classmethod
+            def resource_setup(cls):
+                cls.addClassResourceCleanup(mock4)
+                for fn in (mock1, mock2, mock3):
+                    cls.addConcurrentClassResourceCleanup('volumes', fn, 1)
+
+        test_cleanups = TestWithFailingCleanups()
+        suite = unittest.TestSuite((test_cleanups,))
+        log = []
+        result = LoggingTestResult(log)
+        suite.run(result)
+        self.assertEqual(1, len(log))
+        found_exc = log[0][1][1]
+        self.assertIsInstance(found_exc, testtools.MultipleExceptions)
+        self.assertEqual(1, len(found_exc.args))
+        step_exc = found_exc.args[0][1]
+        self.assertIsInstance(step_exc, testtools.MultipleExceptions)
+        self.assertIn('mock1 cleanup', str(step_exc.args[0][1]))
+        self.assertIn('mock3 cleanup', str(step_exc.args[1][1]))
+        for fn in (mock1, mock2, mock3):
+            fn.assert_called_once_with(1)
+        mock4.assert_called_once_with()
+
+    def _patch_deletion_tracker(self, calls, drain_error=None):
+        tracker = mock.Mock(ids=[])
+
+        def track(client, resource_id):
+            calls.append('track %s' % resource_id)
+            tracker.ids.append(resource_id)
+
+        def drain():
+            calls.append('drain %s' % ' '.join(sorted(tracker.ids)))
+            tracker.ids = []
+            if drain_error:
+                raise drain_error
+
+        tracker.track.side_effect = track
+        tracker.pending.side_effect = lambda: list(tracker.ids)
+        tracker.drain.side_effect = drain
+        self.patchobject(test.deletion_tracker, 'DeletionTracker',
+                         return_value=tracker)
+
+    def test_resource_cleanup_deletion_waits(self):
+        cfg.CONF.set_default('neutron', False, 'service_available')
+        calls = []
+        self._patch_deletion_tracker(calls)
+        client = mock.sentinel.client
+
+        class TestWithDeletionWaits(self.parent_test):
+
+            @classmethod
+            def resource_setup(cls):
+                cls.addClassResourceCleanup(calls.append, 'network')
+                for name in ('server1', 'server2'):
+                    cls.addClassResourceDeletionWait(client, name)
+                for name in ('server1', 'server2'):
+                    cls.addClassResourceCleanup(calls.append,
+                                                'delete %s' % name)
+                cls.addClassResourceDeletionWait(client, 'volume')
+
+        test_cleanups = TestWithDeletionWaits()
+        suite = unittest.TestSuite((test_cleanups,))
+        log = []
+        suite.run(LoggingTestResult(log))
+        self.assertFalse(log)
+        # The consecutive waits are drained together before the next
+        # cleanup is called
+        self.assertEqual(['track volume', 'drain volume',
+                          'delete server2', 'delete server1',
+                          'track server2', 'track server1',
+                          'drain server1 server2', 'network'], calls)
+        self.assertEqual(0, len(test_cleanups._class_cleanups))
+
+    def test_resource_cleanup_deletion_wait_failure(self):
+        cfg.CONF.set_default('neutron', False, 'service_available')
+        calls = []
+        self._patch_deletion_tracker(
+            calls, drain_error=lib_exc.DeleteErrorException('server1'))
+
+        class TestWithDeletionWaits(self.parent_test):
+
+            @classmethod
+            def resource_setup(cls):
+                cls.addClassResourceCleanup(calls.append, 'network')
+                cls.addClassResourceDeletionWait(mock.sentinel.client,
+                                                 'server1')
+
+        test_cleanups = TestWithDeletionWaits()
+        suite = unittest.TestSuite((test_cleanups,))
+        log = []
+        suite.run(LoggingTestResult(log))
+        self.assertEqual(1, len(log))
+        found_exc = log[0][1][1]
+        self.assertIsInstance(found_exc, testtools.MultipleExceptions)
+        self.assertIsInstance(found_exc.args[0][1],
+                              lib_exc.DeleteErrorException)
+        # The next cleanups are called anyway
+        self.assertEqual(['track server1', 'drain server1', 'network'],
+                         calls)
+
     def test_super_resource_cleanup_not_invoked(self):
 
         class BadResourceCleanup(self.parent_test):